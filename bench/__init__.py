@@ -0,0 +1,66 @@
+"""
+Benchmarks for the modules in 'phns/', each runnable as a module, e.g.:
+python3 -m bench.bench_utility
+or together via 'bench/__main__.py', recording the results to JSON
+and comparing them with those of a baseline run, e.g.:
+python3 -m bench --save after.json --baseline before.json
+"""
+
+
+from json import dump, load
+from timeit import Timer
+from typing import Callable, Dict, List, Tuple, Any
+
+
+# bench values
+
+results: Dict[str, float] = {}
+
+
+# bench functions
+
+def measure(fn: Callable[[], Any], number: int = 10, repeat: int = 5) -> float:
+    """
+    Returns the lowest mean time in seconds for one call to 'fn'
+    across 'repeat' timings of 'number' calls each.
+    """
+    return min(Timer(fn).repeat(repeat=repeat, number=number)) / number
+
+def report(name: str, seconds: float) -> None:
+    """
+    Prints 'name' and 'seconds' formatted in microseconds
+    and records 'seconds' in results by 'name'.
+    """
+    results[name] = seconds
+    print(f'{name:<48} {seconds * 1e6:>14.2f} us')
+
+
+# results functions
+
+def save(path: str, meta: Dict[str, Any]) -> None:
+    """
+    Writes to 'path' as JSON the results recorded, in seconds by name,
+    alongside 'meta', e.g. the interpreter version.
+    """
+    with open(path, 'w') as file:
+        dump({'meta': meta, 'results': results}, file, indent=2, sort_keys=True)
+
+def restore(path: str) -> Dict[str, float]:
+    """
+    Returns the results in seconds by name read from the JSON at 'path'.
+    """
+    with open(path) as file:
+        return load(file)['results']
+
+def compare(current: Dict[str, float], baseline: Dict[str, float],
+    threshold: float = 0.1) -> List[Tuple[str, float, float]]:
+    """
+    Returns a list of tuples for each result in 'current' slower than that
+    of the same name in 'baseline' by more than the fraction 'threshold',
+    each holding the name, baseline seconds and current seconds.
+
+    >>> compare({'a': 1.2, 'b': 1.0, 'c': 1.0}, {'a': 1.0, 'b': 1.0}, 0.1)
+    [('a', 1.0, 1.2)]
+    """
+    return [(name, baseline[name], seconds) for name, seconds in current.items()
+        if name in baseline and seconds > baseline[name] * (1 + threshold)]
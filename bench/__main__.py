@@ -0,0 +1,67 @@
+"""
+Runs the benchmarks for the modules in 'phns/', all by default or those
+named, optionally saving the results to JSON and comparing them with a
+baseline run, exiting with status 1 if any result is slower, e.g.:
+python3 -m bench primary factory --save after.json --baseline before.json
+"""
+
+
+import bench
+
+from argparse import ArgumentParser
+from importlib import import_module
+from inspect import getfullargspec
+from pkgutil import iter_modules
+from platform import python_implementation, python_version
+from typing import List
+
+
+# runner functions
+
+def get_names() -> List[str]:
+    """
+    Returns the names of the benchmark modules, without prefix.
+    """
+    return [module.name[len('bench_'):] for module in iter_modules(bench.__path__)
+        if module.name.startswith('bench_')]
+
+def main() -> int:
+    parser = ArgumentParser(prog='python3 -m bench', description='Runs the phns benchmarks.')
+    parser.add_argument('names', nargs='*',
+        help=f'benchmark modules to run, by default all, i.e. {", ".join(get_names())}')
+    parser.add_argument('--save', metavar='PATH', help='write the results to PATH as JSON')
+    parser.add_argument('--baseline', metavar='PATH', help='compare with the results at PATH')
+    parser.add_argument('--threshold', type=float, default=0.1,
+        help='fraction slower than the baseline flagged, by default 0.1')
+    parser.add_argument('--heavy', action='store_true',
+        help='include the largest workloads, e.g. arrays of 1e8 items, where a module has them')
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in get_names()]
+    if unknown:
+        parser.error(f'unknown benchmark module(s): {", ".join(unknown)}')
+
+    for name in args.names or get_names():
+        print(f'[bench_{name}]')
+        run = import_module(f'bench.bench_{name}').run
+        if args.heavy and 'heavy' in getfullargspec(run).args:
+            run(heavy=True)
+        else:
+            run()
+
+    if args.save:
+        bench.save(args.save, {
+            'python': f'{python_implementation()} {python_version()}',
+            'modules': args.names or get_names()
+        })
+    if args.baseline:
+        regressions = bench.compare(bench.results, bench.restore(args.baseline), args.threshold)
+        for name, before, after in regressions:
+            print(f'REGRESSION {name:<37} {before * 1e6:>10.2f} us -> {after * 1e6:>10.2f} us '
+                f'(+{(after / before - 1) * 100:.0f}%)')
+        print(f'{len(regressions)} regression(s) beyond {args.threshold * 100:.0f}%')
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
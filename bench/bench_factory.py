@@ -0,0 +1,50 @@
+"""
+Benchmarks for 'phns/factory.py', comparing calls to the phnew instance,
+with each shorthand compiled at registration, with calls to the builders
+and keyword dictionaries stored, and building in bulk via .many.
+"""
+
+
+from typing import Any
+
+from bench import measure, report
+from phns.factory import phnew
+
+
+# reference functions
+
+def phnew_uncompiled(id: str, value: Any) -> Any:
+    if id in phnew.builders:
+        return phnew.builders[id]['fn'](value, **phnew.builders[id]['kw'])
+    raise ValueError(id)
+
+
+# bench values
+
+values = {
+
+    'int': 1,
+    'list': [1, 2, 3],
+    'dict': {'a': 1}
+}
+
+
+# bench runs
+
+def run() -> None:
+
+    for id in ('f', 'f.', 'f{', 'pf', 'pf{'):
+        for name, value in values.items():
+            report(f'phnew {id} {name}', measure(lambda: phnew(id, value), 100000))
+            report(f'phnew {id} {name} (uncompiled)', measure(lambda: phnew_uncompiled(id, value), 100000))
+
+    for size in (1000, 100000):
+        items = [[i] for i in range(size)]
+        number = max(1, 100000 // size)
+        report(f'phnew.many f {size}', measure(lambda: phnew.many('f', items), number))
+        report(f'phnew f {size} (per call)', measure(lambda: [phnew('f', item) for item in items], number))
+        report(f'phnew f {size} (per call, uncompiled)', measure(lambda: [phnew_uncompiled('f', item) for item in items], number))
+
+
+if __name__ == '__main__':
+    run()
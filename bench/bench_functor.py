@@ -0,0 +1,222 @@
+"""
+Benchmarks for 'phns/functor.py', comparing plain and chained maps, eager
+and lazy, pooled maps, memory per instance with and without slots, array
+maps vectorized and item by item, translated byte and string maps, memoized
+maps, trampolined Monad chains and streamed applicative products with the
+same done naively, the sizes above 1e6 run only if passed '--heavy'.
+"""
+
+
+from hashlib import sha256
+from tracemalloc import start, stop, take_snapshot
+from array import array
+from typing import Any, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from os import cpu_count
+from sys import argv
+
+from bench import measure, report
+from phns.functor import Functor, FunctorIter, FunctorDict, FunctorArray,\
+    PFunctor, PFunctorIter, PFunctorDict, ApplicativeIter, Monad
+from phns.utility import get_const, numpy
+
+
+# reference classes
+
+class FunctorUnslotted():
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+class FunctorIterUnslotted():
+    def __init__(self, value: Any, const: Any = None, **kwargs) -> None:
+        self.value = value
+        self.const = get_const(value) if const is None else const
+        self.pairs = kwargs
+
+class FunctorDictUnslotted():
+    def __init__(self, value: Any, **kwargs) -> None:
+        self.value = value
+        self.pairs = kwargs
+
+class MonadRecursive():
+    def __init__(self, run: Callable[[], Any]) -> None:
+        self.run = run
+    @classmethod
+    def of(cls, value: Any) -> Any:
+        return cls(lambda: value)
+    def chain(self, handle: Callable) -> Any:
+        return MonadRecursive(lambda: handle(self.run()).run())
+
+
+# bench functions
+
+def measure_bytes(build: Callable[[], Any], number: int = 100000) -> float:
+    """
+    Returns the mean bytes allocated per instance for 'number' instances
+    returned by 'build' and held at once, per tracemalloc.
+    """
+    start()
+    before = take_snapshot()
+    held = [build() for _ in range(number)]
+    after = take_snapshot()
+    stop()
+    held_bytes = number * 8  # the list of references
+    return (sum(stat.size_diff for stat in after.compare_to(before, 'filename')) - held_bytes) / number
+
+
+# bench values
+
+apply = {
+
+    'incr_1': lambda x: x + 1
+}
+
+def hash_n(x: int) -> bytes:  # CPU-bound & picklable for process pools
+    digest = str(x).encode()
+    for _ in range(100):
+        digest = sha256(digest).digest()
+    return digest
+
+
+def digest(x: int) -> str:
+    return sha256(str(x).encode()).hexdigest()
+
+def reduce_map(monad: Any, size: int) -> Any:
+    for _ in range(size):
+        monad = monad.map(apply['incr_1'])
+    return monad
+
+
+# bench runs
+
+def run(heavy: bool = False) -> None:
+
+    value = [1]
+    for name, build in (
+        ('Functor', lambda: Functor(value)),
+        ('Functor (unslotted)', lambda: FunctorUnslotted(value)),
+        ('FunctorIter', lambda: FunctorIter(value, list)),
+        ('FunctorIter (unslotted)', lambda: FunctorIterUnslotted(value, list)),
+        ('FunctorIter as_tree', lambda: FunctorIter(value, list, as_tree=True)),
+        ('FunctorIter as_tree (unslotted)', lambda: FunctorIterUnslotted(value, list, as_tree=True)),
+        ('FunctorDict', lambda: FunctorDict(value)),
+        ('FunctorDict (unslotted)', lambda: FunctorDictUnslotted(value)),
+        ('PFunctor', lambda: PFunctor(value)),
+        ('PFunctorIter', lambda: PFunctorIter(value, list)),
+        ('PFunctorDict', lambda: PFunctorDict(value))):
+        print(f'{name + " instance":<48} {measure_bytes(build):>14.2f} B')
+
+    small = [1, 2, 3]
+    small_pairs = {'a': 1, 'b': 2}
+    report('FunctorIter map 3', measure(lambda: FunctorIter(small).map(apply['incr_1']), 100000))
+    report('FunctorDict map 2', measure(lambda: FunctorDict(small_pairs).map(apply['incr_1']), 100000))
+    report('PFunctorIter 3 maps 3', measure(lambda:
+        PFunctorIter.of(small).map(apply['incr_1']).map(apply['incr_1']).map(apply['incr_1']).value, 100000))
+    report('PFunctorDict 3 maps 2', measure(lambda:
+        PFunctorDict.of(small_pairs).map(apply['incr_1']).map(apply['incr_1']).map(apply['incr_1']).value, 100000))
+
+    for size in (1000, 100000, 1000000):
+        items = list(range(size))
+        pairs = dict.fromkeys(range(size), 0)
+        number = max(1, 1000000 // size)
+
+        def chain(pf):
+            for _ in range(5):
+                pf = pf.map(apply['incr_1'])
+            return pf.value
+
+        report(f'PFunctorIter 5 maps {size} (eager)', measure(lambda: chain(PFunctorIter.of(items)), number))
+        report(f'PFunctorIter 5 maps {size} (lazy)', measure(lambda: chain(PFunctorIter.of(items, lazy=True)), number))
+        report(f'PFunctorDict 5 maps {size} (eager)', measure(lambda: chain(PFunctorDict.of(pairs)), number))
+        report(f'PFunctorDict 5 maps {size} (lazy)', measure(lambda: chain(PFunctorDict.of(pairs, lazy=True)), number))
+
+    items = list(range(5000))
+    pairs = dict.fromkeys(range(5000), 0)
+    report('FunctorIter hash 5000 (serial)', measure(lambda: FunctorIter(items).map(hash_n), 1, 3))
+    report('FunctorDict hash 5000 (serial)', measure(lambda: FunctorDict(pairs).map(hash_n), 1, 3))
+    for workers in sorted({1, 2, 4, 8, cpu_count() or 1}):
+        for name, executor in (('threads', ThreadPoolExecutor), ('processes', ProcessPoolExecutor)):
+            with executor(workers) as pool:
+                report(f'FunctorIter hash 5000 ({name} {workers})',
+                    measure(lambda: FunctorIter(items).map(hash_n, workers=workers, executor=pool), 1, 3))
+                report(f'FunctorDict hash 5000 ({name} {workers})',
+                    measure(lambda: FunctorDict(pairs).map(hash_n, workers=workers, executor=pool), 1, 3))
+
+    for power in range(3, 9 if heavy else 7):
+        size = 10 ** power
+        number = max(1, 10 ** 6 // size)
+        values = array('i', range(size))
+        report(f'FunctorArray array.array 1e{power}', measure(lambda: FunctorArray(values).map(apply['incr_1']), number, 3))
+        if numpy is not None:
+            ndarray = numpy.arange(size, dtype='int32')
+            report(f'FunctorArray ndarray 1e{power}', measure(lambda: FunctorArray(ndarray).map(apply['incr_1']), number, 3))
+            report(f'FunctorArray ndarray 1e{power} (ufunc)', measure(lambda: FunctorArray(ndarray).map(numpy.negative), number, 3))
+            del ndarray
+        if power <= 6:
+            items = values.tolist()
+            report(f'FunctorIter list 1e{power} (item by item)', measure(lambda: FunctorIter(items).map(apply['incr_1']), number, 3))
+        del values
+
+    for power in range(3, 9 if heavy else 7):
+        size = 10 ** power
+        number = max(1, 10 ** 6 // size)
+        data = bytearray(range(256)) * (size // 256) + bytearray(size % 256)
+        texts = {'ASCII': 'phns x ' * (size // 7), 'non-ASCII': 'phns λ ' * (size // 7)}
+        flip = lambda x: x ^ 32
+        report(f'FunctorIter bytearray 1e{power} (translated)', measure(lambda: FunctorIter(data).map(flip), number, 3))
+        if power <= 6:
+            report(f'FunctorIter bytearray 1e{power} (item by item)', measure(lambda: bytearray(map(flip, data)), number, 3))
+        for name, text in texts.items():
+            report(f'FunctorIter str {name} 1e{power} (translated)', measure(lambda: FunctorIter(text).map(str.upper), number, 3))
+            if power <= 6:
+                report(f'FunctorIter str {name} 1e{power} (item by item)', measure(lambda: ''.join(map(str.upper, text)), number, 3))
+        del data, texts
+
+    for power in range(4, 7):
+        size = 10 ** power
+        number = max(1, 10 ** 5 // size)
+        items = [x % 1000 for x in range(size)]
+        pairs = dict(zip(range(size), items))
+        report(f'FunctorIter digest 1e{power} (uncached)', measure(lambda: FunctorIter(items).map(digest), number, 3))
+        report(f'FunctorIter digest 1e{power} (memo)', measure(lambda: FunctorIter(items).map(digest, memo=True), number, 3))
+        report(f'FunctorIter digest 1e{power} (memo 100)', measure(lambda: FunctorIter(items).map(digest, memo=100), number, 3))
+        report(f'FunctorDict digest 1e{power} (uncached)', measure(lambda: FunctorDict(pairs).map(digest), number, 3))
+        report(f'FunctorDict digest 1e{power} (memo)', measure(lambda: FunctorDict(pairs).map(digest, memo=True), number, 3))
+
+    def chain_left(const: Any, size: int) -> Any:
+        monad = const.of(0)
+        for _ in range(size):
+            monad = monad.chain(lambda x: const.of(x + 1))
+        return monad
+
+    def chain_right(const: Any, size: int) -> Any:
+        def nest(n: int) -> Callable:
+            return lambda x: const.of(x) if n == 0 else const.of(x + 1).chain(nest(n - 1))
+        return const.of(0).chain(nest(size))
+
+    for power in range(2, 7):
+        size = 10 ** power
+        number = max(1, 10 ** 4 // size)
+        for name, chain in (('left', chain_left), ('right', chain_right)):
+            report(f'Monad chain {name} 1e{power}', measure(lambda: chain(Monad, size).value, number, 3))
+            try:
+                report(f'Monad chain {name} 1e{power} (recursive)', measure(lambda: chain(MonadRecursive, size).run(), number, 3))
+            except RecursionError:
+                report(f'Monad chain {name} 1e{power} (recursive, overflowed)', float('nan'))
+        report(f'Monad map 1e{power}', measure(lambda: reduce_map(Monad.of(0), size).value, number, 3))
+
+    validators = [lambda x: x > 0, lambda x: x % 2 == 0, lambda x: x < 10 ** 9, lambda x: bool(x % 7)]
+    for power in range(3, 7):
+        size = 10 ** power
+        number = max(1, 10 ** 5 // size)
+        records = range(size)
+        report(f'ApplicativeIter ap 4 x 1e{power} (streamed)', measure(lambda:
+            sum(ApplicativeIter(validators).ap(ApplicativeIter(iter(records), list)).value), number, 3))
+        report(f'ApplicativeIter ap 4 x 1e{power} (materialised)', measure(lambda:
+            sum([fn(x) for fn in validators for x in list(records)]), number, 3))
+        report(f'ApplicativeIter lift2 1e{power} (zip)', measure(lambda:
+            sum(ApplicativeIter.lift2(min, ApplicativeIter(records), ApplicativeIter(records), as_zip=True).value), number, 3))
+
+
+if __name__ == '__main__':
+    run('--heavy' in argv)
@@ -0,0 +1,44 @@
+"""
+Benchmarks for 'phns/instrument.py', comparing maps and pipelines with
+no profiler active, i.e. the originals, with those while one is active.
+"""
+
+
+from bench import measure, report
+from phns.functor import FunctorIter, PFunctorDict
+from phns.instrument import profile
+from phns.primary import pipe
+
+
+# bench values
+
+apply = {
+
+    'incr_1': lambda x: x + 1
+}
+
+
+# bench runs
+
+def run() -> None:
+
+    incr_1 = apply['incr_1']
+    stages = pipe(incr_1, incr_1, incr_1)
+    for size in (10, 1000, 100000):
+        items = list(range(size))
+        pairs = {i: i for i in range(size)}
+        number = max(1, 100000 // size)
+        for state in ('disabled', 'enabled'):
+            profiler = profile()
+            if state == 'enabled':
+                profiler.enable()
+            try:
+                report(f'FunctorIter map {size} ({state})', measure(lambda: FunctorIter(items).map(incr_1), number))
+                report(f'PFunctorDict map {size} ({state})', measure(lambda: PFunctorDict(pairs).map(incr_1), number))
+                report(f'pipe 3 stages x {size} ({state})', measure(lambda: [stages(item) for item in items], number))
+            finally:
+                profiler.disable()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,89 @@
+"""
+Benchmarks for 'phns/primary.py', comparing the Curried instances returned
+by curry and curry_n and the pipelines returned by compose and pipe with
+the closures previously returned.
+"""
+
+
+from functools import reduce
+from inspect import getfullargspec
+from typing import Callable, Any
+
+from bench import measure, report
+from phns.primary import curry, curry_n, compose, pipe
+
+
+# reference functions
+
+def curry_n_closed(fn: Callable, n: int) -> Callable:
+    arity = n
+
+    def retain(*old_args, **old_kwargs):
+
+        def collect(*new_args, **new_kwargs):
+            args = (*old_args, *new_args)
+            kwargs = {**old_kwargs, **new_kwargs}
+            return fn(*args, **kwargs) if len(args) + len(kwargs) == arity\
+                else retain(*args, **kwargs)
+
+        return collect
+
+    return retain()
+
+def curry_closed(fn: Callable) -> Callable:
+    return curry_n_closed(fn, len(getfullargspec(fn).args))
+
+def compose_reduced(*fns: Callable) -> Callable:
+    return lambda *value: reduce(
+        lambda acc, fn: fn(acc),
+        list(reversed(fns))[1:] if len(fns) > 1 else [],
+        list(reversed(fns))[0](*value)
+    )
+
+def pipe_reduced(*fns: Callable) -> Callable:
+    return lambda *value: reduce(
+        lambda acc, fn: fn(acc),
+        fns[1:] if len(fns) > 1 else [],
+        fns[0](*value)
+    )
+
+
+# bench values
+
+apply = {
+
+    'incr_1': lambda x: x + 1,
+    'sum_3': lambda x, y, z: x + y + z
+}
+
+
+# bench runs
+
+def run() -> None:
+
+    sum_3 = apply['sum_3']
+    report('curry build', measure(lambda: curry(sum_3), 100000))
+    report('curry build (closed)', measure(lambda: curry_closed(sum_3), 100000))
+    for name, curried in (('curry', curry(sum_3)), ('curry (closed)', curry_closed(sum_3))):
+        report(f'{name} call saturated', measure(lambda: curried(1, 2, 3), 100000))
+        report(f'{name} call 2 + 1', measure(lambda: curried(1, 2)(3), 100000))
+        report(f'{name} call 1 + 1 + 1', measure(lambda: curried(1)(2)(3), 100000))
+        report(f'{name} call 1 + 2 keyword', measure(lambda: curried(1)(y=2, z=3), 100000))
+    for name, curried in (('curry_n', curry_n(sum_3, 3)), ('curry_n (closed)', curry_n_closed(sum_3, 3))):
+        report(f'{name} call saturated', measure(lambda: curried(1, 2, 3), 100000))
+
+    for length in (1, 5, 20):
+        fns = [apply['incr_1']] * length
+        for name, fn in (
+            ('compose', compose(*fns)), ('compose (reduced)', compose_reduced(*fns)),
+            ('pipe', pipe(*fns)), ('pipe (reduced)', pipe_reduced(*fns))):
+            report(f'{name} call {length} stages', measure(lambda: fn(1), 100000))
+
+    nested = pipe(*(pipe(apply['incr_1'], apply['incr_1']) for _ in range(5)))
+    nested_reduced = pipe_reduced(*(pipe_reduced(apply['incr_1'], apply['incr_1']) for _ in range(5)))
+    report('pipe call 5 x 2 stages nested', measure(lambda: nested(1), 100000))
+    report('pipe call 5 x 2 stages nested (reduced)', measure(lambda: nested_reduced(1), 100000))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,40 @@
+"""
+Benchmarks for 'phns/stream.py', comparing the streaming mapping of
+a JSON document with the document loaded, mapped and dumped in full.
+"""
+
+
+from io import StringIO
+from json import dumps, load, dump
+
+from bench import measure, report
+from phns.stream import map_json, get_tokens
+from phns.utility import traverse_mixed
+
+
+# bench values
+
+apply = {
+
+    'identity': lambda x: x
+}
+
+def get_document(width: int) -> str:
+    return dumps([{'id': i, 'name': f'user {i}', 'tags': ['a', 'b'], 'score': i * 1.5} for i in range(width)])
+
+
+# bench runs
+
+def run() -> None:
+
+    for width in (100, 10000):
+        document = get_document(width)
+        number = max(1, 10000 // width)
+        report(f'map_json {width} records', measure(lambda: map_json(apply['identity'], StringIO(document), StringIO()), number))
+        report(f'load traverse_mixed dump {width} records (full)', measure(lambda:
+            dump(traverse_mixed(apply['identity'], load(StringIO(document))), StringIO()), number))
+        report(f'get_tokens {width} records', measure(lambda: sum(1 for _ in get_tokens(StringIO(document))), number))
+
+
+if __name__ == '__main__':
+    run()
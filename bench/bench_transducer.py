@@ -0,0 +1,43 @@
+"""
+Benchmarks for 'phns/transducer.py', comparing a map, filter and take
+run in one pass via into with chained maps on a PFunctorIter instance,
+each step building an intermediate list, filtered and sliced thereafter.
+"""
+
+
+from bench import measure, report
+from phns.functor import PFunctorIter
+from phns.primary import compose
+from phns.transducer import mapping, filtering, taking, into
+
+
+# bench values
+
+apply = {
+
+    'incr_1': lambda x: x + 1,
+    'double': lambda x: x * 2,
+    'is_odd': lambda x: x % 2 == 1
+}
+
+
+# bench runs
+
+def run() -> None:
+
+    incr_1, double, is_odd = apply['incr_1'], apply['double'], apply['is_odd']
+    for size in (1000, 100000, 1000000):
+        items = list(range(size))
+        number = max(1, 100000 // size)
+        xf = compose(mapping(incr_1), mapping(double), filtering(is_odd))
+        report(f'into map map filter {size}', measure(lambda: into([], xf, items), number))
+        report(f'PFunctorIter map map filter {size} (chained)', measure(lambda:
+            [x for x in PFunctorIter(items).map(incr_1).map(double).value if is_odd(x)], number))
+        xf_taken = compose(mapping(incr_1), filtering(is_odd), taking(10))
+        report(f'into map filter take 10 of {size}', measure(lambda: into([], xf_taken, items), number))
+        report(f'PFunctorIter map filter take 10 of {size} (chained)', measure(lambda:
+            [x for x in PFunctorIter(items).map(incr_1).value if is_odd(x)][:10], number))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,169 @@
+"""
+Benchmarks for 'phns/utility.py', comparing the explicit-stack traversal
+functions with the recursive approach previously in place, and comparing
+incremental traversal of a tree with one value replaced with the same
+traversal in full, comparing traversal of DAGs mapping each shared
+container once with the same traversal treating each occurrence apart,
+comparing mapping in place with mapping to a new container, comparing mapping
+the values at selected paths with the same traversal in full, and
+comparing traversal of a tree pruned or limited in depth with the same
+traversal in full.
+"""
+
+
+from typing import Any
+
+from bench import measure, report
+from phns.utility import traverse_iter, traverse_dict, traverse_mixed, traverse_incremental,\
+    traverse_shared, traverse_in_place, traverse_selected, map_in_place, get_traversals
+
+
+# reference functions
+
+def traverse_iter_recursive(handle: Any, tree: Any, const: Any = list) -> Any:
+    return const(handle(node) if not isinstance(node, const)
+        else traverse_iter_recursive(handle, node, const) for node in tree)
+
+def traverse_dict_recursive(handle: Any, tree: Any) -> Any:
+    return dict((k, handle(v)) if not isinstance(v, dict)
+        else (k, traverse_dict_recursive(handle, v)) for k, v in tree.items())
+
+
+# bench values
+
+apply = {
+
+    'incr_1': lambda x: x + 1,
+    'lower':  lambda x: x.lower() if isinstance(x, str) else x
+}
+
+def get_wide_list(width: int) -> list:
+    return [[i, [i, i]] for i in range(width)]
+
+def get_wide_dict(width: int) -> dict:
+    return {i: {'a': i, 'b': {'c': i}} for i in range(width)}
+
+def get_deep_list(depth: int) -> list:
+    tree: list = [0]
+    for i in range(depth):
+        tree = [i, tree]
+    return tree
+
+def get_deep_dict(depth: int) -> dict:
+    tree: dict = {'a': 0}
+    for i in range(depth):
+        tree = {'a': i, 'b': tree}
+    return tree
+
+def get_bushy_dict(width: int, depth: int) -> dict:
+    tree: dict = dict.fromkeys(range(width), 0)
+    for _ in range(depth - 1):
+        tree = {i: {**tree} for i in range(width)}
+    return tree
+
+def replace_first(tree: dict, depth: int, value: Any) -> dict:
+    if depth == 1:
+        return {**tree, 0: value}
+    return {**tree, 0: replace_first(tree[0], depth - 1, value)}
+
+def get_dag_list(depth: int) -> list:
+    tree: list = [0]
+    for i in range(depth):
+        tree = [i, tree, tree]
+    return tree
+
+def get_dag_dict(depth: int) -> dict:
+    tree: dict = {'a': 0}
+    for i in range(depth):
+        tree = {'a': i, 'b': tree, 'c': tree}
+    return tree
+
+
+# bench runs
+
+def run() -> None:
+
+    for width in (10, 1000, 100000):
+        tree_list, tree_dict = get_wide_list(width), get_wide_dict(width)
+        number = max(1, 100000 // width)
+        report(f'traverse_iter wide {width} (stack)', measure(lambda: traverse_iter(apply['incr_1'], tree_list), number))
+        report(f'traverse_iter wide {width} (recursive)', measure(lambda: traverse_iter_recursive(apply['incr_1'], tree_list), number))
+        report(f'traverse_dict wide {width} (stack)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), number))
+        report(f'traverse_dict wide {width} (recursive)', measure(lambda: traverse_dict_recursive(apply['incr_1'], tree_dict), number))
+
+    # recursive reference limited by the default recursion limit
+
+    for depth in (10, 100, 300):
+        tree_list, tree_dict = get_deep_list(depth), get_deep_dict(depth)
+        report(f'traverse_iter deep {depth} (stack)', measure(lambda: traverse_iter(apply['incr_1'], tree_list), 100))
+        report(f'traverse_iter deep {depth} (recursive)', measure(lambda: traverse_iter_recursive(apply['incr_1'], tree_list), 100))
+        report(f'traverse_dict deep {depth} (stack)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), 100))
+        report(f'traverse_dict deep {depth} (recursive)', measure(lambda: traverse_dict_recursive(apply['incr_1'], tree_dict), 100))
+
+    for depth in (10000, 100000):
+        tree_list, tree_dict = get_deep_list(depth), get_deep_dict(depth)
+        report(f'traverse_iter deep {depth} (stack)', measure(lambda: traverse_iter(apply['incr_1'], tree_list), 1))
+        report(f'traverse_dict deep {depth} (stack)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), 1))
+
+    for depth in (3, 4, 5, 6):
+        tree_dict = get_bushy_dict(10, depth)
+        changes = [replace_first(tree_dict, depth, i) for i in range(2)]
+        handle = apply['incr_1']
+        traverse_incremental(handle, tree_dict)
+        index = iter(range(10 ** 9))
+        number = max(1, 10 ** 5 // 10 ** depth)
+        report(f'traverse_dict bushy 1e{depth} 1 changed (full)', measure(lambda: traverse_dict(handle, changes[next(index) % 2]), number))
+        report(f'traverse_incremental bushy 1e{depth} 1 changed', measure(lambda: traverse_incremental(handle, changes[next(index) % 2]), number))
+
+    # DAG of 'depth' levels each referring twice to the next, i.e. 2 ** depth paths
+
+    for depth in (5, 10, 15, 20):
+        tree_list, tree_dict = get_dag_list(depth), get_dag_dict(depth)
+        number = max(1, 2 ** 15 // 2 ** depth)
+        report(f'traverse_iter DAG {depth} (per occurrence)', measure(lambda: traverse_iter(apply['incr_1'], tree_list), number, 3))
+        report(f'traverse_shared DAG {depth} list', measure(lambda: traverse_shared(apply['incr_1'], tree_list), number, 3))
+        report(f'traverse_dict DAG {depth} (per occurrence)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), number, 3))
+        report(f'traverse_shared DAG {depth} dict', measure(lambda: traverse_shared(apply['incr_1'], tree_dict, get_traversals(dict)), number, 3))
+
+    for depth in (1000, 100000):
+        tree_list = get_dag_list(depth)
+        report(f'traverse_shared DAG {depth} list', measure(lambda: traverse_shared(apply['incr_1'], tree_list), 1, 3))
+
+    # values mapped in place grow by one per call, which leaves the work done unchanged
+
+    for width in (1000, 100000):
+        items, pairs = list(range(width)), dict.fromkeys(range(width), 0)
+        number = max(1, 100000 // width)
+        report(f'map list {width} (copy)', measure(lambda: list(map(apply['incr_1'], items)), number))
+        report(f'map_in_place list {width}', measure(lambda: map_in_place(apply['incr_1'], items), number))
+        report(f'map dict {width} (copy)', measure(lambda: {k: apply['incr_1'](v) for k, v in pairs.items()}, number))
+        report(f'map_in_place dict {width}', measure(lambda: map_in_place(apply['incr_1'], pairs), number))
+        tree_list, tree_dict = get_wide_list(width), get_wide_dict(width)
+        report(f'traverse_iter wide {width} (copy)', measure(lambda: traverse_iter(apply['incr_1'], tree_list), number))
+        report(f'traverse_in_place wide {width} list', measure(lambda: traverse_in_place(apply['incr_1'], tree_list, list), number))
+        report(f'traverse_dict wide {width} (copy)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), number))
+        report(f'traverse_in_place wide {width} dict', measure(lambda: traverse_in_place(apply['incr_1'], tree_dict, dict), number))
+
+    # users each with an email and a larger profile, the emails only selected
+
+    for width in (100, 10000):
+        tree_dict = {'users': [{'email': 'A', 'profile': get_wide_dict(10)} for _ in range(width)], 'meta': get_wide_dict(width)}
+        number = max(1, 10000 // width)
+        report(f'traverse_mixed users {width} (full)', measure(lambda: traverse_mixed(apply['lower'], tree_dict), number))
+        report(f'traverse_selected users {width} users.*.email', measure(lambda: traverse_selected(apply['lower'], tree_dict, 'users.*.email'), number))
+        report(f'traverse_selected users {width} meta.0.a', measure(lambda: traverse_selected(apply['incr_1'], tree_dict, 'meta.0.a'), number))
+
+    # bushy trees with each subtree but the first pruned, or descended to the second level only
+
+    for depth in (3, 5):
+        tree_dict = get_bushy_dict(10, depth)
+        pruned = {id(node) for node in list(tree_dict.values())[1:]}
+        number = max(1, 10 ** 5 // 10 ** depth)
+        report(f'traverse_dict bushy 1e{depth} (full)', measure(lambda: traverse_dict(apply['incr_1'], tree_dict), number))
+        report(f'traverse_dict bushy 1e{depth} prune', measure(lambda: traverse_dict(apply['incr_1'], tree_dict,
+            lambda node: id(node) in pruned), number))
+        report(f'traverse_dict bushy 1e{depth} max_depth 2', measure(lambda: traverse_dict(len, tree_dict, None, 2), number))
+
+
+if __name__ == '__main__':
+    run()
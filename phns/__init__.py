@@ -8,12 +8,16 @@
 Resources to support a more functional style of programming,
 incl. classes for base and pointed functors, a corresponding
 builder set and related factory, and higher order functions:
-- builder  builder functions returning instances of classes
-- factory  a factory class and an instance for the builders
-- functor  classes for variants of base and pointed functor
-- primary  higher order functions both taking and returning
-- utility  remaining higher order and first order functions
+- builder     builder functions returning instances of classes
+- factory     a factory class and an instance for the builders
+- functor     classes for variants of base and pointed functor
+- instrument  profiling of maps, traversals and pipelines
+- primary     higher order functions both taking and returning
+- stream      streaming mapping of JSON documents
+- transducer  transducers and functions running them
+- utility     remaining higher order and first order functions
 """
 
 
 from phns.factory import phnew as phnew
+import phns.instrument  # enables process-wide profiling if PHNS_PROFILE is set
@@ -1,59 +1,336 @@
 """
 Builder functions returning instances of the classes in 'phns/functor.py':
-- get_functor   base functor classes (Functor, FunctorIter, FunctorDict)
-- get_pfunctor  pointed functor classes (PFunctor, PFunctorIter, PFunctorDict)
+- get_functor      base functor classes (Functor, FunctorIter, FunctorDict, FunctorStream, FunctorArray)
+- get_pfunctor     pointed functor classes (PFunctor, PFunctorIter, PFunctorDict, PFunctorStream, PFunctorArray)
+- get_applicative  applicative functor classes (Applicative, ApplicativeIter)
+- get_monad        monad classes (Monad)
+and compiler functions returning a builder with the keyword arguments resolved:
+- compile_functor, compile_pfunctor, each registered in compilers by builder
+and registry functions extending the types dispatched to each class:
+- register_iterable, register_dict, register_array, register_stream,
+  unregister_kind, get_kind, get_kind_set.
 """
 
 
-from typing import TypeVar, Union, Any
+from typing import TypeVar, Callable, Iterator, Union, Optional, Tuple, Dict, Any
 
-from phns.functor import Functor, FunctorIter, FunctorDict, PFunctor, PFunctorIter, PFunctorDict
-from phns.utility import get_constructor
+from array import array
+from collections import deque
+
+from phns.functor import Functor, FunctorIter, FunctorDict, FunctorStream, FunctorArray,\
+    PFunctor, PFunctorIter, PFunctorDict, PFunctorStream, PFunctorArray,\
+    Applicative, ApplicativeIter, Monad
+from phns.utility import get_constructor, get_class_name, dicts, numpy
 
 
 # builder values
 
-iterables_passed = [list, tuple, set, frozenset, bytearray]
+functors_base: Dict[str, Callable] = {
+    'base':   Functor,
+    'iter':   FunctorIter,
+    'dict':   FunctorDict,
+    'stream': FunctorStream,
+    'array':  FunctorArray
+}
+
+functors_pointed: Dict[str, Callable] = {
+    'base':   PFunctor.of,
+    'iter':   PFunctorIter.of,
+    'dict':   PFunctorDict.of,
+    'stream': PFunctorStream.of,
+    'array':  PFunctorArray.of
+}
+
+kinds_registered: Dict[type, Tuple[str, Any]] = {}
+kinds_resolved: Dict[type, Optional[Tuple[str, Any]]] = {}
+
+
+# registry functions
+
+def register_iterable(cls: type, const: Any = None) -> None:
+    """
+    Registers 'cls' and its subclasses to be passed to the -Iter classes,
+    with a const property set to 'const' or else 'cls'.
+
+    >>> class Span:
+    ...     def __init__(self, n): self.n = n
+    ...     def __iter__(self): return iter(range(self.n))
+    >>> register_iterable(Span, list)
+    >>> print(get_functor(Span(3)).map(lambda x: x * 2))
+    [0, 2, 4]
+    """
+    register_kind(cls, 'iter', cls if const is None else const)
+
+def register_dict(cls: type, const: Any = None) -> None:
+    """
+    Registers 'cls' and its subclasses to be passed to the -Dict classes,
+    with any 'const' added to 'dicts' in utility to rebuild 'cls' from pairs,
+    an instance of 'cls' otherwise rebuilt via a copy.
+
+    >>> class Settings: pass
+    >>> register_dict(Settings)
+    >>> get_kind(Settings)
+    ('dict', None)
+    """
+    register_kind(cls, 'dict', const)
+    if const is not None:
+        dicts[cls] = const
+
+def register_array(cls: type) -> None:
+    """
+    Registers 'cls' and its subclasses to be passed to the -Array classes.
+
+    >>> class Samples(array): pass
+    >>> register_array(Samples)
+    >>> get_kind(Samples)
+    ('array', None)
+    """
+    register_kind(cls, 'array')
+
+def register_stream(cls: type) -> None:
+    """
+    Registers 'cls' and its subclasses to be passed to the -Stream classes.
+
+    >>> class Feed:
+    ...     def __iter__(self): return iter([1, 2])
+    >>> register_stream(Feed)
+    >>> print(list(get_functor(Feed()).map(lambda x: x + 1)))
+    [2, 3]
+    """
+    register_kind(cls, 'stream')
+
+def register_kind(cls: type, kind: str, const: Any = None) -> None:
+    """
+    Registers 'cls' and its subclasses under 'kind', one of 'iter', 'dict',
+    'array' or 'stream', with any 'const', clearing the types resolved.
+
+    >>> class Bag(list): pass
+    >>> register_kind(Bag, 'iter', Bag)
+    >>> get_kind(Bag)[0], get_kind(Bag)[1] is Bag
+    ('iter', True)
+    """
+    kinds_registered[cls] = (kind, const)
+    kinds_resolved.clear()
+
+def unregister_kind(cls: type) -> None:
+    """
+    Removes any kind registered for 'cls', its subclasses then passed per
+    any registered for another type in their method resolution order,
+    clearing the types resolved.
+
+    >>> class Bag(list): pass
+    >>> register_kind(Bag, 'iter', Bag)
+    >>> unregister_kind(Bag)
+    >>> get_kind(Bag)[1] is list
+    True
+    """
+    kind = kinds_registered.pop(cls, None)
+    if kind is not None and kind[0] == 'dict' and kind[1] is not None:
+        dicts.pop(cls, None)
+    kinds_resolved.clear()
+
+def get_kind(cls: type) -> Optional[Tuple[str, Any]]:
+    """
+    Returns the kind and const registered for 'cls' or else for the first
+    type in its method resolution order registered, or None if none is,
+    cached per type.
+
+    >>> from collections import OrderedDict
+    >>> get_kind(OrderedDict), get_kind(str)
+    (('dict', None), None)
+    """
+    try:
+        return kinds_resolved[cls]
+    except KeyError:
+        pass
+    kind = next((kinds_registered[base] for base in cls.__mro__ if base in kinds_registered), None)
+    kinds_resolved[cls] = kind
+    return kind
 
 
 # builder functions
 
-def get_functor(value: Any, **kwargs) -> Union[Functor, FunctorIter, FunctorDict]:
+def get_functor(value: Any, **kwargs) -> Union[Functor, FunctorIter, FunctorDict, FunctorStream, FunctorArray]:
     """
     Returns a base functor instance with a value property set to 'value'
-    of the class for either dictionary, other iterable or uniterable type,
-    and, where passed, a const property set to the constructor of 'value'.
+    of the class for the kind registered for the type of 'value', either
+    dictionary, array, stream or other iterable, otherwise uniterable,
+    or for a stream if any 'as_stream' keyword argument is truthy,
+    and, where passed, a const property set to the constructor of 'value',
+    raising a TypeError for an uniterable value if any 'in_place' is truthy.
 
     >>> f = get_functor([1, 2, 3])
     >>> print(f.__class__.__name__, f.value, f.const == list)
     FunctorIter [1, 2, 3] True
     """
-    const = get_constructor(value)
-    as_base = False if ('as_base' not in kwargs and 'as_is' not in kwargs)\
-        else ('as_base' in kwargs and kwargs['as_base']) or kwargs['as_is']
-    as_iter = False if 'as_iter' not in kwargs else kwargs['as_iter']
-    if (not as_base and const in iterables_passed) or as_iter:
-        return FunctorIter(value, const, **kwargs)
-    if not as_base and const == dict:
-        return FunctorDict(value, **kwargs)
-    return Functor(value)
+    return build(functors_base, value, kwargs)
 
-def get_pfunctor(value: Any, **kwargs) -> Union[PFunctor, PFunctorIter, PFunctorDict]:
+def get_pfunctor(value: Any, **kwargs) -> Union[PFunctor, PFunctorIter, PFunctorDict, PFunctorStream, PFunctorArray]:
     """
     Returns a pointed functor instance with a value property set to 'value'
-    of the class for either dictionary, other iterable or uniterable type,
-    and, where passed, a const property set to the constructor of 'value'.
+    of the class for the kind registered for the type of 'value', either
+    dictionary, array, stream or other iterable, otherwise uniterable,
+    or for a stream if any 'as_stream' keyword argument is truthy,
+    and, where passed, a const property set to the constructor of 'value',
+    raising a TypeError for an uniterable value if any 'in_place' is truthy.
 
     >>> pf = get_pfunctor([1, 2, 3])
     >>> print(pf.__class__.__name__, pf.value, pf.const == list)
     PFunctorIter [1, 2, 3] True
     """
-    const = get_constructor(value)
-    as_base = False if ('as_base' not in kwargs and 'as_is' not in kwargs)\
-        else ('as_base' in kwargs and kwargs['as_base']) or kwargs['as_is']
-    as_iter = False if 'as_iter' not in kwargs else kwargs['as_iter']
-    if (not as_base and const in iterables_passed) or as_iter:
-        return PFunctorIter.of(value, const, **kwargs)
-    if not as_base and const == dict:
-        return PFunctorDict.of(value, **kwargs)
-    return PFunctor.of(value)
+    return build(functors_pointed, value, kwargs)
+
+def get_applicative(value: Any, **kwargs) -> Union[Applicative, ApplicativeIter]:
+    """
+    Returns an applicative functor instance with a value property set to
+    'value' of the class for an iterable if the kind registered for the type
+    of 'value' is iterable or stream, or if any 'as_iter' keyword argument
+    is truthy, with a const property set to that registered or else list,
+    or otherwise for any type, or if any 'as_base' keyword argument is truthy.
+
+    >>> fns, values = get_applicative([abs, str]), get_applicative(x for x in [-1])
+    >>> print(fns.__class__.__name__, values.const, list(fns.ap(values).value))
+    ApplicativeIter <class 'list'> [1, '-1']
+    """
+    if kwargs.get('as_base') or kwargs.get('as_is'):
+        return Applicative.of(value, **kwargs)
+    kind = get_kind(value.__class__)
+    if kind is not None and kind[0] == 'iter':
+        return ApplicativeIter.of(value, kind[1], **kwargs)
+    if (kind is not None and kind[0] == 'stream') or ('as_iter' in kwargs and kwargs['as_iter'])\
+        or isinstance(value, Iterator):
+        return ApplicativeIter.of(value, list, **kwargs)
+    return Applicative.of(value, **kwargs)
+
+def get_monad(value: Any, **kwargs) -> Monad:
+    """
+    Returns a monad instance with a value property set to 'value',
+    of whichever type, with steps applied via map and chain once read.
+
+    >>> m = get_monad(1)
+    >>> print(m.__class__.__name__, m.chain(lambda x: get_monad(x + 1)).value)
+    Monad 2
+    """
+    return Monad.of(value, **kwargs)
+
+def get_kind_set(kwargs: Dict[str, Any]) -> Optional[str]:
+    """
+    Returns the kind set by the keyword arguments 'kwargs', whichever first
+    of 'stream' if any 'as_stream' is truthy, 'iter' if any 'as_iter' is
+    and 'base' if any 'as_base' or 'as_is' is, otherwise None,
+    shared by 'build' and 'compile_builder'.
+
+    >>> get_kind_set({'as_base': False}), get_kind_set({'as_is': True, 'as_iter': True})
+    (None, 'iter')
+    """
+    if kwargs.get('as_stream'):
+        return 'stream'
+    if kwargs.get('as_iter'):
+        return 'iter'
+    if kwargs.get('as_base') or kwargs.get('as_is'):
+        return 'base'
+    return None
+
+def build(consts: Dict[str, Callable], value: Any, kwargs: Dict[str, Any]) -> Any:
+    """
+    Returns an instance built from 'value' via one of 'consts', keyed by kind,
+    passed the keyword arguments 'kwargs', per 'get_functor'.
+
+    >>> build(functors_base, {'a': 1}, {}).__class__.__name__
+    'FunctorDict'
+    """
+    if kwargs:
+        kind_set = get_kind_set(kwargs)
+        if kind_set == 'stream':
+            return consts['stream'](value, **kwargs)
+        if kind_set == 'iter':
+            return consts['iter'](value, get_constructor(value), **kwargs)
+        if kind_set == 'base':
+            return consts['base'](value)
+    try:
+        kind = kinds_resolved[value.__class__]
+    except KeyError:
+        kind = get_kind(value.__class__)
+    if kind is None:
+        if kwargs.get('in_place'):
+            raise TypeError(f'cannot map {get_class_name(value)} in place, not list, bytearray or dict')
+        return consts['base'](value)
+    if kind[0] == 'iter':
+        return consts['iter'](value, kind[1], **kwargs)
+    return consts[kind[0]](value, **kwargs)
+
+
+# compiler functions
+
+def compile_functor(**kwargs) -> Callable[[Any], Any]:
+    """
+    Returns a function building per 'get_functor' from a value alone,
+    with the keyword arguments 'kwargs' resolved once in advance.
+
+    >>> build = compile_functor(as_tree=True)
+    >>> print(build([1, [2]]).map(lambda x: x + 1), build(1).value)
+    [2, [3]] 1
+    """
+    return compile_builder(functors_base, kwargs)
+
+def compile_pfunctor(**kwargs) -> Callable[[Any], Any]:
+    """
+    Returns a function building per 'get_pfunctor' from a value alone,
+    with the keyword arguments 'kwargs' resolved once in advance.
+
+    >>> build = compile_pfunctor(as_tree=True)
+    >>> print(build([1, [2]]).map(lambda x: x + 1).value, build(1).value)
+    [2, [3]] 1
+    """
+    return compile_builder(functors_pointed, kwargs)
+
+def compile_builder(consts: Dict[str, Callable], kwargs: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Returns a function building from a value alone an instance via one of
+    'consts', keyed by kind, i.e. 'base' for an uniterable type or else that
+    registered for the type of the value, passed the keyword arguments 'kwargs'.
+
+    >>> compile_builder({**functors_base, 'dict': list}, {})({'a': 1})
+    ['a']
+    """
+    kind_set = get_kind_set(kwargs)
+    if kind_set == 'stream':
+        build_stream = consts['stream']
+        return lambda value: build_stream(value, **kwargs)
+    build_base, build_iter = consts['base'], consts['iter']
+    if kind_set == 'iter':
+        return lambda value: build_iter(value, get_constructor(value), **kwargs)
+    if kind_set == 'base':
+        return build_base
+    in_place = kwargs.get('in_place')
+    def build(value: Any) -> Any:
+        try:
+            kind = kinds_resolved[value.__class__]
+        except KeyError:
+            kind = get_kind(value.__class__)
+        if kind is None:
+            if in_place:
+                raise TypeError(f'cannot map {get_class_name(value)} in place, not list, bytearray or dict')
+            return build_base(value)
+        if kind[0] == 'iter':
+            return build_iter(value, kind[1], **kwargs)
+        return consts[kind[0]](value, **kwargs)
+    return build
+
+
+# compiler values
+
+compilers: Dict[Callable, Callable] = {
+    get_functor:  compile_functor,
+    get_pfunctor: compile_pfunctor
+}
+
+
+# type registration
+
+for cls in (list, tuple, set, frozenset, bytearray, deque):
+    register_iterable(cls)
+register_dict(dict)
+register_array(array)
+if numpy is not None:
+    register_array(numpy.ndarray)
@@ -5,9 +5,10 @@ returning when called directly instances of the classes in 'phns/functor.py'.
 """
 
 
-from typing import TypeVar, Callable, Dict, Any
+from typing import TypeVar, Callable, Iterable, Iterator, List, Dict, Any
+from functools import partial
 
-from phns.builder import get_functor, get_pfunctor
+from phns.builder import get_functor, get_pfunctor, get_applicative, get_monad, compilers
 
 
 # types
@@ -25,12 +26,25 @@ class Phnew():
     builders (attribute) Dict[str, Any] = {}
       Stores each builder registered to the instance keyed under its id.
 
-    register (method) id: str, fn: Builder -> None
+    compiled (attribute) Dict[str, Builder] = {}
+      Stores each builder registered with its keyword dictionary applied,
+      via any compiler function for the builder, keyed under its id.
+
+    register (method) id: str, fn: Builder, kw: Dict = {} -> None
       Inserts builder 'fn' and its corresponding keyword dictionary 'kw'
-      into the builders dictionary keyed under 'id'.
+      into the builders dictionary keyed under 'id', and the two compiled
+      into the compiled dictionary.
 
     __call__ (method) id: str, value: P -> Any
       Returns the result from the builder under 'id' when passed 'value'.
+
+    many (method) id: str, values: Iterable[P] -> List[Any]
+      Returns a list of the results from the builder under 'id' when passed
+      each of 'values' in turn.
+
+    build_iter (method) id: str, values: Iterable[P] -> Iterator[Any]
+      Returns an iterator yielding the result from the builder under 'id'
+      when passed each of 'values' in turn, as each is consumed.
     """
 
     def __init__(self) -> None:
@@ -38,21 +52,28 @@ class Phnew():
         Returns an instance of Phnew with no builder functions registered.
 
         >>> p = Phnew()
-        >>> print(p.__class__.__name__, p.builders)
-        Phnew {}
+        >>> print(p.__class__.__name__, p.builders, p.compiled)
+        Phnew {} {}
         """
         self.builders: Dict[str, Any] = {}
+        self.compiled: Dict[str, Builder] = {}
 
     def register(self, id: str, fn: Builder, kw: Dict = {}) -> None:
         """
-        Inserts builder 'fn' into the builders dictionary keyed under 'id'.
+        Inserts builder 'fn' into the builders dictionary keyed under 'id'
+        and 'fn' compiled with 'kw' into the compiled dictionary, i.e. via
+        the compiler function for 'fn' in 'compilers' in 'phns/builder.py'
+        or else with 'kw' bound.
 
         >>> p = Phnew()
         >>> p.register('get_int', lambda x: int(x))
-        >>> p.builders['get_int']['fn'](1)
-        1
+        >>> p.builders['get_int']['fn'](1), p.compiled['get_int'](1)
+        (1, 1)
         """
         self.builders[id] = {'fn': fn, 'kw': kw};
+        compiler = compilers.get(fn)
+        self.compiled[id] = compiler(**kw) if compiler is not None\
+            else partial(fn, **kw) if kw else fn
 
     def __call__(self, id: str, value: P) -> Any:
         """
@@ -63,9 +84,37 @@ class Phnew():
         >>> p('get_int', 1)
         1
         """
-        if id in self.builders:
-            return self.builders[id]['fn'](value, **self.builders[id]['kw'])
-        raise ValueError(id)
+        build = self.compiled.get(id)
+        if build is None:
+            raise ValueError(id)
+        return build(value)
+
+    def many(self, id: str, values: Iterable[P]) -> List[Any]:
+        """
+        Returns a list of the results from the builder under 'id' when passed
+        each of 'values' in turn.
+
+        >>> p = Phnew()
+        >>> p.register('get_int', lambda x: int(x))
+        >>> p.many('get_int', ['1', '2'])
+        [1, 2]
+        """
+        return list(self.build_iter(id, values))
+
+    def build_iter(self, id: str, values: Iterable[P]) -> Iterator[Any]:
+        """
+        Returns an iterator yielding the result from the builder under 'id'
+        when passed each of 'values' in turn, as each is consumed.
+
+        >>> p = Phnew()
+        >>> p.register('get_int', lambda x: int(x))
+        >>> next(p.build_iter('get_int', iter(['1', '2'])))
+        1
+        """
+        build = self.compiled.get(id)
+        if build is None:
+            raise ValueError(id)
+        return map(build, values)
 
 
 # factory instantiation & builder registration
@@ -79,6 +128,13 @@ phnew.register('f:.', get_functor, {'as_iter': True})
 phnew.register('f:{', get_functor, {'as_tree': True})
 phnew.register('f',   get_functor)
 phnew.register('f{',  get_functor, {'as_tree': True})
+phnew.register('f:*', get_functor, {'as_mixed': True})
+phnew.register('f*',  get_functor, {'as_mixed': True})
+phnew.register('f~',  get_functor, {'as_stream': True})
+phnew.register('f#',  get_functor, {'memo': True})
+phnew.register('f!',  get_functor, {'in_place': True})
+phnew.register('f{!', get_functor, {'as_tree': True, 'in_place': True})
+phnew.register('f*!', get_functor, {'as_mixed': True, 'in_place': True})
 
 # - pointed functors
 phnew.register('pf.',  get_pfunctor, {'as_base': True})
@@ -87,3 +143,18 @@ phnew.register('pf:.', get_pfunctor, {'as_iter': True})
 phnew.register('pf:{', get_pfunctor, {'as_tree': True})
 phnew.register('pf',   get_pfunctor)
 phnew.register('pf{',  get_pfunctor, {'as_tree': True})
+phnew.register('pf:*', get_pfunctor, {'as_mixed': True})
+phnew.register('pf*',  get_pfunctor, {'as_mixed': True})
+phnew.register('pf~',  get_pfunctor, {'as_stream': True})
+phnew.register('pf#',  get_pfunctor, {'memo': True})
+phnew.register('pf!',  get_pfunctor, {'in_place': True})
+phnew.register('pf{!', get_pfunctor, {'as_tree': True, 'in_place': True})
+phnew.register('pf*!', get_pfunctor, {'as_mixed': True, 'in_place': True})
+
+# - applicative functors
+phnew.register('a.', get_applicative, {'as_base': True})
+phnew.register('a',  get_applicative)
+phnew.register('a=', get_applicative, {'as_zip': True})
+
+# - monads
+phnew.register('m', get_monad)
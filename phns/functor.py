@@ -1,13 +1,19 @@
 """
 Functor classes, available also via 'phns/builder.py' and 'phns/factory.py':
-- base functor classes (Functor, FunctorIter, FunctorDict)
-- pointed functor classes (PFunctor, PFunctorIter, PFunctorDict).
+- base functor classes (Functor, FunctorIter, FunctorDict, FunctorStream, FunctorArray)
+- pointed functor classes (PFunctor, PFunctorIter, PFunctorDict, PFunctorStream, PFunctorArray)
+- applicative functor classes (Applicative, ApplicativeIter)
+- monad classes (Monad).
 """
 
 
-from typing import TypeVar, Callable, Generic, Iterable, List, Dict, Any
+from typing import TypeVar, Callable, Generic, Iterable, Iterator, List, Dict, Tuple, Mapping, Optional, Any
 
-from phns.utility import traverse_iter, traverse_dict, get_const
+from phns.utility import traverse_iter, traverse_dict, traverse_mixed, traverse_pooled,\
+    traverse_gathered, traverse_incremental, traverse_shared, traverse_in_place, traverse_selected,\
+    map_pooled, map_gathered, map_array, map_translated, map_in_place, map_product, map_each, fuse, chunk,\
+    get_traversals, is_translatable, is_process_pool, get_dict, get_controls, get_pairs, get_const, get_class_name
+from phns.primary import get_memoized
 
 
 # types
@@ -29,6 +35,8 @@ class Functor(Generic[V]):
       Returns the instance value property once 'handle' has been applied.
     """
 
+    __slots__ = ('value',)
+
     def __init__(self, value: V) -> None:
         """
         Returns a Functor instance with a value property set to 'value'.
@@ -59,19 +67,41 @@ class FunctorIter(Generic[V]):
     const (attribute) Any = None
       The constructor function corresponding to the value attribute type.
 
-    pairs (attribute) Dict[str, Any] = {}
-      A dictionary of keyword argument settings received at instantiation.
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    map (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns the instance value property once 'handle' has been applied
+      to the whole by default or to each node if any 'as_tree' is truthy,
+      incl. in containers of other types if any 'as_mixed' is truthy,
+      or to each value at a path matched if any 'select' is passed,
+      in parallel via a pool if any 'workers' or 'executor' is passed,
+      with results cached per value if any 'memo' is truthy,
+      or in place, overwriting each value, if any 'in_place' is truthy.
+
+    map_with (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns the instance value property per the map method, resolving in turn
+      each setting passed or set, where any is passed or set.
 
-    map (method) handle: H, as_tree: bool = False -> Any
+    amap (coroutine method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      limit: int = 0 -> Any
       Returns the instance value property once 'handle' has been applied
-      to the whole by default or to each node if any 'as_tree' is truthy.
+      and any awaitable results awaited, per the map method, concurrently
+      for up to 'limit' items at once if any 'limit' is truthy.
     """
 
+    __slots__ = ('value', 'const', 'pairs')
+
     def __init__(self, value: Iterable[V], const: Any = None, **kwargs) -> None:
         """
         Returns a FunctorIter instance with a value property set to 'value',
         a const property set to 'const' or the constructor of 'value' and
-        a pairs property set to the dictionary of keyword arguments
+        a pairs property set to the mapping of keyword arguments
 
         >>> f = FunctorIter([1, [2, 3]])
         >>> print(f.__class__.__name__, f.value, f.const == list)
@@ -79,21 +109,131 @@ class FunctorIter(Generic[V]):
         """
         self.value = value
         self.const = get_const(value) if const is None else const
-        self.pairs = kwargs
+        self.pairs = get_pairs(kwargs)
 
-    def map(self, handle: H, as_tree: bool = False) -> Any:
+    def map(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
         """
         Returns the instance value property once 'handle' has been applied
-        to the whole by default or to each node if any 'as_tree' is truthy.
+        to the whole by default or to each node if any 'as_tree' is truthy,
+        incl. in containers of other types if any 'as_mixed' is truthy,
+        or to each value at a path matched if any 'select' is passed,
+        in parallel via a pool if any 'workers' or 'executor' is passed,
+        with results cached per value if any 'memo' is truthy,
+        or in place, overwriting each value, if any 'in_place' is truthy.
+
+        The 'executor' can be an Executor instance or a class to be given
+        'workers', e.g. ProcessPoolExecutor; see 'map_pooled' in utility.
+        The 'memo' can be True or the maximum number of results cached,
+        the cache shared by each map with the same 'handle' and 'memo'
+        other than via a process pool; see 'get_memoized' in primary. If 'incremental' is truthy, a tree is
+        mapped reusing each subtree unchanged since the last tree mapped
+        by 'handle', or if 'since' is passed, a pair of an earlier tree and
+        its result, since that tree, with nothing retained, each subtree
+        also unchanged if of the same version per any 'version' setting;
+        see 'traverse_incremental' in utility. If 'as_graph'
+        is truthy, a tree is mapped as per 'as_tree' or 'as_mixed' with each
+        container mapped once, preserving sharing and cycles; see
+        'traverse_shared' in utility. Any 'prune', 'max_depth' or 'is_leaf'
+        setting limits the descent of a tree mapped per 'as_tree', other than
+        with 'as_graph' unless in place, with each nested container for which
+        'prune' returns truthy retained as is, and each for which 'is_leaf'
+        does or nested more than 'max_depth' levels deep passed to 'handle'
+        whole; see 'traverse_iter' in utility. If 'in_place' is truthy, the
+        value, a list, bytearray or dictionary or a tree of these, is itself
+        updated and returned, or a TypeError raised for any other type;
+        see 'map_in_place' and 'traverse_in_place' in utility. The 'select'
+        can be a pattern or patterns of keys and indices separated by '.',
+        with '*' matching any one and '**' any number, and each container
+        not on a path to a value changed is retained as is, by reference,
+        with any 'memo' and 'in_place' applied but the values mapped in turn
+        and each other setting ignored; see 'traverse_selected' in utility.
 
         >>> f = FunctorIter([1, [2, 3]])
         >>> print(f.map(lambda x: x + 1, True))
         [2, [3, 4]]
+        >>> print(f.map(lambda x: x + 1, as_mixed=True))
+        [2, [3, 4]]
+        >>> print(FunctorIter((1, 2, 3)).map(lambda x: x + 1, workers=2))
+        (2, 3, 4)
+        >>> items = [1, [2, 3]]
+        >>> print(FunctorIter(items).map(lambda x: x + 1, True, in_place=True) is items, items)
+        True [2, [3, 4]]
         """
-        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
-            return traverse_iter(handle, self.value, self.const)
+        if self.pairs or as_tree or as_mixed or workers or executor is not None or memo or in_place\
+            or select or since:
+            return self.map_with(handle, as_tree, as_mixed, workers, executor, memo, in_place, select, since)
+        if is_translatable(self.value, self.const):
+            return map_translated((handle,), self.value)
         return self.const(map(handle, self.value))
 
+    def map_with(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
+        """
+        Returns the instance value property per the map method, resolving in turn
+        each setting passed or set, where any is passed or set.
+
+        >>> print(FunctorIter([1, [2]], as_tree=True).map_with(lambda x: x + 1))
+        [2, [3]]
+        """
+        workers = workers or self.pairs.get('workers', 0)
+        executor = executor or self.pairs.get('executor')
+        memo = memo or self.pairs.get('memo', 0)
+        key = handle
+        in_place = in_place or self.pairs.get('in_place', False)
+        select = select or self.pairs.get('select')
+        since = since or self.pairs.get('since')
+        if memo and not is_process_pool(executor):
+            handle = get_memoized(handle) if memo is True else get_memoized(handle, memo)
+        if select:
+            return traverse_selected(handle, self.value, select, in_place)
+        as_graph = 'as_graph' in self.pairs and self.pairs['as_graph']
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            if in_place:
+                return traverse_in_place(handle, self.value, None, as_graph)
+            return traverse_pooled(traverse_shared if as_graph else traverse_mixed, handle, self.value,
+                workers=workers, executor=executor)
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree or as_graph:
+            controls = get_controls(self.pairs)
+            if in_place:
+                return traverse_in_place(handle, self.value, self.const, as_graph, *controls)
+            if as_graph:
+                return traverse_pooled(traverse_shared, handle, self.value, get_traversals(self.const),
+                    workers=workers, executor=executor)
+            if (since or self.pairs.get('incremental'))\
+                and not workers and executor is None and not any(controls):
+                return traverse_incremental(handle, self.value, self.const, key, since,
+                    self.pairs.get('version'))
+            return traverse_pooled(traverse_iter, handle, self.value, self.const, *controls,
+                workers=workers, executor=executor)
+        if in_place:
+            return map_in_place(handle, self.value)
+        if not workers and executor is None and is_translatable(self.value, self.const):
+            return map_translated((handle,), self.value)
+        return self.const(map_pooled(handle, self.value, workers, executor))
+
+    async def amap(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        limit: int = 0) -> Any:
+        """
+        Returns the instance value property once 'handle' has been applied
+        and any awaitable results awaited, per the map method, concurrently
+        for up to 'limit' items at once if any 'limit' is truthy.
+
+        >>> from asyncio import run, sleep
+        >>> async def incr_1(x): await sleep(0); return x + 1
+        >>> print(run(FunctorIter([1, [2, 3]]).amap(incr_1, True, limit=2)))
+        [2, [3, 4]]
+        """
+        limit = limit or self.pairs.get('limit', 0)
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            return await traverse_gathered(traverse_mixed, handle, self.value, limit=limit)
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
+            return await traverse_gathered(traverse_iter, handle, self.value, self.const,
+                *get_controls(self.pairs), limit=limit)
+        return self.const(await map_gathered(handle, self.value, limit))
+
 class FunctorDict(Generic[V]):
     """
     Stores a value of type dict to be mapped by use of a handler function.
@@ -101,39 +241,259 @@ class FunctorDict(Generic[V]):
     value (attribute) Dict[Any, V]
       A value of type dict provided for transformation via the map method.
 
-    pairs (attribute) Dict[str, Any] = {}
-      A dictionary of keyword argument settings received at instantiation.
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    map (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns the instance value property once 'handle' has been applied
+      to the whole by default or to each node if any 'as_tree' is truthy,
+      incl. in containers of other types if any 'as_mixed' is truthy,
+      or to each value at a path matched if any 'select' is passed,
+      in parallel via a pool if any 'workers' or 'executor' is passed,
+      with results cached per value if any 'memo' is truthy,
+      or in place, overwriting each value, if any 'in_place' is truthy.
+
+    map_with (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns the instance value property per the map method, resolving in turn
+      each setting passed or set, where any is passed or set.
 
-    map (method) handle: H, as_tree: bool = False -> Any
+    amap (coroutine method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      limit: int = 0 -> Any
       Returns the instance value property once 'handle' has been applied
-      to the whole by default or to each node if any 'as_tree' is truthy.
+      and any awaitable results awaited, per the map method, concurrently
+      for up to 'limit' items at once if any 'limit' is truthy.
     """
 
+    __slots__ = ('value', 'pairs')
+
     def __init__(self, value: Dict[Any, V], **kwargs) -> None:
         """
         Returns a FunctorDict instance with a value property set to 'value'
-        and a pairs property set to the dictionary of keyword arguments
+        and a pairs property set to the mapping of keyword arguments
 
         >>> f = FunctorDict({'a': 1, 'b': {'c': 2, 'd': 3}})
         >>> print(f.__class__.__name__, f.value)
         FunctorDict {'a': 1, 'b': {'c': 2, 'd': 3}}
         """
         self.value = value
-        self.pairs = kwargs
+        self.pairs = get_pairs(kwargs)
 
-    def map(self, handle: H, as_tree: bool = False) -> Any:
+    def map(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
         """
         Returns the instance value property once 'handle' has been applied
-        to the whole by default or to each node if any 'as_tree' is truthy.
+        to the whole by default or to each node if any 'as_tree' is truthy,
+        incl. in containers of other types if any 'as_mixed' is truthy,
+        or to each value at a path matched if any 'select' is passed,
+        in parallel via a pool if any 'workers' or 'executor' is passed,
+        with results cached per value if any 'memo' is truthy,
+        or in place, overwriting each value, if any 'in_place' is truthy.
+
+        The 'executor' can be an Executor instance or a class to be given
+        'workers', e.g. ProcessPoolExecutor; see 'map_pooled' in utility.
+        The 'memo' can be True or the maximum number of results cached,
+        the cache shared by each map with the same 'handle' and 'memo'
+        other than via a process pool; see 'get_memoized' in primary. If 'incremental' is truthy, a tree is
+        mapped reusing each subtree unchanged since the last tree mapped
+        by 'handle', or if 'since' is passed, a pair of an earlier tree and
+        its result, since that tree, with nothing retained, each subtree
+        also unchanged if of the same version per any 'version' setting;
+        see 'traverse_incremental' in utility. If 'as_graph'
+        is truthy, a tree is mapped as per 'as_tree' or 'as_mixed' with each
+        container mapped once, preserving sharing and cycles; see
+        'traverse_shared' in utility. Any 'prune', 'max_depth' or 'is_leaf'
+        setting limits the descent of a tree mapped per 'as_tree', other than
+        with 'as_graph' unless in place, with each nested container for which
+        'prune' returns truthy retained as is, and each for which 'is_leaf'
+        does or nested more than 'max_depth' levels deep passed to 'handle'
+        whole; see 'traverse_iter' in utility. If 'in_place' is truthy, the
+        value, a list, bytearray or dictionary or a tree of these, is itself
+        updated and returned, or a TypeError raised for any other type;
+        see 'map_in_place' and 'traverse_in_place' in utility. The 'select'
+        can be a pattern or patterns of keys and indices separated by '.',
+        with '*' matching any one and '**' any number, and each container
+        not on a path to a value changed is retained as is, by reference,
+        with any 'memo' and 'in_place' applied but the values mapped in turn
+        and each other setting ignored; see 'traverse_selected' in utility.
 
         >>> f = FunctorDict({'a': 1, 'b': {'c': 2, 'd': 3}})
         >>> print(f.map(lambda x: x + 1, True))
         {'a': 2, 'b': {'c': 3, 'd': 4}}
+        >>> print(FunctorDict({'a': [1, (2, 3)]}).map(lambda x: x + 1, as_mixed=True))
+        {'a': [2, (3, 4)]}
+        >>> print(FunctorDict({'a': 1, 'b': 2}).map(lambda x: x + 1, workers=2))
+        {'a': 2, 'b': 3}
+        >>> print(FunctorDict({'a': {'b': 1, 'c': 2}}).map(lambda x: x + 1, select='a.b'))
+        {'a': {'b': 2, 'c': 2}}
         """
-        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
-            return traverse_dict(handle, self.value)
+        if self.pairs or as_tree or as_mixed or workers or executor is not None or memo or in_place\
+            or select or since:
+            return self.map_with(handle, as_tree, as_mixed, workers, executor, memo, in_place, select, since)
+        if self.value.__class__ is not dict:
+            return get_dict(self.value, map(handle, self.value.values()))
         return {k: handle(v) for k, v in self.value.items()}
 
+    def map_with(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
+        """
+        Returns the instance value property per the map method, resolving in turn
+        each setting passed or set, where any is passed or set.
+
+        >>> print(FunctorDict({'a': {'b': 1}}, as_tree=True).map_with(lambda x: x + 1))
+        {'a': {'b': 2}}
+        """
+        workers = workers or self.pairs.get('workers', 0)
+        executor = executor or self.pairs.get('executor')
+        memo = memo or self.pairs.get('memo', 0)
+        key = handle
+        in_place = in_place or self.pairs.get('in_place', False)
+        select = select or self.pairs.get('select')
+        since = since or self.pairs.get('since')
+        if memo and not is_process_pool(executor):
+            handle = get_memoized(handle) if memo is True else get_memoized(handle, memo)
+        if select:
+            return traverse_selected(handle, self.value, select, in_place)
+        as_graph = 'as_graph' in self.pairs and self.pairs['as_graph']
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            if in_place:
+                return traverse_in_place(handle, self.value, None, as_graph)
+            return traverse_pooled(traverse_shared if as_graph else traverse_mixed, handle, self.value,
+                workers=workers, executor=executor)
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree or as_graph:
+            controls = get_controls(self.pairs)
+            if in_place:
+                return traverse_in_place(handle, self.value, dict, as_graph, *controls)
+            if as_graph:
+                return traverse_pooled(traverse_shared, handle, self.value, get_traversals(dict),
+                    workers=workers, executor=executor)
+            if (since or self.pairs.get('incremental'))\
+                and not workers and executor is None and not any(controls):
+                return traverse_incremental(handle, self.value, dict, key, since,
+                    self.pairs.get('version'))
+            return traverse_pooled(traverse_dict, handle, self.value, *controls,
+                workers=workers, executor=executor)
+        if in_place:
+            return map_in_place(handle, self.value)
+        if workers or executor is not None:
+            return get_dict(self.value, map_pooled(handle, self.value.values(), workers, executor))
+        if self.value.__class__ is not dict:
+            return get_dict(self.value, map(handle, self.value.values()))
+        return {k: handle(v) for k, v in self.value.items()}
+
+    async def amap(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        limit: int = 0) -> Any:
+        """
+        Returns the instance value property once 'handle' has been applied
+        and any awaitable results awaited, per the map method, concurrently
+        for up to 'limit' items at once if any 'limit' is truthy.
+
+        >>> from asyncio import run, sleep
+        >>> async def incr_1(x): await sleep(0); return x + 1
+        >>> print(run(FunctorDict({'a': 1, 'b': {'c': 2}}).amap(incr_1, True, limit=2)))
+        {'a': 2, 'b': {'c': 3}}
+        """
+        limit = limit or self.pairs.get('limit', 0)
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            return await traverse_gathered(traverse_mixed, handle, self.value, limit=limit)
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
+            return await traverse_gathered(traverse_dict, handle, self.value,
+                *get_controls(self.pairs), limit=limit)
+        return get_dict(self.value, await map_gathered(handle, self.value.values(), limit))
+
+class FunctorStream(Generic[V]):
+    """
+    Stores an iterable value, incl. any iterator, e.g. a generator or file,
+    to be mapped item by item as consumed by use of a handler function.
+
+    value (attribute) Iterable[V]
+      An iterable value provided for transformation via the map method.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    map (method) handle: H, size: int = 0 -> Iterator[Any]
+      Returns an iterator applying 'handle' to each item as it is consumed,
+      yielding lists of up to 'size' mapped items if any 'size' is truthy.
+    """
+
+    __slots__ = ('value', 'pairs')
+
+    def __init__(self, value: Iterable[V], **kwargs) -> None:
+        """
+        Returns a FunctorStream instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> f = FunctorStream(iter([1, 2, 3]))
+        >>> print(f.__class__.__name__, list(f.value))
+        FunctorStream [1, 2, 3]
+        """
+        self.value = value
+        self.pairs = get_pairs(kwargs)
+
+    def map(self, handle: H, size: int = 0) -> Iterator[Any]:
+        """
+        Returns an iterator applying 'handle' to each item as it is consumed,
+        yielding lists of up to 'size' mapped items if any 'size' is truthy.
+
+        >>> f = FunctorStream(x for x in [1, 2, 3])
+        >>> print(list(f.map(lambda x: x + 1, 2)))
+        [[2, 3], [4]]
+        """
+        mapped = map(handle, self.value)
+        return chunk(mapped, size) if size else mapped
+
+class FunctorArray(Generic[V]):
+    """
+    Stores an array value, either an array.array or a NumPy ndarray,
+    to be mapped as a whole where possible by use of a handler function.
+
+    value (attribute) Any
+      An array value provided for transformation via the map method.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    map (method) handle: H -> Any
+      Returns the instance value property once 'handle' has been applied
+      to each item, as a vectorized operation where possible.
+    """
+
+    __slots__ = ('value', 'pairs')
+
+    def __init__(self, value: Any, **kwargs) -> None:
+        """
+        Returns a FunctorArray instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> from array import array
+        >>> f = FunctorArray(array('i', [1, 2, 3]))
+        >>> print(f.__class__.__name__, f.value)
+        FunctorArray array('i', [1, 2, 3])
+        """
+        self.value = value
+        self.pairs = get_pairs(kwargs)
+
+    def map(self, handle: H) -> Any:
+        """
+        Returns the instance value property once 'handle' has been applied
+        to each item, as a vectorized operation where possible, retaining
+        the typecode or dtype; see 'map_array' in utility.
+
+        >>> from array import array
+        >>> print(FunctorArray(array('d', [1, 2])).map(lambda x: x / 2))
+        array('d', [0.5, 1.0])
+        """
+        return map_array(handle, self.value)
+
 
 # pointed functor classes
 
@@ -153,6 +513,8 @@ class PFunctor(Functor):
       previous instance value property once 'handle' has been applied.
     """
 
+    __slots__ = ()
+
     @classmethod
     def of(cls, value: V) -> Any:
         """
@@ -186,25 +548,79 @@ class PFunctorIter(FunctorIter):
     const (attribute) Any = None
       The constructor function corresponding to the value attribute type.
 
-    pairs (attribute) Dict[str, Any] = {}
-      A dictionary of keyword argument settings received at instantiation.
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    pending (attribute) Optional[Tuple[Any, H]] = None
+      The handler functions pending if 'lazy' is truthy, as a pair of those
+      pending before the last, likewise or None, and the last, shared with
+      the instance mapped from, so that each map adds one pair.
+
+    handles (property) Tuple[H, ...] = ()
+      The handler functions pending, applied in turn to each item
+      in a single pass once the value property is read.
 
     of (class method) value: Iterable[V], const: Any = None -> Any
       Returns a PFunctorIter instance with a value property set to 'value'
       and a const property set to 'const' or the constructor of 'value'.
 
-    map (method) handle: H, as_tree: bool = False -> Any
+    map (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns a new PFunctorIter instance with a value property being the
+      previous instance value property once 'handle' has been applied
+      to the whole by default or to each node if any 'as_tree' is truthy,
+      incl. in containers of other types if any 'as_mixed' is truthy,
+      or to each value at a path matched if any 'select' is passed,
+      in parallel via a pool if any 'workers' or 'executor' is passed,
+      with results cached per value if any 'memo' is truthy,
+      or in place, overwriting each value, if any 'in_place' is truthy,
+      or if 'lazy' is truthy and none of these is, once the value is read.
+
+    map_with (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns a new PFunctorIter instance per the map method, resolving in turn
+      each setting passed or set, where any is passed or set.
+
+    amap (coroutine method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      limit: int = 0 -> Any
       Returns a new PFunctorIter instance with a value property being the
       previous instance value property once 'handle' has been applied
-      to the whole by default or to each node if any 'as_tree' is truthy.
+      and any awaitable results awaited, per the map method, concurrently
+      for up to 'limit' items at once if any 'limit' is truthy.
+
+    defer (method) handle: H -> Any
+      Returns a new PFunctorIter instance with the same value and pairs
+      properties and 'handle' added to those pending to be applied.
     """
 
+    __slots__ = ('_value', 'pending')
+
+    _value: Any
+
+    def __init__(self, value: Iterable[V], const: Any = None, **kwargs) -> None:
+        """
+        Returns a PFunctorIter instance per FunctorIter, setting the value
+        directly rather than via the property, with no handler functions
+        pending, i.e. with a pending property set to None.
+
+        >>> pf = PFunctorIter([1, 2])
+        >>> print(pf.__class__.__name__, pf.value, pf.handles)
+        PFunctorIter [1, 2] ()
+        """
+        self._value = value
+        self.const = get_const(value) if const is None else const
+        self.pairs = get_pairs(kwargs)
+        self.pending: Optional[Tuple[Any, H]] = None
+
     @classmethod
     def of(cls, value: Iterable[V], const: Any = None, **kwargs) -> Any:
         """
         Returns a PFunctorIter instance with a value property set to 'value'
         a const property set to 'const' or the constructor of 'value' and
-        a pairs property set to the dictionary of keyword arguments
+        a pairs property set to the mapping of keyword arguments
 
         >>> pf = PFunctorIter([1, [2, 3]])
         >>> print(pf.__class__.__name__, pf.value, pf.const == list)
@@ -213,22 +629,157 @@ class PFunctorIter(FunctorIter):
         const = get_const(value) if const is None else const
         return cls(value, const, **kwargs)
 
-    def map(self, handle: H, as_tree: bool = False) -> Any:
+    @property
+    def value(self) -> Any:
+        """
+        Returns the instance value once any handler functions pending
+        have been applied in turn to each item in a single pass.
+
+        >>> pf = PFunctorIter.of([1, 2], lazy=True).map(lambda x: x + 1)
+        >>> print(pf.handles != (), pf.value, pf.handles)
+        True [2, 3] ()
+        """
+        if self.pending is not None:
+            handles = self.handles
+            self.pending = None
+            if is_translatable(self._value, self.const):
+                self._value = map_translated(handles, self._value)
+            else:
+                self._value = self.const(fuse(handles, self._value))
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
+    @property
+    def handles(self) -> Tuple[H, ...]:
+        """
+        Returns the handler functions pending, in the order added.
+
+        >>> pf = PFunctorIter.of([1, 2], lazy=True).map(abs).map(str)
+        >>> pf.handles == (abs, str)
+        True
+        """
+        handles = []
+        pending = self.pending
+        while pending is not None:
+            pending, handle = pending
+            handles.append(handle)
+        return tuple(reversed(handles))
+
+    def map(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
         """
         Returns a new PFunctorIter instance with a value property being the
         previous instance value property once 'handle' has been applied
-        to the whole by default or to each node if any 'as_tree' is truthy.
+        to the whole by default or to each node if any 'as_tree' is truthy,
+        incl. in containers of other types if any 'as_mixed' is truthy,
+        or to each value at a path matched if any 'select' is passed,
+        in parallel via a pool if any 'workers' or 'executor' is passed,
+        with results cached per value if any 'memo' is truthy,
+        or in place, overwriting each value, if any 'in_place' is truthy,
+        or if 'lazy' is truthy and none of these is, once the value is read.
 
         >>> pf = PFunctorIter([1, [2, 3]])
         >>> print(pf.map(lambda x: x + 1, True).value)
         [2, [3, 4]]
+        >>> print(PFunctorIter([1, {'a': 2}]).map(lambda x: x + 1, as_mixed=True).value)
+        [2, {'a': 3}]
         """
-        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
-            traversed = traverse_iter(handle, self.value, self.const)
+        if self.pairs or as_tree or as_mixed or workers or executor is not None or memo or in_place\
+            or select or since:
+            return self.map_with(handle, as_tree, as_mixed, workers, executor, memo, in_place, select, since)
+        if is_translatable(self._value, self.const):
+            return self.of(map_translated((handle,), self._value))
+        return self.of(self.const(map(handle, self._value)))
+
+    def map_with(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
+        """
+        Returns a new PFunctorIter instance per the map method, resolving in turn
+        each setting passed or set, where any is passed or set.
+
+        >>> print(PFunctorIter([1, [2]], as_tree=True).map_with(lambda x: x + 1).value)
+        [2, [3]]
+        """
+        workers = workers or self.pairs.get('workers', 0)
+        executor = executor or self.pairs.get('executor')
+        memo = memo or self.pairs.get('memo', 0)
+        key = handle
+        in_place = in_place or self.pairs.get('in_place', False)
+        select = select or self.pairs.get('select')
+        since = since or self.pairs.get('since')
+        if memo and not is_process_pool(executor):
+            handle = get_memoized(handle) if memo is True else get_memoized(handle, memo)
+        if select:
+            selected = traverse_selected(handle, self.value, select, in_place)
+            return self.__class__(selected, self.const, **self.pairs) if in_place else self.__class__(selected)
+        as_graph = 'as_graph' in self.pairs and self.pairs['as_graph']
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            if in_place:
+                return self.__class__(traverse_in_place(handle, self.value, None, as_graph), **self.pairs)
+            traversed = traverse_pooled(traverse_shared if as_graph else traverse_mixed, handle, self.value,
+                workers=workers, executor=executor)
             return self.__class__(traversed)
-        mapped = self.const(map(handle, self.value))
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree or as_graph:
+            controls = get_controls(self.pairs)
+            if in_place:
+                traversed = traverse_in_place(handle, self.value, self.const, as_graph, *controls)
+                return self.__class__(traversed, self.const, **self.pairs)
+            if as_graph:
+                traversed = traverse_pooled(traverse_shared, handle, self.value, get_traversals(self.const),
+                    workers=workers, executor=executor)
+                return self.__class__(traversed)
+            if (since or self.pairs.get('incremental'))\
+                and not workers and executor is None and not any(controls):
+                traversed = traverse_incremental(handle, self.value, self.const, key, since,
+                    self.pairs.get('version'))
+                return self.__class__(traversed)
+            traversed = traverse_pooled(traverse_iter, handle, self.value, self.const, *controls,
+                workers=workers, executor=executor)
+            return self.__class__(traversed)
+        if in_place:
+            return self.__class__(map_in_place(handle, self.value), self.const, **self.pairs)
+        if 'lazy' in self.pairs and self.pairs['lazy'] and not isinstance(self._value, str)\
+            and not workers and executor is None:
+            return self.defer(handle)
+        if not workers and executor is None and is_translatable(self.value, self.const):
+            return self.of(map_translated((handle,), self.value))
+        mapped = self.const(map_pooled(handle, self.value, workers, executor))
         return self.of(mapped)
 
+    async def amap(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        limit: int = 0) -> Any:
+        """
+        Returns a new PFunctorIter instance with a value property being the
+        previous instance value property once 'handle' has been applied
+        and any awaitable results awaited, per the map method, concurrently
+        for up to 'limit' items at once if any 'limit' is truthy.
+
+        >>> from asyncio import run, sleep
+        >>> async def incr_1(x): await sleep(0); return x + 1
+        >>> print(run(PFunctorIter([1, [2, 3]]).amap(incr_1, True, limit=2)).value)
+        [2, [3, 4]]
+        """
+        mapped = await super().amap(handle, as_tree, as_mixed, limit)
+        return self.of(mapped)
+
+    def defer(self, handle: H) -> Any:
+        """
+        Returns a new PFunctorIter instance with the same value and pairs
+        properties and 'handle' added to those pending to be applied.
+
+        >>> pf = PFunctorIter.of([1, 2], lazy=True)
+        >>> print(pf.defer(lambda x: x + 1).defer(lambda x: x * 2).value)
+        [4, 6]
+        """
+        deferred = self.__class__(self._value, self.const, **self.pairs)
+        deferred.pending = (self.pending, handle)
+        return deferred
+
 class PFunctorDict(FunctorDict):
     """
     Stores a value of type dict to be mapped by use of a handler function
@@ -237,23 +788,76 @@ class PFunctorDict(FunctorDict):
     value (attribute) Dict[Any, V]
       A value of type dict provided for transformation via the map method.
 
-    pairs (attribute) Dict[str, Any] = {}
-      A dictionary of keyword argument settings received at instantiation.
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    pending (attribute) Optional[Tuple[Any, H]] = None
+      The handler functions pending if 'lazy' is truthy, as a pair of those
+      pending before the last, likewise or None, and the last, shared with
+      the instance mapped from, so that each map adds one pair.
+
+    handles (property) Tuple[H, ...] = ()
+      The handler functions pending, applied in turn to each value
+      in a single pass once the value property is read.
 
     of (class method) value: Dict[Any, V] -> Any
       Returns a PFunctorDict instance with a value property set to 'value'.
 
-    map (method) handle: H, as_tree: bool = False -> Any
+    map (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns a new PFunctorDict instance with a value property being the
+      previous instance value property once 'handle' has been applied
+      to the whole by default or to each node if any 'as_tree' is truthy,
+      incl. in containers of other types if any 'as_mixed' is truthy,
+      or to each value at a path matched if any 'select' is passed,
+      in parallel via a pool if any 'workers' or 'executor' is passed,
+      with results cached per value if any 'memo' is truthy,
+      or in place, overwriting each value, if any 'in_place' is truthy,
+      or if 'lazy' is truthy and none of these is, once the value is read.
+
+    map_with (method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      workers: int = 0, executor: Any = None, memo: int = 0,
+      in_place: bool = False, select: Any = None, since: Any = None -> Any
+      Returns a new PFunctorDict instance per the map method, resolving in turn
+      each setting passed or set, where any is passed or set.
+
+    amap (coroutine method) handle: H, as_tree: bool = False, as_mixed: bool = False,
+      limit: int = 0 -> Any
       Returns a new PFunctorDict instance with a value property being the
       previous instance value property once 'handle' has been applied
-      to the whole by default or to each node if any 'as_tree' is truthy.
+      and any awaitable results awaited, per the map method, concurrently
+      for up to 'limit' items at once if any 'limit' is truthy.
+
+    defer (method) handle: H -> Any
+      Returns a new PFunctorDict instance with the same value and pairs
+      properties and 'handle' added to those pending to be applied.
     """
 
+    __slots__ = ('_value', 'pending')
+
+    _value: Any
+
+    def __init__(self, value: Dict[Any, V], **kwargs) -> None:
+        """
+        Returns a PFunctorDict instance per FunctorDict, setting the value
+        directly rather than via the property, with no handler functions
+        pending, i.e. with a pending property set to None.
+
+        >>> pf = PFunctorDict({'a': 1})
+        >>> print(pf.__class__.__name__, pf.value, pf.handles)
+        PFunctorDict {'a': 1} ()
+        """
+        self._value = value
+        self.pairs = get_pairs(kwargs)
+        self.pending: Optional[Tuple[Any, H]] = None
+
     @classmethod
     def of(cls, value: Dict[Any, V], **kwargs) -> Any:
         """
         Returns a PFunctorDict instance with a value property set to 'value'
-        and a pairs property set to the dictionary of keyword arguments
+        and a pairs property set to the mapping of keyword arguments
 
         >>> pf = PFunctorDict({'a': 1, 'b': {'c': 2, 'd': 3}})
         >>> print(pf.__class__.__name__, pf.value)
@@ -261,18 +865,627 @@ class PFunctorDict(FunctorDict):
         """
         return cls(value, **kwargs)
 
-    def map(self, handle: H, as_tree: bool = False) -> Any:
+    @property
+    def value(self) -> Any:
+        """
+        Returns the instance value once any handler functions pending
+        have been applied in turn to each value in a single pass.
+
+        >>> pf = PFunctorDict.of({'a': 1}, lazy=True).map(lambda x: x + 1)
+        >>> print(pf.handles != (), pf.value, pf.handles)
+        True {'a': 2} ()
+        """
+        if self.pending is not None:
+            handles = self.handles
+            self.pending = None
+            self._value = get_dict(self._value, fuse(handles, self._value.values()))
+        return self._value
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._value = value
+
+    @property
+    def handles(self) -> Tuple[H, ...]:
+        """
+        Returns the handler functions pending, in the order added.
+
+        >>> pf = PFunctorDict.of({'a': 1}, lazy=True).map(abs).map(str)
+        >>> pf.handles == (abs, str)
+        True
+        """
+        handles = []
+        pending = self.pending
+        while pending is not None:
+            pending, handle = pending
+            handles.append(handle)
+        return tuple(reversed(handles))
+
+    def map(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
         """
         Returns a new PFunctorDict instance with a value property being the
         previous instance value property once 'handle' has been applied
-        to the whole by default or to each node if any 'as_tree' is truthy.
+        to the whole by default or to each node if any 'as_tree' is truthy,
+        incl. in containers of other types if any 'as_mixed' is truthy,
+        or to each value at a path matched if any 'select' is passed,
+        in parallel via a pool if any 'workers' or 'executor' is passed,
+        with results cached per value if any 'memo' is truthy,
+        or in place, overwriting each value, if any 'in_place' is truthy,
+        or if 'lazy' is truthy and none of these is, once the value is read.
 
         >>> pf = PFunctorDict({'a': 1, 'b': {'c': 2, 'd': 3}})
         >>> print(pf.map(lambda x: x + 1, True).value)
         {'a': 2, 'b': {'c': 3, 'd': 4}}
+        >>> print(PFunctorDict({'a': [1, (2, 3)]}).map(lambda x: x + 1, as_mixed=True).value)
+        {'a': [2, (3, 4)]}
         """
-        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree:
-            traversed = traverse_dict(handle, self.value)
+        if self.pairs or as_tree or as_mixed or workers or executor is not None or memo or in_place\
+            or select or since:
+            return self.map_with(handle, as_tree, as_mixed, workers, executor, memo, in_place, select, since)
+        if self._value.__class__ is not dict:
+            return self.of(get_dict(self._value, map(handle, self._value.values())))
+        return self.of({k: handle(v) for k, v in self._value.items()})
+
+    def map_with(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        workers: int = 0, executor: Any = None, memo: int = 0, in_place: bool = False,
+        select: Any = None, since: Any = None) -> Any:
+        """
+        Returns a new PFunctorDict instance per the map method, resolving in turn
+        each setting passed or set, where any is passed or set.
+
+        >>> print(PFunctorDict({'a': {'b': 1}}, as_tree=True).map_with(lambda x: x + 1).value)
+        {'a': {'b': 2}}
+        """
+        workers = workers or self.pairs.get('workers', 0)
+        executor = executor or self.pairs.get('executor')
+        memo = memo or self.pairs.get('memo', 0)
+        key = handle
+        in_place = in_place or self.pairs.get('in_place', False)
+        select = select or self.pairs.get('select')
+        since = since or self.pairs.get('since')
+        if memo and not is_process_pool(executor):
+            handle = get_memoized(handle) if memo is True else get_memoized(handle, memo)
+        if select:
+            selected = traverse_selected(handle, self.value, select, in_place)
+            return self.__class__(selected, **self.pairs) if in_place else self.__class__(selected)
+        as_graph = 'as_graph' in self.pairs and self.pairs['as_graph']
+        if ('as_mixed' in self.pairs and self.pairs['as_mixed']) or as_mixed:
+            if in_place:
+                return self.__class__(traverse_in_place(handle, self.value, None, as_graph), **self.pairs)
+            traversed = traverse_pooled(traverse_shared if as_graph else traverse_mixed, handle, self.value,
+                workers=workers, executor=executor)
+            return self.__class__(traversed)
+        if ('as_tree' in self.pairs and self.pairs['as_tree']) or as_tree or as_graph:
+            controls = get_controls(self.pairs)
+            if in_place:
+                return self.__class__(traverse_in_place(handle, self.value, dict, as_graph, *controls), **self.pairs)
+            if as_graph:
+                traversed = traverse_pooled(traverse_shared, handle, self.value, get_traversals(dict),
+                    workers=workers, executor=executor)
+                return self.__class__(traversed)
+            if (since or self.pairs.get('incremental'))\
+                and not workers and executor is None and not any(controls):
+                traversed = traverse_incremental(handle, self.value, dict, key, since,
+                    self.pairs.get('version'))
+                return self.__class__(traversed)
+            traversed = traverse_pooled(traverse_dict, handle, self.value, *controls,
+                workers=workers, executor=executor)
             return self.__class__(traversed)
+        if in_place:
+            return self.__class__(map_in_place(handle, self.value), **self.pairs)
+        if workers or executor is not None:
+            mapped = get_dict(self.value, map_pooled(handle, self.value.values(), workers, executor))
+            return self.of(mapped)
+        if 'lazy' in self.pairs and self.pairs['lazy']:
+            return self.defer(handle)
+        if self.value.__class__ is not dict:
+            return self.of(get_dict(self.value, map(handle, self.value.values())))
         mapped = {k: handle(v) for k, v in self.value.items()}
         return self.of(mapped)
+
+    async def amap(self, handle: H, as_tree: bool = False, as_mixed: bool = False,
+        limit: int = 0) -> Any:
+        """
+        Returns a new PFunctorDict instance with a value property being the
+        previous instance value property once 'handle' has been applied
+        and any awaitable results awaited, per the map method, concurrently
+        for up to 'limit' items at once if any 'limit' is truthy.
+
+        >>> from asyncio import run, sleep
+        >>> async def incr_1(x): await sleep(0); return x + 1
+        >>> print(run(PFunctorDict({'a': 1, 'b': {'c': 2}}).amap(incr_1, True, limit=2)).value)
+        {'a': 2, 'b': {'c': 3}}
+        """
+        mapped = await super().amap(handle, as_tree, as_mixed, limit)
+        return self.of(mapped)
+
+    def defer(self, handle: H) -> Any:
+        """
+        Returns a new PFunctorDict instance with the same value and pairs
+        properties and 'handle' added to those pending to be applied.
+
+        >>> pf = PFunctorDict.of({'a': 1}, lazy=True)
+        >>> print(pf.defer(lambda x: x + 1).defer(lambda x: x * 2).value)
+        {'a': 4}
+        """
+        deferred = self.__class__(self._value, **self.pairs)
+        deferred.pending = (self.pending, handle)
+        return deferred
+
+class PFunctorStream(FunctorStream):
+    """
+    Stores an iterable value, incl. any iterator, e.g. a generator or file,
+    to be mapped item by item as consumed by use of a handler function
+    and returned in a new instance, allowing method calls to be chained.
+
+    value (attribute) Iterable[V]
+      An iterable value provided for transformation via the map method.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    of (class method) value: Iterable[V] -> Any
+      Returns a PFunctorStream instance with a value property set to 'value'.
+
+    map (method) handle: H, size: int = 0 -> Any
+      Returns a new PFunctorStream instance with a value property being an
+      iterator applying 'handle' to each item as it is consumed, yielding
+      lists of up to 'size' mapped items if any 'size' is truthy.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, value: Iterable[V], **kwargs) -> Any:
+        """
+        Returns a PFunctorStream instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> pf = PFunctorStream.of(iter([1, 2, 3]))
+        >>> print(pf.__class__.__name__, list(pf.value))
+        PFunctorStream [1, 2, 3]
+        """
+        return cls(value, **kwargs)
+
+    def map(self, handle: H, size: int = 0) -> Any:
+        """
+        Returns a new PFunctorStream instance with a value property being an
+        iterator applying 'handle' to each item as it is consumed, yielding
+        lists of up to 'size' mapped items if any 'size' is truthy.
+
+        >>> pf = PFunctorStream.of(x for x in [1, 2, 3])
+        >>> print(list(pf.map(lambda x: x + 1).map(lambda x: x * 2, 2).value))
+        [[4, 6], [8]]
+        """
+        mapped = map(handle, self.value)
+        return self.of(chunk(mapped, size) if size else mapped)
+
+class PFunctorArray(FunctorArray):
+    """
+    Stores an array value, either an array.array or a NumPy ndarray,
+    to be mapped as a whole where possible by use of a handler function
+    and returned in a new instance, allowing method calls to be chained.
+
+    value (attribute) Any
+      An array value provided for transformation via the map method.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    of (class method) value: Any -> Any
+      Returns a PFunctorArray instance with a value property set to 'value'.
+
+    map (method) handle: H -> Any
+      Returns a new PFunctorArray instance with a value property being the
+      previous instance value property once 'handle' has been applied
+      to each item, as a vectorized operation where possible.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, value: Any, **kwargs) -> Any:
+        """
+        Returns a PFunctorArray instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> from array import array
+        >>> pf = PFunctorArray.of(array('i', [1, 2, 3]))
+        >>> print(pf.__class__.__name__, pf.value)
+        PFunctorArray array('i', [1, 2, 3])
+        """
+        return cls(value, **kwargs)
+
+    def map(self, handle: H) -> Any:
+        """
+        Returns a new PFunctorArray instance with a value property being the
+        previous instance value property once 'handle' has been applied
+        to each item, as a vectorized operation where possible.
+
+        >>> from array import array
+        >>> pf = PFunctorArray.of(array('i', [1, 2]))
+        >>> print(pf.map(lambda x: x + 1).map(lambda x: x * 2).value)
+        array('i', [4, 6])
+        """
+        return self.of(map_array(handle, self.value))
+
+
+# applicative functor classes
+
+class Applicative(PFunctor):
+    """
+    Stores a value of any type, incl. a function, to be mapped by use of
+    a handler function or applied to the value of another instance,
+    and returned in a new instance, allowing method calls to be chained.
+
+    value (attribute) V
+      A value of any type provided for transformation via the map method
+      or, if a function, for application via the ap method.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    of (class method) value: V -> Any
+      Returns an Applicative instance with a value property set to 'value'.
+
+    lift2 (class method) fn: Callable, a: Applicative, b: Applicative -> Any
+      Returns a new Applicative instance with a value property being
+      the result of 'fn' for the values of 'a' and 'b'.
+
+    liftA (class method) fn: Callable, *applicatives: Applicative -> Any
+      Returns a new Applicative instance with a value property being
+      the result of 'fn' for the values of 'applicatives'.
+
+    map (method) handle: H -> Any
+      Returns a new Applicative instance with a value property being the
+      previous instance value property once 'handle' has been applied.
+
+    ap (method) other: Applicative -> Any
+      Returns a new Applicative instance with a value property being
+      the result of the instance value for the value of 'other'.
+    """
+
+    __slots__ = ('pairs',)
+
+    def __init__(self, value: V, **kwargs) -> None:
+        """
+        Returns an Applicative instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> a = Applicative(abs)
+        >>> print(a.__class__.__name__, a.value)
+        Applicative <built-in function abs>
+        """
+        super().__init__(value)
+        self.pairs = get_pairs(kwargs)
+
+    @classmethod
+    def of(cls, value: V, **kwargs) -> Any:
+        """
+        Returns an Applicative instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> a = Applicative.of(1)
+        >>> print(a.__class__.__name__, a.value)
+        Applicative 1
+        """
+        return cls(value, **kwargs)
+
+    @classmethod
+    def lift2(cls, fn: Callable[[Any, Any], Any], a: Any, b: Any) -> Any:
+        """
+        Returns a new Applicative instance with a value property being
+        the result of 'fn' for the values of 'a' and 'b'.
+
+        >>> print(Applicative.lift2(lambda x, y: x + y, Applicative(1), Applicative(2)).value)
+        3
+        """
+        return cls.liftA(fn, a, b)
+
+    @classmethod
+    def liftA(cls, fn: Callable, *applicatives: Any) -> Any:
+        """
+        Returns a new Applicative instance with a value property being
+        the result of 'fn' for the values of 'applicatives'.
+
+        >>> print(Applicative.liftA(lambda *xs: sum(xs), *map(Applicative, [1, 2, 3])).value)
+        6
+        """
+        return cls(fn(*(applicative.value for applicative in applicatives)), **applicatives[0].pairs)
+
+    def ap(self, other: Any) -> Any:
+        """
+        Returns a new Applicative instance with a value property being
+        the result of the instance value for the value of 'other'.
+
+        >>> print(Applicative.of(lambda x: x + 1).ap(Applicative.of(1)).value)
+        2
+        """
+        return self.__class__(self.value(other.value), **self.pairs)
+
+class ApplicativeIter(PFunctorIter):
+    """
+    Stores an iterable value, incl. of functions, to be mapped by use of
+    a handler function or applied to the items of another instance,
+    and returned in a new instance, allowing method calls to be chained.
+
+    The results of ap, lift2 and liftA are iterators, each combination
+    applied as consumed, from the product of the items of the instances
+    by default or, if 'as_zip' is truthy, from the items in step.
+
+    value (attribute) Iterable[V]
+      An iterable value provided for transformation via the map method
+      or, if of functions, for application via the ap method.
+
+    const (attribute) Any = None
+      The constructor function corresponding to the value attribute type.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    pending (attribute) Optional[Tuple[Any, H]] = None
+      The handler functions pending if 'lazy' is truthy, per PFunctorIter.
+
+    of (class method) value: Iterable[V], const: Any = None -> Any
+      Returns an ApplicativeIter instance with a value property set to
+      'value' and a const property set to 'const' or per 'value'.
+
+    lift2 (class method) fn: Callable, a: ApplicativeIter, b: ApplicativeIter,
+      as_zip: bool = False, size: int = 0 -> Any
+      Returns a new ApplicativeIter instance with a value property being
+      an iterator yielding the results of 'fn' per liftA.
+
+    liftA (class method) fn: Callable, *applicatives: ApplicativeIter,
+      as_zip: bool = False, size: int = 0 -> Any
+      Returns a new ApplicativeIter instance with a value property being
+      an iterator yielding the result of 'fn' for each combination of items
+      from the values of 'applicatives', or if any 'as_zip' is truthy, for
+      the items at each position, in lists of up to 'size' if truthy.
+
+    map (method) per PFunctorIter
+
+    ap (method) other: ApplicativeIter, as_zip: bool = False, size: int = 0 -> Any
+      Returns a new ApplicativeIter instance with a value property being
+      an iterator yielding the result of each function in the instance
+      value for each item in the value of 'other' in turn, or if any
+      'as_zip' is truthy, for the item at the same position, per liftA.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def lift2(cls, fn: Callable[[Any, Any], Any], a: Any, b: Any,
+        as_zip: bool = False, size: int = 0) -> Any:
+        """
+        Returns a new ApplicativeIter instance with a value property being
+        an iterator yielding the results of 'fn' per liftA.
+
+        >>> print(list(ApplicativeIter.lift2(lambda x, y: x + y, ApplicativeIter('ab'), ApplicativeIter('xy')).value))
+        ['ax', 'ay', 'bx', 'by']
+        """
+        return cls.liftA(fn, a, b, as_zip=as_zip, size=size)
+
+    @classmethod
+    def liftA(cls, fn: Callable, *applicatives: Any, as_zip: bool = False, size: int = 0) -> Any:
+        """
+        Returns a new ApplicativeIter instance with a value property being
+        an iterator yielding the result of 'fn' for each combination of items
+        from the values of 'applicatives', the last varying fastest, or if any
+        'as_zip' is truthy, for the items at each position, in one pass,
+        in lists of up to 'size' if any 'size' is truthy, with the const and
+        pairs properties of the first, read as consumed, the rest held once.
+
+        >>> a, b = ApplicativeIter([1, 2]), ApplicativeIter([10, 20])
+        >>> print(list(ApplicativeIter.liftA(lambda x, y: x + y, a, b, as_zip=True).value))
+        [11, 22]
+        """
+        first = applicatives[0]
+        as_zip = ('as_zip' in first.pairs and first.pairs['as_zip']) or as_zip
+        values = [applicative.value for applicative in applicatives]
+        lifted = map(fn, *values) if as_zip else map_product(fn, values)
+        return cls(chunk(lifted, size) if size else lifted, first.const, **first.pairs)
+
+    def ap(self, other: Any, as_zip: bool = False, size: int = 0) -> Any:
+        """
+        Returns a new ApplicativeIter instance with a value property being
+        an iterator yielding the result of each function in the instance
+        value for each item in the value of 'other' in turn, reading from
+        the latter as consumed and holding the functions once, or if any
+        'as_zip' is truthy, for the item at the same position, per liftA.
+
+        >>> fns = ApplicativeIter([lambda x: x + 1, lambda x: x * 10])
+        >>> print(list(fns.ap(ApplicativeIter([1, 2])).value))
+        [2, 10, 3, 20]
+        """
+        as_zip = ('as_zip' in self.pairs and self.pairs['as_zip']) or as_zip
+        applied = map(get_applied, self.value, other.value) if as_zip\
+            else map_each(self.value, other.value)
+        return self.__class__(chunk(applied, size) if size else applied, self.const, **self.pairs)
+
+
+# monad classes
+
+class Monad(Generic[V]):
+    """
+    Stores a value of any type, or a prior instance and a step function
+    pending, to be applied by map or chain and returned in a new instance,
+    each step applied only once the value is read, in constant stack depth.
+
+    value (attribute) V
+      The value, once any steps pending have been applied in turn.
+
+    pairs (attribute) Mapping[str, Any] = {}
+      A read-only mapping of keyword argument settings received at
+      instantiation, shared by instances receiving the same settings.
+
+    of (class method) value: V -> Any
+      Returns a Monad instance with a value property set to 'value'.
+
+    map (method) handle: H -> Any
+      Returns a new Monad instance with a value property being the
+      previous instance value once 'handle' has been applied.
+
+    chain (method) handle: Callable[[V], Monad] -> Any
+      Returns a new Monad instance with a value property being that of
+      the instance returned by 'handle' for the previous instance value.
+
+    run (method) -> V
+      Returns the value once each step pending has been applied in turn.
+    """
+
+    __slots__ = ('_value', 'prior', 'step', 'is_map', 'pairs')
+
+    def __init__(self, value: V, **kwargs) -> None:
+        """
+        Returns a Monad instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> m = Monad(1)
+        >>> print(m.__class__.__name__, m.value)
+        Monad 1
+        """
+        self._value: Any = value
+        self.prior: Any = None
+        self.step: Any = None
+        self.is_map = False
+        self.pairs = get_pairs(kwargs)
+
+    @classmethod
+    def of(cls, value: V, **kwargs) -> Any:
+        """
+        Returns a Monad instance with a value property set to 'value'
+        and a pairs property set to the mapping of keyword arguments
+
+        >>> m = Monad.of(1)
+        >>> print(m.__class__.__name__, m.value)
+        Monad 1
+        """
+        return cls(value, **kwargs)
+
+    @property
+    def value(self) -> Any:
+        """
+        Returns the value once any steps pending have been applied in turn,
+        stored thereafter, with the prior instances released.
+
+        >>> m = Monad.of(1).map(lambda x: x + 1)
+        >>> print(m.prior is not None, m.value, m.prior)
+        True 2 None
+        """
+        if self._value is pending:
+            self._value = self.run()
+            self.prior = self.step = None
+        return self._value
+
+    def defer(self, step: Callable, is_map: bool) -> Any:
+        """
+        Returns a new Monad instance with this instance as its prior
+        and 'step' pending, a map if 'is_map' is truthy, else a chain.
+
+        >>> m = Monad.of(1).defer(lambda x: Monad.of(x + 1), False)
+        >>> print(m.prior.value, m.value)
+        1 2
+        """
+        monad = self.__class__.__new__(self.__class__)
+        monad._value = pending
+        monad.prior = self
+        monad.step = step
+        monad.is_map = is_map
+        monad.pairs = self.pairs
+        return monad
+
+    def map(self, handle: H) -> Any:
+        """
+        Returns a new Monad instance with a value property being the
+        previous instance value once 'handle' has been applied.
+
+        >>> print(Monad.of(1).map(lambda x: x + 1).map(lambda x: x * 2).value)
+        4
+        """
+        return self.defer(handle, True)
+
+    def chain(self, handle: Callable[[Any], Any]) -> Any:
+        """
+        Returns a new Monad instance with a value property being that of
+        the instance returned by 'handle' for the previous instance value.
+
+        >>> m = Monad.of(1).chain(lambda x: Monad.of(x + 1).chain(lambda y: Monad.of(y * 2)))
+        >>> print(m.value)
+        4
+        """
+        return self.defer(handle, False)
+
+    def run(self) -> Any:
+        """
+        Returns the value once each step pending has been applied in turn,
+        via an explicit stack rather than by recursion, the steps of any
+        instance returned by a chain step run before the steps following,
+        so that chains nested to any depth run in constant stack depth
+        and linear time.
+
+        >>> m = Monad.of(0)
+        >>> for _ in range(100000): m = m.chain(lambda x: Monad.of(x + 1))
+        >>> m.run()
+        100000
+        """
+        value, steps = get_steps(self)
+        stack: List[Tuple[List[Tuple[Callable, bool]], int]] = []
+        i, n = 0, len(steps)
+        while True:
+            if i == n:
+                if not stack:
+                    return value
+                steps, i = stack.pop()
+                n = len(steps)
+                continue
+            step, is_map = steps[i]
+            i += 1
+            if is_map:
+                value = step(value)
+                continue
+            monad = step(value)
+            if not isinstance(monad, Monad):
+                raise TypeError(f'chain step returned {get_class_name(monad)}, not Monad')
+            if monad._value is not pending:
+                value = monad._value
+                continue
+            if i < n:
+                stack.append((steps, i))
+            value, steps = get_steps(monad)
+            i, n = 0, len(steps)
+
+
+# applicative & monad values & functions
+
+pending = object()
+
+def get_applied(fn: Callable[[Any], Any], value: Any) -> Any:
+    """
+    Returns the result of 'fn' for 'value'.
+
+    >>> get_applied(abs, -1)
+    1
+    """
+    return fn(value)
+
+def get_steps(monad: Monad) -> Tuple[Any, List[Tuple[Callable, bool]]]:
+    """
+    Returns the value of the nearest instance prior to 'monad' with none
+    pending, or of 'monad' itself, and the steps since, in order.
+
+    >>> value, steps = get_steps(Monad.of(1).map(str))
+    >>> print(value, steps)
+    1 [(<class 'str'>, True)]
+    """
+    steps = []
+    while monad._value is pending:
+        steps.append((monad.step, monad.is_map))
+        monad = monad.prior
+    steps.reverse()
+    return monad._value, steps
@@ -0,0 +1,545 @@
+"""
+Instrumentation recording per handler function, map method, traversal
+and pipeline stage the number of calls, elements handled, cumulative and
+percentile latency and net allocation, via a Profiler instance used as
+a context manager and returned by profile, or if the PHNS_PROFILE
+environment variable is set to a path, for the whole process, written
+to that path as JSON lines on exit.
+
+While no profiler is active the classes and functions instrumented are
+the originals, unwrapped, so that disabled instrumentation has no cost.
+- classes    Stats, Probe, Profiler, JsonLines
+- functions  profile, get_active
+"""
+
+
+from typing import Callable, Iterable, List, Dict, Tuple, Any, Optional
+
+from atexit import register
+from json import dumps
+from os import environ
+from random import randrange
+from time import perf_counter
+import tracemalloc
+
+import phns.functor
+from phns.primary import Pipeline
+
+
+# instrumentation values
+
+traversals_instrumented = ('traverse_iter', 'traverse_dict', 'traverse_mixed',
+    'traverse_incremental', 'traverse_shared', 'traverse_in_place', 'traverse_selected')
+
+active: List['Profiler'] = []
+
+
+# instrumentation classes
+
+class Stats():
+    """
+    Accumulates the measurements for a single handler, map method,
+    traversal or pipeline stage, with latencies sampled for percentiles.
+
+    kind (attribute) str
+      One of 'handler', 'map', 'traversal' or 'stage'.
+
+    site (attribute) str
+      The method, traversal or pipeline position measured.
+
+    name (attribute) str
+      The name of the handler function passed or stage function called.
+
+    calls (attribute) int = 0
+      The number of calls measured.
+
+    elements (attribute) int = 0
+      The number of handler calls made in the course of those calls.
+
+    seconds (attribute) float = 0.0
+      The cumulative time taken by those calls.
+
+    allocated (attribute) int = 0
+      The net growth in memory traced, if any, across those calls.
+
+    samples (attribute) List[float] = []
+      A uniform sample of the latencies of up to 'size' calls.
+
+    add (method) seconds: float, elements: int = 1, allocated: int = 0 -> None
+      Records a call taking 'seconds' across 'elements' with net 'allocated'.
+
+    get_record (method) -> Dict[str, Any]
+      Returns a dictionary of the measurements incl. 50th, 90th and 99th percentile.
+    """
+
+    __slots__ = ('kind', 'site', 'name', 'calls', 'elements', 'seconds', 'allocated',
+        'samples', 'size')
+
+    def __init__(self, kind: str, site: str, name: str, size: int = 10000) -> None:
+        """
+        Returns a Stats instance with kind, site and name properties set to
+        'kind', 'site' and 'name', sampling the latencies of up to 'size' calls.
+
+        >>> s = Stats('handler', 'FunctorIter.map', 'incr_1')
+        >>> print(s.__class__.__name__, s.kind, s.calls)
+        Stats handler 0
+        """
+        self.kind = kind
+        self.site = site
+        self.name = name
+        self.calls = 0
+        self.elements = 0
+        self.seconds = 0.0
+        self.allocated = 0
+        self.samples: List[float] = []
+        self.size = size
+
+    def add(self, seconds: float, elements: int = 1, allocated: int = 0) -> None:
+        """
+        Records a call taking 'seconds' across 'elements' with net 'allocated',
+        replacing a random sample once 'size' are held.
+
+        >>> s = Stats('handler', 'FunctorIter.map', 'incr_1')
+        >>> s.add(0.5); s.add(1.5, 2)
+        >>> print(s.calls, s.elements, s.seconds)
+        2 3 2.0
+        """
+        self.calls += 1
+        self.elements += elements
+        self.seconds += seconds
+        self.allocated += allocated
+        if len(self.samples) < self.size:
+            self.samples.append(seconds)
+        else:
+            i = randrange(self.calls)
+            if i < self.size:
+                self.samples[i] = seconds
+
+    def get_record(self) -> Dict[str, Any]:
+        """
+        Returns a dictionary of the measurements incl. the 50th, 90th
+        and 99th percentile latency in seconds, by nearest rank.
+
+        >>> s = Stats('handler', 'FunctorIter.map', 'incr_1')
+        >>> for seconds in range(1, 101): s.add(seconds)
+        >>> r = s.get_record(); print(r['calls'], r['p50'], r['p90'], r['p99'])
+        100 50 90 99
+        """
+        ordered = sorted(self.samples)
+        get_percentile = lambda q: ordered[max(0, -(-len(ordered) * q // 100) - 1)] if ordered else 0.0
+        return {
+            'kind': self.kind, 'site': self.site, 'name': self.name,
+            'calls': self.calls, 'elements': self.elements,
+            'seconds': self.seconds, 'allocated': self.allocated,
+            'p50': get_percentile(50), 'p90': get_percentile(90), 'p99': get_percentile(99)
+        }
+
+class Probe():
+    """
+    Calls a handler function, recording each call to a Stats instance,
+    pickled as the handler alone, so unrecorded in a process pool.
+
+    fn (attribute) Callable
+      The handler function called.
+
+    stats (attribute) Stats
+      The instance to which each call is recorded.
+
+    profiler (attribute) Profiler
+      The instance counting the handler calls in total.
+
+    __call__ (method) *args: Any, **kwargs: Any -> Any
+      Returns the result of 'fn' for the arguments, recording the call.
+    """
+
+    __slots__ = ('fn', 'stats', 'profiler', '__weakref__')
+
+    def __init__(self, fn: Callable, stats: Stats, profiler: 'Profiler') -> None:
+        """
+        Returns a Probe instance with fn, stats and profiler properties
+        set to 'fn', 'stats' and 'profiler'.
+
+        >>> p = Probe(abs, Stats('handler', 'Functor.map', 'abs'), Profiler())
+        >>> print(p.__class__.__name__, p(-1), p.stats.calls)
+        Probe 1 1
+        """
+        self.fn = fn
+        self.stats = stats
+        self.profiler = profiler
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the result of 'fn' for the arguments, recording the call.
+
+        >>> p = Probe(len, Stats('handler', 'Functor.map', 'len'), Profiler())
+        >>> print(p('ab'), p.stats.elements, p.profiler.handled)
+        2 1 1
+        """
+        allocations = self.profiler.allocations
+        allocated = tracemalloc.get_traced_memory()[0] if allocations else 0
+        start = perf_counter()
+        try:
+            return self.fn(*args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            self.profiler.handled += 1
+            self.stats.add(seconds, 1,
+                tracemalloc.get_traced_memory()[0] - allocated if allocations else 0)
+
+    def __reduce__(self) -> Any:
+        """
+        Returns the pair used to pickle the instance as its fn property
+        alone, per 'get_fn', so that calls in another process are not recorded.
+
+        >>> Probe(abs, Stats('handler', 'Functor.map', 'abs'), Profiler()).__reduce__()[1]
+        (<built-in function abs>,)
+        """
+        return (get_fn, (self.fn,))
+
+class Profiler():
+    """
+    Records measurements while active, i.e. once enabled or entered as a
+    context manager, by replacing the map methods of the functor classes,
+    the traversals used by them and the call method of Pipeline with
+    instrumented versions, restoring the originals once disabled or exited,
+    when the records are passed to each sink.
+
+    sinks (attribute) Tuple[Callable[[Dict[str, Any]], Any], ...] = ()
+      The functions each passed each record once the profiler is disabled.
+
+    allocations (attribute) bool = False
+      Whether to trace the net growth in memory, via tracemalloc.
+
+    size (attribute) int = 10000
+      The number of latencies sampled per Stats instance.
+
+    stats (attribute) Dict[Tuple[str, str, str], Stats]
+      The Stats instances by kind, site and name, i.e. in memory.
+
+    handled (attribute) int = 0
+      The number of handler calls recorded in total.
+
+    enable (method) -> Profiler
+      Replaces the originals with instrumented versions and returns the instance.
+
+    disable (method) -> None
+      Restores the originals and passes each record to each sink.
+
+    get_records (method) -> List[Dict[str, Any]]
+      Returns the record for each Stats instance, slowest first.
+    """
+
+    def __init__(self, *sinks: Callable[[Dict[str, Any]], Any], allocations: bool = False,
+        size: int = 10000) -> None:
+        """
+        Returns a Profiler instance with a sinks property set to 'sinks',
+        tracing allocations if 'allocations' is truthy.
+
+        >>> p = Profiler(print)
+        >>> print(p.__class__.__name__, p.sinks, p.stats)
+        Profiler (<built-in function print>,) {}
+        """
+        self.sinks = sinks
+        self.allocations = allocations
+        self.size = size
+        self.stats: Dict[Tuple[str, str, str], Stats] = {}
+        self.probes: Dict[Tuple[str, Any], Probe] = {}
+        self.originals: List[Tuple[Any, str, Any]] = []
+        self.handled = 0
+        self.tracing = False
+
+    def __enter__(self) -> 'Profiler':
+        """
+        Returns the instance once enabled, per the enable method.
+
+        >>> with Profiler() as p: print(get_active() is p)
+        True
+        """
+        return self.enable()
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Disables the instance, per the disable method, whatever 'args'.
+
+        >>> with Profiler(): pass
+        >>> get_active() is None
+        True
+        """
+        self.disable()
+
+    def get_stats(self, kind: str, site: str, name: str) -> Stats:
+        """
+        Returns the Stats instance for 'kind', 'site' and 'name', created if none.
+
+        >>> p = Profiler()
+        >>> p.get_stats('map', 'Functor.map', 'abs') is p.get_stats('map', 'Functor.map', 'abs')
+        True
+        """
+        key = (kind, site, name)
+        if key not in self.stats:
+            self.stats[key] = Stats(kind, site, name, self.size)
+        return self.stats[key]
+
+    def get_probe(self, fn: Callable, site: str) -> Probe:
+        """
+        Returns a Probe instance calling 'fn' and recording to the Stats
+        for the handler at 'site', the same instance per 'fn' and 'site'
+        where 'fn' is hashable, so that caches keyed by handler still hit.
+
+        >>> p = Profiler()
+        >>> p.get_probe(abs, 'Functor.map') is p.get_probe(abs, 'Functor.map')
+        True
+        """
+        if isinstance(fn, Probe):
+            return fn
+        try:
+            return self.probes[(site, fn)]
+        except KeyError:
+            probe = self.probes[(site, fn)] = Probe(fn, self.get_stats('handler', site, get_name(fn)), self)
+        except TypeError:
+            probe = Probe(fn, self.get_stats('handler', site, get_name(fn)), self)
+        return probe
+
+    def measure(self, stats: Stats, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the result of 'fn' for the arguments, recording the call
+        to 'stats' with the handler calls made in its course as elements.
+
+        >>> p = Profiler()
+        >>> s = p.get_stats('map', 'Functor.map', 'abs')
+        >>> print(p.measure(s, abs, -1), s.calls, s.elements)
+        1 1 0
+        """
+        handled = self.handled
+        allocated = tracemalloc.get_traced_memory()[0] if self.allocations else 0
+        start = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            stats.add(seconds, self.handled - handled,
+                tracemalloc.get_traced_memory()[0] - allocated if self.allocations else 0)
+
+    def enable(self) -> 'Profiler':
+        """
+        Replaces the map methods of the functor classes, the traversals
+        used by them and the call method of Pipeline with instrumented
+        versions, and returns the instance, raising if any is active.
+
+        >>> from phns.functor import FunctorIter
+        >>> with Profiler() as p: print(FunctorIter([1, 2]).map(lambda x: x + 1))
+        [2, 3]
+        >>> print([(r['kind'], r['elements']) for r in p.get_records()])
+        [('map', 2), ('handler', 2)]
+        """
+        if active:
+            raise RuntimeError('a profiler is already active')
+        if self.allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.tracing = True
+        for cls in vars(phns.functor).values():
+            if isinstance(cls, type) and cls.__module__ == phns.functor.__name__ and 'map' in vars(cls):
+                self.replace(cls, 'map', get_map(self, cls.__name__, vars(cls)['map']))
+        for name in traversals_instrumented:
+            self.replace(phns.functor, name, get_traversal(self, name, getattr(phns.functor, name)))
+        self.replace(Pipeline, '__call__', get_pipeline_call(self))
+        active.append(self)
+        return self
+
+    def replace(self, owner: Any, name: str, value: Any) -> None:
+        """
+        Sets the attribute 'name' of 'owner' to 'value', with the original
+        stored to be restored by the disable method.
+
+        >>> from types import SimpleNamespace
+        >>> p, owner = Profiler(), SimpleNamespace(x=1)
+        >>> p.replace(owner, 'x', 2)
+        >>> print(owner.x, p.originals[0][1:])
+        2 ('x', 1)
+        """
+        self.originals.append((owner, name, getattr(owner, name) if owner is phns.functor
+            else vars(owner)[name]))
+        setattr(owner, name, value)
+
+    def disable(self) -> None:
+        """
+        Restores the originals and passes each record to each sink.
+
+        >>> from phns.functor import FunctorIter
+        >>> map_original = FunctorIter.map
+        >>> Profiler().enable().disable()
+        >>> FunctorIter.map is map_original
+        True
+        """
+        while self.originals:
+            owner, name, value = self.originals.pop()
+            setattr(owner, name, value)
+        if self in active:
+            active.remove(self)
+        if self.tracing:
+            tracemalloc.stop()
+            self.tracing = False
+        self.probes.clear()
+        for record in self.get_records():
+            for sink in self.sinks:
+                sink(record)
+
+    def get_records(self) -> List[Dict[str, Any]]:
+        """
+        Returns the record for each Stats instance, slowest first.
+
+        >>> p = Profiler()
+        >>> p.get_stats('map', 'Functor.map', 'abs').add(1.0)
+        >>> print([r['name'] for r in p.get_records()])
+        ['abs']
+        """
+        records = [stats.get_record() for stats in self.stats.values()]
+        return sorted(records, key=lambda record: record['seconds'], reverse=True)
+
+class JsonLines():
+    """
+    Writes each record passed as a line of JSON to a file, appending.
+
+    path (attribute) str
+      The path of the file written.
+
+    __call__ (method) record: Dict[str, Any] -> None
+      Writes 'record' as a line of JSON to the file at 'path'.
+    """
+
+    __slots__ = ('path',)
+
+    def __init__(self, path: str) -> None:
+        """
+        Returns a JsonLines instance with a path property set to 'path'.
+
+        >>> print(JsonLines('profile.jsonl').path)
+        profile.jsonl
+        """
+        self.path = path
+
+    def __call__(self, record: Dict[str, Any]) -> None:
+        """
+        Appends 'record' to the file at the path property as a JSON line.
+
+        >>> from os import path
+        >>> from tempfile import TemporaryDirectory
+        >>> with TemporaryDirectory() as directory:
+        ...     sink = JsonLines(path.join(directory, 'profile.jsonl'))
+        ...     sink({'calls': 1})
+        ...     print(open(sink.path).read(), end='')
+        {"calls": 1}
+        """
+        with open(self.path, 'a') as file:
+            file.write(dumps(record) + '\n')
+
+
+# instrumentation functions
+
+def profile(*sinks: Callable[[Dict[str, Any]], Any], allocations: bool = False,
+    size: int = 10000) -> Profiler:
+    """
+    Returns a Profiler instance to be entered as a context manager,
+    recording while active and passing each record to each of 'sinks',
+    e.g. 'list.append' for memory, a callback or a JsonLines instance.
+
+    >>> from phns.primary import pipe
+    >>> records = []
+    >>> with profile(records.append):
+    ...     print(pipe(abs, str)(-1))
+    1
+    >>> print(sorted((r['kind'], r['site'], r['name']) for r in records))
+    [('stage', 'stage 0', 'abs'), ('stage', 'stage 1', 'str')]
+    """
+    return Profiler(*sinks, allocations=allocations, size=size)
+
+def get_active() -> Optional[Profiler]:
+    """
+    Returns the Profiler instance active, or None if none is.
+
+    >>> get_active() is None
+    True
+    """
+    return active[0] if active else None
+
+def get_name(fn: Any) -> str:
+    """
+    Returns the qualified name of 'fn', or of its class if none.
+
+    >>> get_name(len), get_name(abs.__call__)
+    ('len', 'builtin_function_or_method.__call__')
+    """
+    return getattr(fn, '__qualname__', None) or get_name(fn.__class__)
+
+def get_fn(fn: Callable) -> Callable:
+    """
+    Returns 'fn', for a Probe instance unpickled as the handler it wraps.
+
+    >>> get_fn(abs) is abs
+    True
+    """
+    return fn
+
+def get_map(profiler: Profiler, site: str, map_original: Callable) -> Callable:
+    """
+    Returns a function to replace 'map_original', the map method of the
+    class named 'site', recording to 'profiler' each call to the method
+    and, via a Probe instance passed in place of the handler, each call
+    to the handler, with the docstring of 'map_original'.
+
+    >>> from phns.functor import FunctorIter
+    >>> p = Profiler()
+    >>> map = get_map(p, 'FunctorIter', FunctorIter.map)
+    >>> print(map(FunctorIter([-1, -2]), abs), p.get_stats('handler', 'FunctorIter.map', 'abs').calls)
+    [1, 2] 2
+    """
+    site = f'{site}.map'
+    def map(self: Any, handle: Callable, *args: Any, **kwargs: Any) -> Any:
+        probe = profiler.get_probe(handle, site)
+        stats = profiler.get_stats('map', site, probe.stats.name)
+        return profiler.measure(stats, map_original, self, probe, *args, **kwargs)
+    map.__doc__ = map_original.__doc__
+    return map
+
+def get_traversal(profiler: Profiler, site: str, traverse_original: Callable) -> Callable:
+    """
+    Returns a function to replace 'traverse_original', a traversal named
+    'site', recording to 'profiler' each call to the traversal, under the
+    name of the handler, or of that wrapped by any Probe instance passed.
+
+    >>> from phns.utility import traverse_iter
+    >>> p = Profiler()
+    >>> traverse = get_traversal(p, 'traverse_iter', traverse_iter)
+    >>> print(traverse(abs, [-1, [-2]]), p.get_stats('traversal', 'traverse_iter', 'abs').calls)
+    [1, [2]] 1
+    """
+    def traverse(handle: Callable, *args: Any, **kwargs: Any) -> Any:
+        stats = profiler.get_stats('traversal', site, get_name(getattr(handle, 'fn', handle)))
+        return profiler.measure(stats, traverse_original, handle, *args, **kwargs)
+    traverse.__name__ = traverse_original.__name__
+    return traverse
+
+def get_pipeline_call(profiler: Profiler) -> Callable:
+    """
+    Returns a function to replace the call method of Pipeline, recording
+    to 'profiler' each call to each stage, under the index of the stage
+    and the name of its function.
+
+    >>> from phns.primary import pipe
+    >>> p = Profiler()
+    >>> print(get_pipeline_call(p)(pipe(abs, str), -1), p.get_stats('stage', 'stage 1', 'str').calls)
+    1 1
+    """
+    def call(self: Pipeline, *args: Any, **kwargs: Any) -> Any:
+        stats = profiler.get_stats('stage', 'stage 0', get_name(self.head))
+        value = profiler.measure(stats, self.head, *args, **kwargs)
+        for i, fn in enumerate(self.rest, 1):
+            value = profiler.measure(profiler.get_stats('stage', f'stage {i}', get_name(fn)), fn, value)
+        return value
+    return call
+
+
+# process-wide instrumentation
+
+if environ.get('PHNS_PROFILE'):
+    register(profile(JsonLines(environ['PHNS_PROFILE'])).enable().disable)
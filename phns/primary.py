@@ -1,19 +1,193 @@
 """
 Higher order functions both receiving one or more functions and returning one:
-- for currying     curry, curry_n
-- for composition  compose, pipe
+- for currying     curry, curry_n, returning an instance of Curried
+- for composition  compose, pipe, returning an instance of Pipeline
+- for memoization  memoize, get_memoized, returning an instance of Memoized
 """
 
 
-from functools import reduce
-from typing import Callable, Any
+from functools import reduce, lru_cache
+from typing import Callable, Tuple, Dict, Any
+
+from weakref import WeakKeyDictionary, proxy
 
 from phns.utility import get_args
 
 
+# primary classes
+
+class Curried():
+    """
+    Collects arguments to a function in part or full, repeatedly if part,
+    delaying invocation until the number of arguments received is arity.
+
+    fn (attribute) Callable
+      The function to be invoked once the arguments are all received.
+
+    arity (attribute) int
+      The number of arguments, positional and keyword, to be received.
+
+    args (attribute) Tuple[Any, ...] = ()
+      The positional arguments received so far.
+
+    kwargs (attribute) Dict[str, Any] = {}
+      The keyword arguments received so far.
+
+    __call__ (method) *args: Any, **kwargs: Any -> Any
+      Returns the result of 'fn' if all arguments are received, otherwise
+      a new Curried instance with the arguments received so far.
+    """
+
+    __slots__ = ('fn', 'arity', 'args', 'kwargs')
+
+    def __init__(self, fn: Callable, arity: int, args: Tuple[Any, ...] = (),
+        kwargs: Dict[str, Any] = {}) -> None:
+        """
+        Returns a Curried instance with the properties 'fn', 'arity', 'args'
+        and 'kwargs' set to the values passed.
+
+        >>> c = Curried(lambda x, y: x + y, 2)
+        >>> print(c.__class__.__name__, c.arity, c.args, c.kwargs)
+        Curried 2 () {}
+        """
+        self.fn = fn
+        self.arity = arity
+        self.args = args
+        self.kwargs = kwargs
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the result of 'fn' if all arguments are received, otherwise
+        a new Curried instance with the arguments received so far.
+
+        >>> c = Curried(lambda x, y, z: x + y + z, 3)
+        >>> print(c(1)(2, z=3), c(1, 2).args)
+        6 (1, 2)
+        """
+        if not self.args and not self.kwargs:
+            if len(args) + len(kwargs) == self.arity:
+                return self.fn(*args, **kwargs)
+            return Curried(self.fn, self.arity, args, kwargs)
+        args = self.args + args
+        if self.kwargs:
+            kwargs = {**self.kwargs, **kwargs}
+        if len(args) + len(kwargs) == self.arity:
+            return self.fn(*args, **kwargs)
+        return Curried(self.fn, self.arity, args, kwargs)
+
+class Pipeline():
+    """
+    Calls a sequence of functions, the first with the initial arguments,
+    each thereafter with the last return value, any pipelines flattened.
+
+    stages (attribute) Tuple[Callable, ...]
+      The functions called, in order of calling, incl. those of pipelines.
+
+    __call__ (method) *args: Any, **kwargs: Any -> Any
+      Returns the value from the last of the stages once all are called.
+    """
+
+    __slots__ = ('stages', 'head', 'rest')
+
+    def __init__(self, *fns: Callable) -> None:
+        """
+        Returns a Pipeline instance with a stages property set to 'fns'
+        once the stages of any pipeline in 'fns' are put in its place.
+
+        >>> p = Pipeline(len, Pipeline(str, lambda x: x * 2))
+        >>> print(p.__class__.__name__, len(p.stages), p.stages[0])
+        Pipeline 3 <built-in function len>
+        """
+        if not fns:
+            raise ValueError(fns)
+        self.stages: Tuple[Callable, ...] = tuple(stage for fn in fns
+            for stage in (fn.stages if isinstance(fn, Pipeline) else (fn,)))
+        self.head = self.stages[0]
+        self.rest = self.stages[1:]
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Returns the value from the last of the stages once all are called.
+
+        >>> Pipeline(lambda x, y: x + y, lambda x: x * 2)(1, 2)
+        6
+        """
+        value = self.head(*args, **kwargs)
+        for fn in self.rest:
+            value = fn(value)
+        return value
+
+class Memoized():
+    """
+    Calls a function of one argument, caching the result per argument
+    in a least recently used cache of up to 'size' entries, the argument
+    passed through uncached if unhashable.
+
+    fn (attribute) Callable
+      The function to be called on a cache miss or unhashable argument.
+
+    cached (attribute) Callable
+      The function wrapped by 'functools.lru_cache', keyed also by type,
+      shared with other instances if returned by 'get_memoized'.
+
+    __call__ (method) arg: Any -> Any
+      Returns the result of 'fn' for 'arg', cached where 'arg' is hashable.
+
+    cache_info (method) -> Any
+      Returns the hits, misses, maxsize and currsize of the cache.
+    """
+
+    __slots__ = ('fn', 'cached', '__weakref__')
+
+    def __init__(self, fn: Callable, size: int = 1024, cached: Any = None) -> None:
+        """
+        Returns a Memoized instance with a fn property set to 'fn' and
+        a cached property wrapping 'fn' in a cache of up to 'size' entries,
+        or set to any 'cached' passed, i.e. a cache shared with others.
+
+        >>> m = Memoized(abs, 2)
+        >>> print(m.__class__.__name__, m.fn, m.cache_info().maxsize)
+        Memoized <built-in function abs> 2
+        """
+        self.fn = fn
+        self.cached = lru_cache(maxsize=size, typed=True)(fn) if cached is None else cached
+
+    def __call__(self, arg: Any) -> Any:
+        """
+        Returns the result of 'fn' for 'arg', cached where 'arg' is hashable.
+
+        >>> m = Memoized(len)
+        >>> print(m('ab'), m('ab'), m(['a']), m.cache_info().hits)
+        2 2 1 1
+        """
+        try:
+            return self.cached(arg)
+        except TypeError:
+            try:
+                hash(arg)
+            except TypeError:
+                return self.fn(arg)
+            raise
+
+    def cache_info(self) -> Any:
+        """
+        Returns the hits, misses, maxsize and currsize of the cache.
+
+        >>> m = Memoized(abs)
+        >>> print(m(-1), m(-1), m(1), m.cache_info())
+        1 1 1 CacheInfo(hits=1, misses=2, maxsize=1024, currsize=2)
+        """
+        return self.cached.cache_info()
+
+
+# primary values
+
+memos: Any = WeakKeyDictionary()
+
+
 # primary functions
 
-def curry_n(fn: Callable, n: int) -> Callable:
+def curry_n(fn: Callable, n: int) -> Curried:
     """
     Returns a function to which 'n' arguments to 'fn' can be passed in part
     or full, repeatedly if part, delaying invocation until all are received.
@@ -24,57 +198,78 @@ def curry_n(fn: Callable, n: int) -> Callable:
     >>> curry_n(sum_n, 2)(1)(2)
     3
     """
-    arity = n
-
-    def retain(*old_args, **old_kwargs):
-
-        def collect(*new_args, **new_kwargs):
-            args = (*old_args, *new_args)
-            kwargs = {**old_kwargs, **new_kwargs}
-            return fn(*args, **kwargs) if len(args) + len(kwargs) == arity\
-                else retain(*args, **kwargs)
-
-        return collect
+    return Curried(fn, n)
 
-    return retain()
-
-def curry(fn: Callable) -> Callable:
+def curry(fn: Callable) -> Curried:
     """
     Returns a function to which the arguments to 'fn' can be passed in part
     or full, repeatedly if part, delaying invocation until all are received.
 
-    Used where 'fn' is of fixed arity. Implements 'curry_n' for this number.
+    Used where 'fn' is of fixed arity, per the argument list cached for its
+    code. For variable arity or a number set explicitly, see 'curry_n'.
 
     >>> curry(lambda x, y: x + y)(1)(2)
     3
     """
-    n = len(get_args(fn))
-    return curry_n(fn, n)
+    return Curried(fn, len(get_args(fn)))
 
-def compose(*fns: Callable) -> Callable:
+def compose(*fns: Callable) -> Pipeline:
     """
-    Returns a function invoking 'fns' in sequence right to left, the first
+    Returns a pipeline invoking 'fns' in sequence right to left, the first
     with the initial arguments, each thereafter with the last return value.
 
     >>> compose(lambda x: x + 1, lambda x, y, z: x + y + z)(1, 2, 3)
     7
     """
-    return lambda *value: reduce(
-        lambda acc, fn: fn(acc),
-        list(reversed(fns))[1:] if len(fns) > 1 else [],
-        list(reversed(fns))[0](*value)
-    )
+    return Pipeline(*reversed(fns))
 
-def pipe(*fns: Callable) -> Callable:
+def pipe(*fns: Callable) -> Pipeline:
     """
-    Returns a function invoking 'fns' in sequence left to right, the first
+    Returns a pipeline invoking 'fns' in sequence left to right, the first
     with the initial arguments, each thereafter with the last return value.
 
     >>> pipe(lambda x, y, z: x + y + z, lambda x: x + 1)(1, 2, 3)
     7
     """
-    return lambda *value: reduce(
-        lambda acc, fn: fn(acc),
-        fns[1:] if len(fns) > 1 else [],
-        fns[0](*value)
-    )
+    return Pipeline(*fns)
+
+def memoize(fn: Callable, size: int = 1024) -> Memoized:
+    """
+    Returns a function calling 'fn' and caching the result per argument
+    in a least recently used cache of up to 'size' entries, or 'fn' itself
+    if already memoized, the argument passed through if unhashable.
+
+    Used where 'fn' is pure and takes one argument with few distinct values.
+
+    >>> slow_square = lambda x: x * x
+    >>> [memoize(slow_square, 2)(x) for x in [2, 2, 3]]
+    [4, 4, 9]
+    """
+    return fn if isinstance(fn, Memoized) else Memoized(fn, size)
+
+def get_memoized(fn: Callable, size: int = 1024) -> Memoized:
+    """
+    Returns a Memoized instance for 'fn' with a cache of up to 'size'
+    entries shared by each returned for both, so that results cached persist
+    across uses, e.g. maps with 'memo' set, and the cache_info method covers
+    each, the cache referring to 'fn' weakly and held for as long as 'fn'
+    exists, or per 'memoize' if 'fn' cannot be weakly referenced or is memoized.
+
+    >>> slow_square = lambda x: x * x
+    >>> [get_memoized(slow_square, 2)(x) for x in [2, 2, 3]]
+    [4, 4, 9]
+    >>> get_memoized(slow_square, 2).cache_info().hits
+    1
+    """
+    if isinstance(fn, Memoized):
+        return fn
+    try:
+        shared = memos.get(fn)
+        if shared is None:
+            shared = memos[fn] = {}
+    except TypeError:
+        return memoize(fn, size)
+    cached = shared.get(size)
+    if cached is None:
+        cached = shared[size] = lru_cache(maxsize=size, typed=True)(proxy(fn))
+    return Memoized(fn, size, cached)
@@ -0,0 +1,212 @@
+"""
+Streaming mapping of JSON documents too large to be held in memory,
+parsed incrementally from a file or file-like object, with the handler
+function applied to each leaf as parsed and the result written as it is
+produced, so that memory use is bounded by the size of the read and
+the nesting depth rather than the size of the document:
+- functions  map_json, get_tokens, get_string
+"""
+
+
+from typing import Callable, Iterator, List, Tuple, Any
+
+from codecs import getincrementaldecoder
+from contextlib import ExitStack
+from json import JSONEncoder, JSONDecodeError
+from importlib import import_module
+from os import PathLike
+from re import compile
+
+
+# standard library internals, i.e. the functions used by json, untyped
+
+scanstring: Any = import_module('json.decoder').scanstring
+encode_basestring_ascii: Any = import_module('json.encoder').encode_basestring_ascii
+NUMBER_RE: Any = import_module('json.scanner').NUMBER_RE
+
+
+# stream values
+
+# - per token, after any whitespace, either punctuation, a string body or other scalar text
+tokens = compile(r'[ \t\n\r]*(?:([{}\[\]:,])|"([^"\\\x00-\x1f]*(?:\\.[^"\\\x00-\x1f]*)*)"|([^ \t\n\r{}\[\]:,"]+))')
+
+literals = {
+    'true':      True,
+    'false':     False,
+    'null':      None,
+    'NaN':       float('nan'),
+    'Infinity':  float('inf'),
+    '-Infinity': float('-inf')
+}
+
+
+# stream functions
+
+def map_json(handle: Callable[[Any], Any], source: Any, target: Any, size: int = 65536,
+    separators: Tuple[str, str] = (', ', ': ')) -> Any:
+    """
+    Returns 'target', a text stream or path, once the JSON read from
+    'source', a text or binary stream or path, has been written to it with
+    'handle' applied to each value in each array and object not itself an
+    array or object, as would be the tree returned by 'json.load' mapped
+    per 'traverse_mixed' in utility then passed to 'json.dump'.
+
+    The document is read 'size' characters or bytes at a time and written
+    in parts as each fills, with the items and the keys and values in each
+    array and object separated per 'separators'. Raises a ValueError where
+    the document is not valid JSON, the mapping written to that point.
+
+    >>> from io import StringIO
+    >>> target = map_json(lambda x: x * 2, StringIO('{"a": [1, {"b": "c"}]}'), StringIO())
+    >>> target.getvalue()
+    '{"a": [2, {"b": "cc"}]}'
+    """
+    with ExitStack() as files:
+        if isinstance(source, (str, PathLike)):
+            source = files.enter_context(open(source, 'rb'))
+        output = files.enter_context(open(target, 'w', encoding='utf-8'))\
+            if isinstance(target, (str, PathLike)) else target
+        encode = JSONEncoder(separators=separators).encode
+        item_sep, key_sep = separators
+        write = output.write
+        parts: List[str] = []
+        append = parts.append
+        stack: List[str] = []
+        state = 'value'
+        for kind, value in get_tokens(source, size):
+            if state == 'next':
+                if kind == ',':
+                    append(item_sep)
+                    state = 'key' if stack[-1] == '{' else 'value'
+                    continue
+                closing = '}' if stack[-1] == '{' else ']'
+                if kind != closing:
+                    raise ValueError(f'expected , or {closing}, got {kind}')
+                append(kind)
+                stack.pop()
+                state = 'next' if stack else 'end'
+            elif state == 'key' or state == 'first':
+                if kind == '}' and state == 'first':
+                    append(kind)
+                    stack.pop()
+                    state = 'next' if stack else 'end'
+                    continue
+                if kind != 'string':
+                    raise ValueError(f'expected key, got {kind}')
+                append(encode_basestring_ascii(value))
+                state = 'colon'
+            elif state == 'colon':
+                if kind != ':':
+                    raise ValueError(f'expected :, got {kind}')
+                append(key_sep)
+                state = 'value'
+            elif state == 'value' or state == 'item':
+                if kind == 'string' or kind == 'scalar':
+                    value = handle(value)
+                    if value.__class__ is str:
+                        append(encode_basestring_ascii(value))
+                    elif value.__class__ is int or value.__class__ is float and value - value == 0:
+                        append(value.__repr__())
+                    else:
+                        append(encode(value))
+                    state = 'next' if stack else 'end'
+                elif kind == '{' or kind == '[':
+                    append(kind)
+                    stack.append(kind)
+                    state = 'first' if kind == '{' else 'item'
+                elif kind == ']' and state == 'item':
+                    append(kind)
+                    stack.pop()
+                    state = 'next' if stack else 'end'
+                else:
+                    raise ValueError(f'expected value, got {kind}')
+            else:
+                raise ValueError(f'expected end, got {kind}')
+            if len(parts) >= 1024:
+                write(''.join(parts))
+                parts.clear()
+        if state != 'end':
+            raise ValueError('unexpected end')
+        write(''.join(parts))
+    return target
+
+def get_tokens(source: Any, size: int = 65536) -> Iterator[Tuple[str, Any]]:
+    """
+    Returns an iterator yielding a pair for each token in the JSON read
+    from 'source', a text or binary stream, 'size' characters or bytes
+    at a time, the kind, i.e. the character for each of '{', '}', '[', ']',
+    ':' and ',' or else 'string' or 'scalar', followed by the value,
+    decoded as per 'json.load'. Only the unread part of the current read
+    is held, extended where a token crosses into the next, so that memory
+    use is bounded by 'size' and the largest token.
+
+    Raises a ValueError on reaching a token not valid JSON.
+
+    >>> from io import BytesIO
+    >>> list(get_tokens(BytesIO(b'{"a": [1.5, null]}'), 4))[1:5]
+    [('string', 'a'), (':', ':'), ('[', '['), ('scalar', 1.5)]
+    """
+    read = source.read
+    decode = None
+    buffer, offset, is_done = '', 0, False
+    while not is_done:
+        chunk = read(max(size, len(buffer)))
+        if isinstance(chunk, bytes):
+            if decode is None:
+                decode = getincrementaldecoder('utf-8')().decode
+            chunk = decode(chunk, not chunk)
+        is_done = not chunk
+        buffer += chunk
+        end, length = 0, len(buffer)
+        for match in tokens.finditer(buffer):
+            if match.start() != end:
+                break
+            index = match.lastindex
+            if index == 1:
+                char = match.group(1)
+                yield char, char
+            elif index == 2:
+                value = match.group(2)
+                if '\\' in value:
+                    value = get_string(buffer, match.start(2), offset)
+                yield 'string', value
+            else:
+                if match.end() == length and not is_done:
+                    break
+                text = match.group(3)
+                if text in literals:
+                    yield 'scalar', literals[text]
+                else:
+                    number = NUMBER_RE.fullmatch(text)
+                    if number is None:
+                        raise ValueError(f'invalid value at {offset + match.start(3)}: {text[:32]!r}')
+                    integer, fraction, exponent = number.groups()
+                    yield 'scalar', float(text) if fraction or exponent else int(integer)
+            end = match.end()
+        rest = buffer[end:].lstrip(' \t\n\r')
+        if rest[:1] == '"':
+            get_string(rest, 1, offset + length - len(rest), is_done)
+        elif is_done and rest:
+            raise ValueError(f'invalid value at {offset + length - len(rest)}: {rest[:32]!r}')
+        offset += end
+        buffer = buffer[end:]
+
+def get_string(buffer: str, pos: int, offset: int = 0, is_done: bool = True) -> str:
+    """
+    Returns the string decoded from the JSON in 'buffer' from the first
+    character after the opening quote at 'pos', or an empty string if it
+    may yet be completed, i.e. 'is_done' is falsy and it is unterminated,
+    with 'offset' the position of 'buffer' in the document.
+
+    Raises a ValueError if the string is not valid JSON.
+
+    >>> get_string('"a\\\\u00e9"', 1), get_string('"ab', 1, 0, False)
+    ('aé', '')
+    """
+    try:
+        return scanstring(buffer, pos)[0]
+    except JSONDecodeError as error:
+        if is_done or error.msg != 'Unterminated string starting at'\
+            and (error.msg != 'Invalid \\uXXXX escape' or error.pos < len(buffer) - 6):
+            raise ValueError(f'invalid string at {offset + pos - 1}: {error.msg}') from None
+        return ''
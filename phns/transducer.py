@@ -0,0 +1,249 @@
+"""
+Transducers, i.e. functions receiving a reducer and returning another
+applying a transformation step first, composable via compose and pipe
+in the module 'phns/primary.py', and functions running them in one pass:
+- classes      Reducer, Reduced
+- transducers  mapping, filtering, taking, partitioning
+- runners      transduce, into, sequence
+
+Where composed via compose, the steps apply to each item in the order
+listed, i.e. left to right, and where via pipe, right to left.
+"""
+
+
+from typing import Callable, Iterable, Iterator, List, Any
+
+from phns.functor import Functor, FunctorIter, FunctorDict, FunctorStream, FunctorArray
+
+
+# transducer classes
+
+class Reducer():
+    """
+    Holds the step function combining an accumulated value with an item,
+    and the completion function called once with the accumulated value.
+
+    step (attribute) Callable[[Any, Any], Any]
+      The function returning the accumulated value combined with an item,
+      or an instance of Reduced holding it to terminate early.
+
+    complete (attribute) Callable[[Any], Any] = identity
+      The function returning the final value from that accumulated.
+    """
+
+    __slots__ = ('step', 'complete')
+
+    def __init__(self, step: Callable[[Any, Any], Any],
+        complete: Callable[[Any], Any] = lambda acc: acc) -> None:
+        """
+        Returns a Reducer instance with step and complete properties
+        set to 'step' and 'complete'.
+
+        >>> r = Reducer(lambda acc, x: acc + x)
+        >>> print(r.__class__.__name__, r.step(1, 2), r.complete(3))
+        Reducer 3 3
+        """
+        self.step = step
+        self.complete = complete
+
+class Reduced():
+    """
+    Holds an accumulated value returned by a step to terminate early.
+
+    value (attribute) Any
+      The accumulated value.
+    """
+
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any) -> None:
+        """
+        Returns a Reduced instance with a value property set to 'value'.
+
+        >>> r = Reduced(1)
+        >>> print(r.__class__.__name__, r.value)
+        Reduced 1
+        """
+        self.value = value
+
+
+Transducer = Callable[[Reducer], Reducer]
+
+
+# transducer functions
+
+def mapping(handle: Callable[[Any], Any]) -> Transducer:
+    """
+    Returns a transducer passing on the result of 'handle' for each item.
+
+    >>> transduce(mapping(lambda x: x + 1), lambda acc, x: acc + x, 0, [1, 2, 3])
+    9
+    """
+    def transduce(reducer: Reducer) -> Reducer:
+        step = reducer.step
+        return Reducer(lambda acc, item: step(acc, handle(item)), reducer.complete)
+    return transduce
+
+def filtering(predicate: Callable[[Any], Any]) -> Transducer:
+    """
+    Returns a transducer passing on each item for which 'predicate' is truthy.
+
+    >>> into([], filtering(lambda x: x % 2), [1, 2, 3])
+    [1, 3]
+    """
+    def transduce(reducer: Reducer) -> Reducer:
+        step = reducer.step
+        return Reducer(lambda acc, item: step(acc, item) if predicate(item) else acc, reducer.complete)
+    return transduce
+
+def taking(n: int) -> Transducer:
+    """
+    Returns a transducer passing on up to the first 'n' items, terminating
+    once the last is passed, so that no further item is read.
+
+    >>> from itertools import count
+    >>> into([], taking(3), count())
+    [0, 1, 2]
+    """
+    def transduce(reducer: Reducer) -> Reducer:
+        step = reducer.step
+        remaining = n
+        def take(acc: Any, item: Any) -> Any:
+            nonlocal remaining
+            if remaining <= 0:
+                return Reduced(acc)
+            remaining -= 1
+            acc = step(acc, item)
+            return acc if remaining or acc.__class__ is Reduced else Reduced(acc)
+        return Reducer(take, reducer.complete)
+    return transduce
+
+def partitioning(size: int) -> Transducer:
+    """
+    Returns a transducer passing on lists of 'size' consecutive items,
+    the last on completion holding any fewer remaining.
+
+    >>> into([], partitioning(2), [1, 2, 3])
+    [[1, 2], [3]]
+    """
+    if size < 1:
+        raise ValueError(size)
+    def transduce(reducer: Reducer) -> Reducer:
+        step, complete = reducer.step, reducer.complete
+        buffer: List[Any] = []
+        def partition(acc: Any, item: Any) -> Any:
+            nonlocal buffer
+            buffer.append(item)
+            if len(buffer) < size:
+                return acc
+            full, buffer = buffer, []
+            return step(acc, full)
+        def flush(acc: Any) -> Any:
+            nonlocal buffer
+            if buffer:
+                rest, buffer = buffer, []
+                acc = step(acc, rest)
+                acc = acc.value if acc.__class__ is Reduced else acc
+            return complete(acc)
+        return Reducer(partition, flush)
+    return transduce
+
+
+# runner functions
+
+def transduce(transducer: Transducer, fn: Any, init: Any, source: Any) -> Any:
+    """
+    Returns 'init' combined with each item from 'source' in a single pass
+    via the reducer from 'transducer' for 'fn', a Reducer instance or step
+    function, stopping early where a step returns an instance of Reduced.
+
+    The 'source' is any iterable or functor instance, the latter read
+    per 'get_items'.
+
+    >>> from phns.primary import compose
+    >>> xf = compose(filtering(lambda x: x % 2), mapping(lambda x: x * 10), taking(2))
+    >>> transduce(xf, lambda acc, x: acc + x, 0, range(100))
+    40
+    """
+    reducer = transducer(fn if isinstance(fn, Reducer) else Reducer(fn))
+    step = reducer.step
+    acc = init
+    for item in get_items(source):
+        acc = step(acc, item)
+        if acc.__class__ is Reduced:
+            acc = acc.value
+            break
+    return reducer.complete(acc)
+
+def into(to: Any, transducer: Transducer, source: Any) -> Any:
+    """
+    Returns a value of the type of 'to' holding its items followed by
+    those passed on by 'transducer' from 'source', in a single pass, with
+    items added in place to a copy of a list, set or dictionary, the last
+    from key-value pairs, and otherwise collected and 'to' rebuilt.
+
+    >>> from phns.functor import FunctorIter
+    >>> into((0,), mapping(lambda x: x + 1), FunctorIter([1, 2]))
+    (0, 2, 3)
+    """
+    const = to.__class__
+    if const is list or const is set:
+        built = const(to)
+        add = built.append if const is list else built.add
+        def step(acc: Any, item: Any) -> Any:
+            add(item)
+            return acc
+        return transduce(transducer, step, built, source)
+    if isinstance(to, dict):
+        built = to.copy()
+        def step_pair(acc: Any, pair: Any) -> Any:
+            acc[pair[0]] = pair[1]
+            return acc
+        return transduce(transducer, step_pair, built, source)
+    items = into(list(to), transducer, source)
+    return ''.join(items) if isinstance(to, str) else const(items)
+
+def sequence(transducer: Transducer, source: Any) -> Iterator[Any]:
+    """
+    Returns an iterator yielding the items passed on by 'transducer' from
+    'source' as consumed, reading from 'source' only as required, e.g.
+    to pass an iterator to an instance of the -Stream classes.
+
+    >>> from itertools import count
+    >>> items = sequence(mapping(lambda x: x * 2), count())
+    >>> next(items), next(items)
+    (0, 2)
+    """
+    buffer: List[Any] = []
+    def step(acc: Any, item: Any) -> Any:
+        buffer.append(item)
+        return acc
+    reducer = transducer(Reducer(step))
+    step_outer = reducer.step
+    for item in get_items(source):
+        acc = step_outer(None, item)
+        if buffer:
+            yield from buffer
+            buffer.clear()
+        if acc.__class__ is Reduced:
+            break
+    reducer.complete(None)
+    yield from buffer
+
+def get_items(source: Any) -> Iterable[Any]:
+    """
+    Returns the items of 'source', if a functor instance its value,
+    for one of the -Dict classes its key-value pairs, for a base functor
+    its value as a single item, and otherwise 'source' itself.
+
+    >>> from phns.functor import FunctorDict
+    >>> list(get_items(FunctorDict({'a': 1}))), get_items([1])
+    ([('a', 1)], [1])
+    """
+    if isinstance(source, (FunctorIter, FunctorStream, FunctorArray)):
+        return source.value
+    if isinstance(source, FunctorDict):
+        return source.value.items()
+    if isinstance(source, Functor):
+        return (source.value,)
+    return source
@@ -1,12 +1,40 @@
 """
 Higher order functions ('secondary') and first order functions ('tertiary').
-- secondary  traverse_iter, traverse_dict, get_args
-- tertiary   get_constructor, get_class_name
+- secondary  traverse_iter, traverse_dict, traverse_mixed, traverse_pooled,
+             traverse_gathered, traverse_incremental, traverse_changed,
+             traverse_shared, traverse_in_place, traverse_selected,
+             map_pooled, map_chunk, map_gathered, map_array, map_ndarray,
+             map_translated, map_in_place, map_product, map_each, fuse, chunk,
+             get_leaves, get_args
+- tertiary   get_traversals, is_translatable, get_table, get_dict,
+             get_controls, clear_increments, compile_selector, get_code_args,
+             get_pairs, get_constructor, get_class_name
 """
 
 
-from typing import TypeVar, Callable, Iterable, List, Dict, Any
+from typing import TypeVar, Callable, Iterable, Iterator, List, Dict, Tuple, Mapping, Sequence, Any
+from itertools import islice, product, starmap
+from operator import is_
+from functools import lru_cache
 from inspect import getfullargspec
+from types import CodeType, MappingProxyType
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from os import cpu_count
+from asyncio import gather
+from inspect import isawaitable
+from importlib import import_module
+from array import array
+from weakref import WeakKeyDictionary
+from collections import OrderedDict
+from copy import copy
+
+
+# optional dependencies
+
+try:
+    numpy: Any = import_module('numpy')
+except ImportError:
+    numpy = None
 
 
 # types
@@ -15,42 +43,1020 @@ V = TypeVar('V')
 H = Callable[[V], V]
 
 
+# utility values
+
+traversals: Dict[Any, Any] = {
+    list:      (iter, lambda tree, built: built),
+    tuple:     (iter, lambda tree, built: tuple(built)),
+    set:       (iter, lambda tree, built: set(built)),
+    frozenset: (iter, lambda tree, built: frozenset(built)),
+    bytearray: (iter, lambda tree, built: bytearray(built)),
+    dict:      (lambda tree: iter(tree.values()), lambda tree, built: dict(zip(tree, built)))
+}
+
+
+dicts: Dict[Any, Any] = {dict: dict, OrderedDict: OrderedDict}
+
+
+pairs_empty: Mapping[str, Any] = MappingProxyType({})
+pairs_scalars = frozenset({bool, int, float, str, bytes, type(None)})
+
+
+tables: Dict[Any, Any] = {str: WeakKeyDictionary(), bytes: WeakKeyDictionary()}
+tables[bytearray] = tables[bytes]
+
+
+increments: Any = WeakKeyDictionary()
+
+
+# - the most handlers applied via map iterators nested, beyond which applied by one function
+fuse_depth = 32
+
+
 # secondary functions
 
-def traverse_iter(handle: H, tree: Iterable[V], const: Any = list) -> Iterable[V]:
+def traverse_iter(handle: H, tree: Iterable[V], const: Any = list,
+    prune: Any = None, max_depth: int = 0, is_leaf: Any = None) -> Iterable[V]:
     """
     Returns an instance of 'const' mapped from 'tree' by applying 'handle'
-    to each value in an instance of 'const' not itself an instance.
+    to each value in an instance of 'const' not itself an instance, with
+    each nested instance for which any 'prune' is truthy retained as is,
+    and each for which any 'is_leaf' is truthy or nested more than any
+    'max_depth' levels deep, 'tree' the first, passed to 'handle' whole.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
 
     >>> traverse_iter(lambda x: x + 1, [1, [2, 3]])
     [2, [3, 4]]
+    >>> traverse_iter(str, [1, [2, [3]], [4, 5]], list, lambda node: 5 in node, 2)
+    ['1', ['2', '[3]'], [4, 5]]
     """
-    return const(handle(node) if not isinstance(node, const)
-        else traverse_iter(handle, node, const) for node in tree)
+    stack: List[Any] = [(iter(tree), [])]
+    while True:
+        nodes, built = stack[-1]
+        for node in nodes:
+            if isinstance(node, const):
+                if prune is not None and prune(node):
+                    built.append(node)
+                    continue
+                if (max_depth and len(stack) >= max_depth) or (is_leaf is not None and is_leaf(node)):
+                    built.append(handle(node))
+                    continue
+                stack.append((iter(node), []))
+                break
+            built.append(handle(node))
+        else:
+            stack.pop()
+            value = const(built)
+            if not stack:
+                return value
+            stack[-1][1].append(value)
 
-def traverse_dict(handle: H, tree: Dict[Any, V]) -> Dict[Any, Any]:
+def traverse_dict(handle: H, tree: Dict[Any, V],
+    prune: Any = None, max_depth: int = 0, is_leaf: Any = None) -> Dict[Any, Any]:
     """
     Returns a dictionary mapped from 'tree' by applying 'handle'
-    to each value in a dictionary not itself a dictionary.
+    to each value in a dictionary not itself a dictionary, each rebuilt
+    as its own type per 'get_dict' if a subclass, with each
+    nested dictionary for which any 'prune' is truthy retained as is,
+    and each for which any 'is_leaf' is truthy or nested more than any
+    'max_depth' levels deep, 'tree' the first, passed to 'handle' whole.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
 
     >>> traverse_dict(lambda x: x + 1, {'a': 1, 'b': {'c': 2}})
     {'a': 2, 'b': {'c': 3}}
+    >>> traverse_dict(str, {'a': 1, 'b': {'c': {'d': 2}}, 'e': {}}, lambda node: not node, 2)
+    {'a': '1', 'b': {'c': "{'d': 2}"}, 'e': {}}
+    """
+    stack: List[Any] = [(None, tree, iter(tree.items()), {})]
+    while True:
+        _, _, items, built = stack[-1]
+        for k, v in items:
+            if isinstance(v, dict):
+                if prune is not None and prune(v):
+                    built[k] = v
+                    continue
+                if (max_depth and len(stack) >= max_depth) or (is_leaf is not None and is_leaf(v)):
+                    built[k] = handle(v)
+                    continue
+                stack.append((k, v, iter(v.items()), {}))
+                break
+            built[k] = handle(v)
+        else:
+            k, node, _, value = stack.pop()
+            if node.__class__ is not dict:
+                value = get_dict(node, value.values())
+            if not stack:
+                return value
+            stack[-1][3][k] = value
+
+def traverse_mixed(handle: H, tree: Any, table: Dict[Any, Any] = traversals) -> Any:
+    """
+    Returns a value mapped from 'tree' by applying 'handle' to each value
+    not itself of a type in 'table', rebuilding each container by type,
+    in any mix of list, tuple, set, frozenset, bytearray and dictionary.
+
+    Each entry in 'table' pairs a function returning the nodes of a tree
+    with a function rebuilding it from the tree and the list of results.
+
+    >>> traverse_mixed(lambda x: x + 1, {'a': [1, (2, 3)], 'b': {'c': 4}})
+    {'a': [2, (3, 4)], 'b': {'c': 5}}
+    """
+    get_entry = table.get
+    entry = get_entry(tree.__class__)
+    if entry is None:
+        return handle(tree)
+    stack: List[Any] = [(tree, entry[0](tree), [], entry[1])]
+    while True:
+        nodes, built = stack[-1][1:3]
+        for node in nodes:
+            entry = get_entry(node.__class__)
+            if entry is not None:
+                stack.append((node, entry[0](node), [], entry[1]))
+                break
+            built.append(handle(node))
+        else:
+            tree, _, built, rebuild = stack.pop()
+            value = rebuild(tree, built)
+            if not stack:
+                return value
+            stack[-1][2].append(value)
+
+def traverse_pooled(traverse: Callable, handle: H, tree: Any, *args: Any,
+    workers: int = 0, executor: Any = None) -> Any:
+    """
+    Returns the result of 'traverse' for 'handle', 'tree' and any 'args',
+    if any 'workers' or 'executor' with 'handle' applied to the values
+    collected by a first traversal via 'map_pooled', then placed in order.
+
+    >>> traverse_pooled(traverse_iter, lambda x: x + 1, [1, [2, 3]], workers=2)
+    [2, [3, 4]]
+    """
+    if not workers and executor is None:
+        return traverse(handle, tree, *args)
+    leaves = get_leaves(traverse, tree, *args)
+    mapped = iter(map_pooled(handle, leaves, workers, executor))
+    return traverse(lambda leaf: next(mapped), tree, *args)
+
+async def traverse_gathered(traverse: Callable, handle: Callable, tree: Any, *args: Any,
+    limit: int = 0) -> Any:
+    """
+    Returns the result of 'traverse' for 'handle', 'tree' and any 'args',
+    with 'handle' applied to the values collected by a first traversal
+    via 'map_gathered' for up to 'limit' at once, then placed in order.
+
+    >>> from asyncio import run, sleep
+    >>> async def incr_1(x): await sleep(0); return x + 1
+    >>> run(traverse_gathered(traverse_iter, incr_1, [1, [2, 3]], limit=2))
+    [2, [3, 4]]
+    """
+    leaves = get_leaves(traverse, tree, *args)
+    mapped = iter(await map_gathered(handle, leaves, limit))
+    return traverse(lambda leaf: next(mapped), tree, *args)
+
+def traverse_incremental(handle: H, tree: Any, const: Any = dict, key: Any = None,
+    since: Any = None, version: Any = None) -> Any:
+    """
+    Returns the result of 'traverse_dict' for 'handle' and 'tree' if 'const'
+    is dict, otherwise of 'traverse_iter' for 'const', reusing the result
+    mapped from an earlier tree for each subtree or value that is the same
+    object as at the same key or index in that tree, or for a subtree of
+    the same, not None, version per any 'version' function passed, so that
+    'handle' is applied only to values new or replaced since.
+
+    The earlier tree and result are taken from 'since' where passed as a
+    pair, with nothing then retained, otherwise from the last call for
+    'key' or 'handle', retained for as long as either exists or until
+    cleared via 'clear_increments', so that trees mapped independently
+    by the same function should each be passed with their own 'since'.
+
+    Note that each tree passed, and each result, is therefore assumed
+    not to be changed in place once mapped, and 'handle' to be pure.
+
+    >>> incr_1 = lambda x: x + 1
+    >>> tree = {'a': {'b': 1}, 'c': 2}
+    >>> mapped = traverse_incremental(incr_1, tree)
+    >>> remapped = traverse_incremental(incr_1, {**tree, 'c': 3})
+    >>> print(remapped, remapped['a'] is mapped['a'])
+    {'a': {'b': 2}, 'c': 4} True
+    >>> traverse_incremental(incr_1, {'a': {'b': 5}, 'c': 3}, dict, None, (tree, mapped))
+    {'a': {'b': 6}, 'c': 4}
+    """
+    if since is not None:
+        tree_last, value_last = since
+        return traverse_changed(handle, tree, tree_last, value_last, const, version)
+    key = handle if key is None else key
+    try:
+        last = increments.get(key)
+    except TypeError:
+        key = last = None
+    if last is None or last[2] is not const:
+        value = traverse_dict(handle, tree) if const is dict else traverse_iter(handle, tree, const)
+    else:
+        tree_last, value_last, _ = last
+        value = traverse_changed(handle, tree, tree_last, value_last, const, version)
+    if key is not None:
+        increments[key] = (tree, value, const)
+    return value
+
+def traverse_changed(handle: H, tree: Any, tree_last: Any, value_last: Any, const: Any = dict,
+    version: Any = None) -> Any:
+    """
+    Returns a value mapped from 'tree' by applying 'handle' to each value
+    per 'traverse_incremental', where 'value_last' was mapped from 'tree_last',
+    with each node rebuilt only if changed, otherwise taken from 'value_last',
+    a subtree being unchanged if the same object as that at the same key
+    or index in 'tree_last' or, for any 'version', of the same version.
+    A tree to be rebuilt by a 'const' other than dict or a sequence class,
+    e.g. set or frozenset, having no index by which to match each value,
+    is instead mapped in full via 'traverse_iter' unless unchanged itself.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
+
+    >>> tree = [1, [2, 3]]
+    >>> mapped = traverse_changed(lambda x: x + 1, [0, tree[1]], tree, [2, [3, 4]], list)
+    >>> print(mapped)
+    [1, [3, 4]]
+    """
+    def is_current(node: Any, node_last: Any) -> bool:
+        stamp = version(node)
+        return stamp is not None and stamp == version(node_last)
+    if tree is tree_last or (version is not None and is_current(tree, tree_last)):
+        return value_last
+    as_dict = const is dict
+    if not as_dict and not (isinstance(const, type) and issubclass(const, Sequence)
+        and isinstance(tree_last, Sequence) and isinstance(value_last, Sequence)):
+        return traverse_iter(handle, tree, const)
+    missing = object()
+    def get_nodes(tree: Any) -> Iterator[Any]:
+        return iter(tree.items()) if as_dict else enumerate(tree)
+    def get_last(tree: Any, k: Any) -> Any:
+        return tree.get(k, missing) if as_dict else tree[k] if k < len(tree) else missing
+    stack: List[Any] = [(None, tree, get_nodes(tree), {} if as_dict else [], tree_last, value_last)]
+    while True:
+        _, _, nodes, built, tree_last, value_last = stack[-1]
+        for k, node in nodes:
+            node_last = get_last(tree_last, k)
+            if node is node_last or (version is not None and isinstance(node, const)
+                and isinstance(node_last, const) and is_current(node, node_last)):
+                value = value_last[k]
+            elif isinstance(node, const):
+                if isinstance(node_last, const):
+                    stack.append((k, node, get_nodes(node), {} if as_dict else [], node_last, value_last[k]))
+                    break
+                value = traverse_dict(handle, node) if as_dict else traverse_iter(handle, node, const)
+            else:
+                value = handle(node)
+            if as_dict:
+                built[k] = value
+            else:
+                built.append(value)
+        else:
+            k, node, _, built, _, value_last = stack.pop()
+            values = built.values() if as_dict else built
+            values_last = value_last.values() if as_dict else value_last
+            if len(built) == len(value_last) and all(map(is_, values, values_last))\
+                and (not as_dict or list(built) == list(value_last)):
+                value = value_last
+            elif as_dict:
+                value = built if node.__class__ is dict else get_dict(node, built.values())
+            else:
+                value = const(built)
+            if not stack:
+                return value
+            if as_dict:
+                stack[-1][3][k] = value
+            else:
+                stack[-1][3].append(value)
+
+def traverse_shared(handle: H, tree: Any, table: Dict[Any, Any] = traversals) -> Any:
+    """
+    Returns a value mapped from 'tree' per 'traverse_mixed', with each
+    container mapped once however often reached, the result reused, so that
+    any sharing of containers in 'tree' is preserved, as is each cycle,
+    i.e. container reached again from within itself, if a list or dictionary.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
+
+    >>> shared = [1]
+    >>> mapped = traverse_shared(lambda x: x + 1, {'a': shared, 'b': shared})
+    >>> print(mapped, mapped['a'] is mapped['b'])
+    {'a': [2], 'b': [2]} True
+    >>> cyclic = [1]; cyclic.append(cyclic)
+    >>> mapped = traverse_shared(lambda x: x + 1, cyclic)
+    >>> print(mapped, mapped[1] is mapped)
+    [2, [...]] True
+    """
+    get_entry = table.get
+    entry = get_entry(tree.__class__)
+    if entry is None:
+        return handle(tree)
+    pending = object()
+    mapped: Dict[int, Any] = {}
+    stack: List[Any] = []
+    def push(node: Any, entry: Any) -> None:
+        built: List[Any] = []
+        mapped[id(node)] = built if node.__class__ is list else {} if node.__class__ is dict else pending
+        stack.append((node, entry[0](node), built, entry[1]))
+    push(tree, entry)
+    while True:
+        nodes, built = stack[-1][1:3]
+        for node in nodes:
+            entry = get_entry(node.__class__)
+            if entry is None:
+                built.append(handle(node))
+            elif id(node) not in mapped:
+                push(node, entry)
+                break
+            elif mapped[id(node)] is pending:
+                raise ValueError(f'cycle via {node.__class__.__name__}, not list or dict')
+            else:
+                built.append(mapped[id(node)])
+        else:
+            tree, _, built, rebuild = stack.pop()
+            value = mapped[id(tree)]
+            if tree.__class__ is dict:
+                value.update(zip(tree, built))
+            elif tree.__class__ is not list:
+                value = mapped[id(tree)] = rebuild(tree, built)
+            if not stack:
+                return value
+            stack[-1][2].append(value)
+
+def traverse_in_place(handle: H, tree: Any, const: Any = None, as_graph: bool = False,
+    prune: Any = None, max_depth: int = 0, is_leaf: Any = None) -> Any:
+    """
+    Returns 'tree' once 'handle' has been applied to each value in it
+    not itself a container and each result written back in its place,
+    where 'const' is passed descending into each instance of 'const',
+    otherwise into each container of a type in 'traversals', with each
+    bytearray reached updated per 'map_in_place' and, if 'as_graph' is
+    truthy, each container updated once however often reached, incl. from
+    within itself, and per 'traverse_iter' for any 'prune', 'max_depth'
+    and 'is_leaf'. Raises a TypeError if 'tree' or any container reached
+    is not a list, bytearray or dictionary, e.g. is a tuple, rather than
+    copying it, before any value is updated.
+
+    Unless 'const' is a list, bytearray or dictionary type, the containers
+    reached are checked in a first pass not calling 'handle', so that any
+    'prune' and 'is_leaf' are called twice for each container checked.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
+
+    >>> tree = {'a': [1, 2], 'b': {'c': 3}}
+    >>> traverse_in_place(lambda x: x + 1, tree) is tree, tree
+    (True, {'a': [2, 3], 'b': {'c': 4}})
+    >>> tree = [1, [2], (3,)]
+    >>> traverse_in_place(lambda x: x + 1, tree)
+    Traceback (most recent call last):
+    TypeError: cannot map tuple in place, not list, bytearray or dict
+    >>> tree
+    [1, [2], (3,)]
+    """
+    def get_items(node: Any, write: bool) -> Any:
+        if isinstance(node, list):
+            return enumerate(node)
+        if isinstance(node, dict):
+            return iter(node.items())
+        if isinstance(node, bytearray):
+            if write:
+                map_in_place(handle, node)
+            return iter(())
+        raise TypeError(f'cannot map {node.__class__.__name__} in place, not list, bytearray or dict')
+    def walk(write: bool) -> None:
+        seen = {id(tree)} if as_graph else None
+        stack: List[Any] = [(tree, get_items(tree, write))]
+        while stack:
+            node, items = stack[-1]
+            for key, item in items:
+                if (item.__class__ in traversals) if const is None else isinstance(item, const):
+                    if prune is not None and prune(item):
+                        continue
+                    if (max_depth and len(stack) >= max_depth) or (is_leaf is not None and is_leaf(item)):
+                        if write:
+                            node[key] = handle(item)
+                        continue
+                    if seen is not None:
+                        if id(item) in seen:
+                            continue
+                        seen.add(id(item))
+                    stack.append((item, get_items(item, write)))
+                    break
+                if write:
+                    node[key] = handle(item)
+            else:
+                stack.pop()
+    if const is None or not (isinstance(const, type) and issubclass(const, (list, bytearray, dict))):
+        walk(False)
+    walk(True)
+    return tree
+
+def traverse_selected(handle: H, tree: Any, patterns: Any, in_place: bool = False) -> Any:
+    """
+    Returns a value mapped from 'tree' by applying 'handle' to each value
+    at a path of keys and indices matched by 'patterns', a string or strings
+    per 'compile_selector', descending into each list, tuple and dictionary
+    only where a path through it may yet match, and rebuilding, or if
+    'in_place' is truthy updating, only those containers on a path to a
+    changed value, each other container retained as is, by reference.
+
+    A value at a matched path is passed to 'handle' whole, and so not
+    descended into, even where a longer path could also match.
+
+    If 'in_place' is truthy, the paths matched are checked in a first pass
+    not calling 'handle', raising a TypeError before any value is updated
+    if a value matched is held in a tuple.
+
+    Descends via an explicit stack, allowing trees of any nesting depth.
+
+    >>> tree = {'users': [{'email': 'A@B', 'tags': ['x']}], 'meta': {'n': 1}}
+    >>> mapped = traverse_selected(str.lower, tree, 'users.*.email')
+    >>> print(mapped['users'], mapped['meta'] is tree['meta'])
+    [{'email': 'a@b', 'tags': ['x']}] True
+    """
+    states = compile_selector(patterns) if isinstance(patterns, str) else compile_selector(*patterns)
+    def get_children(node: Any, state: int) -> Any:
+        literals, default, _, keyed = states[state]
+        if isinstance(node, dict):
+            if default is None:
+                return ((key, node[key], index) for key, index in keyed if key in node)
+            if not literals:
+                return ((key, child, default) for key, child in node.items())
+            return ((key, child, literals.get(key if key.__class__ is str else str(key), default))
+                for key, child in node.items())
+        if node.__class__ is list or node.__class__ is tuple:
+            if default is None:
+                return ((key, node[key], index) for key, index in keyed
+                    if key.__class__ is int and key < len(node))
+            if not literals:
+                return ((key, child, default) for key, child in enumerate(node))
+            return ((key, child, literals.get(str(key), default)) for key, child in enumerate(node))
+        return None
+    if states[0][2]:
+        return handle(tree)
+    children = get_children(tree, 0)
+    if children is None:
+        return tree
+    if in_place:
+        check: List[Any] = [(tree, children)]
+        while check:
+            for _, child, state in check[-1][1]:
+                if state is None:
+                    continue
+                if states[state][2]:
+                    if check[-1][0].__class__ is tuple:
+                        raise TypeError('cannot map tuple in place, not list, bytearray or dict')
+                    continue
+                nested = get_children(child, state)
+                if nested is not None:
+                    check.append((child, nested))
+                    break
+            else:
+                check.pop()
+        children = get_children(tree, 0)
+    stack: List[Any] = [(None, tree, children, {})]
+    while True:
+        changes = stack[-1][3]
+        for key, child, state in stack[-1][2]:
+            if state is None:
+                continue
+            if states[state][2]:
+                value = handle(child)
+                if value is not child:
+                    changes[key] = value
+                continue
+            children = get_children(child, state)
+            if children is not None:
+                stack.append((key, child, children, {}))
+                break
+        else:
+            key, node, _, changes = stack.pop()
+            value = node
+            if changes and node.__class__ is tuple:
+                value = tuple(changes[i] if i in changes else child for i, child in enumerate(node))
+            elif changes:
+                value = node if in_place else copy(node)
+                for k, v in changes.items():
+                    value[k] = v
+            if not stack:
+                return value
+            if value is not node:
+                stack[-1][3][key] = value
+
+def map_pooled(handle: H, items: Iterable[V], workers: int = 0, executor: Any = None) -> Iterable[Any]:
+    """
+    Returns an iterable mapped from 'items' by applying 'handle' to each,
+    if any 'workers' or 'executor' a list, in chunks submitted in order
+    to 'executor' if an Executor instance or else to a new instance of
+    'executor' or a ThreadPoolExecutor with 'workers' or the CPU count.
+
+    Where 'executor' is or creates a ProcessPoolExecutor, 'handle' must be
+    picklable, i.e. defined at the top level of a module.
+
+    >>> map_pooled(lambda x: x + 1, [1, 2, 3], 2)
+    [2, 3, 4]
+    """
+    if not workers and executor is None:
+        return map(handle, items)
+    items = list(items)
+    workers = workers or cpu_count() or 1
+    size = max(1, -(-len(items) // (workers * 4)))
+    pool = executor if isinstance(executor, Executor)\
+        else (executor or ThreadPoolExecutor)(max_workers=workers)
+    try:
+        futures = [pool.submit(map_chunk, handle, items[i:i + size])
+            for i in range(0, len(items), size)]
+        return [item for future in futures for item in future.result()]
+    finally:
+        if pool is not executor:
+            pool.shutdown()
+
+def is_process_pool(executor: Any) -> bool:
     """
-    return dict((k, handle(v)) if not isinstance(v, dict)
-        else (k, traverse_dict(handle, v)) for k, v in tree.items())
+    Returns True if 'executor' is a ProcessPoolExecutor instance or class,
+    i.e. one to which each handler function passed must be picklable.
+
+    >>> is_process_pool(ProcessPoolExecutor), is_process_pool(ThreadPoolExecutor)
+    (True, False)
+    """
+    return isinstance(executor, ProcessPoolExecutor)\
+        or (isinstance(executor, type) and issubclass(executor, ProcessPoolExecutor))
+
+def map_chunk(handle: H, items: Iterable[V]) -> List[Any]:
+    """
+    Returns a list mapped from 'items' by applying 'handle' to each,
+    at the top level of the module to be picklable for 'map_pooled'.
+
+    >>> map_chunk(lambda x: x + 1, [1, 2, 3])
+    [2, 3, 4]
+    """
+    return list(map(handle, items))
+
+async def map_gathered(handle: Callable, items: Iterable[V], limit: int = 0) -> List[Any]:
+    """
+    Returns a list mapped from 'items' by applying 'handle' to each,
+    awaiting the result where awaitable, e.g. where 'handle' is async,
+    for up to 'limit' items at once if any 'limit' is truthy, in order.
+
+    >>> from asyncio import run, sleep
+    >>> async def incr_1(x): await sleep(0); return x + 1
+    >>> run(map_gathered(incr_1, [1, 2, 3], 2))
+    [2, 3, 4]
+    """
+    items = list(items)
+    mapped: List[Any] = [None] * len(items)
+    indexed = iter(enumerate(items))
+
+    async def work() -> None:
+        for i, item in indexed:
+            result = handle(item)
+            mapped[i] = await result if isawaitable(result) else result
+
+    await gather(*(work() for _ in range(limit or len(items))))
+    return mapped
+
+def map_array(handle: H, value: Any) -> Any:
+    """
+    Returns an instance of the class of 'value', either an array.array
+    or a NumPy ndarray, mapped from 'value' by applying 'handle' to each
+    item, with the typecode or dtype retained, via 'map_ndarray' where
+    NumPy is available, otherwise item by item.
+
+    >>> map_array(lambda x: x * 2, array('i', [1, 2, 3]))
+    array('i', [2, 4, 6])
+    """
+    if numpy is not None:
+        if isinstance(value, numpy.ndarray):
+            return map_ndarray(handle, value)
+        if value.typecode != 'u':
+            mapped = map_ndarray(handle, numpy.frombuffer(value, value.typecode))
+            built = array(value.typecode)
+            built.frombytes(memoryview(numpy.ascontiguousarray(mapped)).cast('B'))
+            return built
+    return array(value.typecode, map(handle, value))
+
+def map_ndarray(handle: H, value: Any) -> Any:
+    """
+    Returns a NumPy ndarray of the shape and dtype of 'value' mapped from
+    'value' by applying 'handle' to the whole as a vectorized operation,
+    e.g. where 'handle' is a ufunc or uses arithmetic operators, or else,
+    if this raises a TypeError, ValueError or AttributeError or returns
+    other than an ndarray of the same shape, to each item in turn.
+
+    An integer array narrower than 64 bits is widened for the vectorized
+    operation, and the result cast back to the dtype of 'value' only where
+    no value is lost, as for an array.array mapped item by item, otherwise
+    raising an OverflowError for an integer out of range or a TypeError
+    for one of another kind, e.g. a float for an integer. An integer array
+    of 64 bits, having no wider dtype, is mapped item by item as Python
+    integers instead, and the results checked against the range of its dtype.
+
+    Note that 'handle' may therefore be called once with the whole array
+    before being called for each item.
+
+    >>> map_ndarray(lambda x: x * 2, numpy.array([1, 2, 3])).tolist()  # doctest: +SKIP
+    [2, 4, 6]
+    """
+    if not value.size:
+        return value.copy()
+    dtype = value.dtype
+    if dtype.kind in 'iu' and dtype.itemsize >= 8:
+        items = list(map(handle, value.ravel().tolist()))
+        if all(item.__class__ is int for item in items):
+            limits = numpy.iinfo(dtype)
+            if min(items) < limits.min or max(items) > limits.max:
+                raise OverflowError(f'integer out of range for {dtype}')
+            return numpy.array(items, dtype).reshape(value.shape)
+        mapped = numpy.array(items).reshape(value.shape)
+    else:
+        try:
+            mapped = handle(value.astype(numpy.int64) if dtype.kind in 'iu' else value)
+        except (TypeError, ValueError, AttributeError):
+            mapped = None
+        if not isinstance(mapped, numpy.ndarray) or mapped.shape != value.shape:
+            mapped = numpy.array(list(map(handle, value.flat))).reshape(value.shape)
+    if dtype.kind in 'iu' and mapped.dtype.kind in 'iu':
+        cast = mapped.astype(dtype)
+        if not numpy.array_equal(cast, mapped):
+            raise OverflowError(f'integer out of range for {dtype}')
+        return cast
+    if not numpy.can_cast(mapped.dtype, dtype, 'same_kind'):
+        raise TypeError(f'cannot map {dtype} array to {mapped.dtype} values')
+    return mapped.astype(dtype, copy=False)
+
+def map_translated(handles: Tuple[H, ...], value: Any) -> Any:
+    """
+    Returns an instance of the class of 'value', a string, bytes or bytearray,
+    mapped from 'value' by applying each of 'handles' in turn to each item,
+    via a translation table built by applying 'handles' once per distinct
+    character or per byte, otherwise item by item; see 'get_table'.
+
+    >>> map_translated((lambda x: x + 1,), bytearray(b'abc'))
+    bytearray(b'bcd')
+    >>> map_translated((str.upper, lambda x: x * 2), 'abca')
+    'AABBCCAA'
+    """
+    table = get_table(handles, value)
+    if table is not None:
+        return value.translate(table)
+    if isinstance(value, str):
+        return ''.join(fuse(handles, value))
+    return value.__class__(fuse(handles, value))
+
+def map_in_place(handle: H, value: Any, size: int = 4096) -> Any:
+    """
+    Returns 'value', a list, bytearray or dictionary, once 'handle' has
+    been applied to each item, or for a dictionary each value, and each
+    result written back in its place, for a list or bytearray in slices
+    of up to 'size' items, the latter via a translation table where one
+    is available; see 'get_table'. Raises a TypeError if 'value' is not
+    of one of these types, e.g. is a tuple or string, rather than copying.
+
+    >>> items = [1, 2, 3]
+    >>> map_in_place(lambda x: x + 1, items) is items, items
+    (True, [2, 3, 4])
+    """
+    if isinstance(value, dict):
+        value.update(zip(value, map(handle, value.values())))
+        return value
+    if isinstance(value, bytearray):
+        table = get_table((handle,), value)
+        for i in range(0, len(value), size):
+            value[i:i + size] = value[i:i + size].translate(table) if table is not None\
+                else map(handle, value[i:i + size])
+        return value
+    if isinstance(value, list):
+        for i in range(0, len(value), size):
+            value[i:i + size] = map(handle, value[i:i + size])
+        return value
+    raise TypeError(f'cannot map {value.__class__.__name__} in place, not list, bytearray or dict')
+
+def map_product(handle: Callable, iterables: Iterable[Iterable[Any]]) -> Iterator[Any]:
+    """
+    Returns an iterator applying 'handle' to each combination of items,
+    one from each of 'iterables', the last varying fastest, reading from
+    the first as each result is consumed and holding the rest once each,
+    so that neither the first nor the product is ever held in full.
+
+    >>> list(map_product(lambda x, y: x + y, [iter('ab'), iter('xy')]))
+    ['ax', 'ay', 'bx', 'by']
+    """
+    first, *rest = iterables
+    held = [items if isinstance(items, (list, tuple, range)) else tuple(items) for items in rest]
+    if len(held) == 1:
+        items_held = held[0]
+        for item in first:
+            for item_held in items_held:
+                yield handle(item, item_held)
+        return
+    for item in first:
+        yield from starmap(handle, product((item,), *held))
+
+def map_each(handles: Iterable[H], items: Iterable[V]) -> Iterator[Any]:
+    """
+    Returns an iterator applying each of 'handles' separately to each item
+    in 'items' in turn, reading from 'items' as each result is consumed
+    and holding 'handles' once.
+
+    >>> list(map_each([lambda x: x + 1, lambda x: x * 2], iter([1, 2])))
+    [2, 2, 3, 4]
+    """
+    handles = handles if isinstance(handles, (list, tuple)) else tuple(handles)
+    for item in items:
+        for handle in handles:
+            yield handle(item)
+
+def fuse(handles: Iterable[H], items: Iterable[V]) -> Iterator[Any]:
+    """
+    Returns an iterator applying each of 'handles' in turn to each item
+    in 'items' in a single pass, with no intermediate collection, via one
+    map iterator per handler where there are up to 'fuse_depth', or else,
+    to avoid nesting iterators without limit, via one map iterator over
+    a function applying each in turn.
+
+    >>> list(fuse([lambda x: x + 1, lambda x: x * 2], [1, 2]))
+    [4, 6]
+    >>> list(fuse([abs] * 100000, [-1]))
+    [1]
+    """
+    handles = tuple(handles)
+    if len(handles) > fuse_depth:
+        def apply(item: Any) -> Any:
+            for handle in handles:
+                item = handle(item)
+            return item
+        return map(apply, items)
+    fused: Iterator[Any] = iter(items)
+    for handle in handles:
+        fused = map(handle, fused)
+    return fused
+
+def chunk(items: Iterable[V], size: int) -> Iterator[List[V]]:
+    """
+    Returns an iterator yielding in turn lists of the next 'size' items
+    in 'items', the last list holding any remaining fewer than 'size'.
+
+    >>> list(chunk(iter([1, 2, 3, 4, 5]), 2))
+    [[1, 2], [3, 4], [5]]
+    """
+    items = iter(items)
+    while True:
+        chunked = list(islice(items, size))
+        if not chunked:
+            return
+        yield chunked
+
+def get_leaves(traverse: Callable, tree: Any, *args: Any) -> List[Any]:
+    """
+    Returns a list of the values to which 'traverse' for 'tree' and any
+    'args' applies its handler function, in the order of application.
+
+    >>> get_leaves(traverse_iter, [1, [2, 3]])
+    [1, 2, 3]
+    """
+    leaves: List[Any] = []
+
+    def collect(leaf: Any) -> int:
+        leaves.append(leaf)
+        return 0  # valid in any container incl. bytearray
+
+    traverse(collect, tree, *args)
+    return leaves
 
 def get_args(fn: Callable) -> List[str]:
     """
-    Returns a list of strings each naming a positional argument to 'fn'.
+    Returns a list of strings each naming a positional argument to 'fn',
+    where 'fn' has code of its own via the cache for 'get_code_args'.
 
     >>> get_args(lambda x: x + 1)
     ['x']
     """
-    return getfullargspec(fn).args
+    code = getattr(fn, '__code__', None)
+    if not isinstance(code, CodeType) or hasattr(fn, '__signature__'):
+        return getfullargspec(fn).args
+    return list(get_code_args(code))
 
 
 # tertiary functions
 
+def get_traversals(const: Any) -> Dict[Any, Any]:
+    """
+    Returns a table per 'traversals' with the entry for 'const' only,
+    or if none, an entry rebuilding by calling 'const' with the results.
+
+    >>> list(get_traversals(tuple)), get_traversals(list)[list] is traversals[list]
+    ([<class 'tuple'>], True)
+    """
+    entry = traversals.get(const, (iter, lambda tree, built: const(built)))
+    return {const: entry}
+
+def is_translatable(value: Any, const: Any) -> bool:
+    """
+    Returns True if 'value' is a string, bytes or bytearray to be rebuilt
+    by 'const' as the same type, i.e. its class or for a string 'join_str',
+    so can be mapped by 'map_translated'.
+
+    >>> is_translatable(b'ab', bytes), is_translatable('ab', list)
+    (True, False)
+    """
+    return value.__class__ in tables and (const is value.__class__ or const is join_str and isinstance(value, str))
+
+def get_table(handles: Tuple[H, ...], value: Any) -> Any:
+    """
+    Returns a translation table for 'value', the result of applying each
+    of 'handles' in turn to each of the 256 possible bytes or 128 ASCII
+    characters or, if any result cannot be held in the table, to each
+    distinct byte or character in 'value', memoized per handler function
+    where one is passed and it is weakly referable, or None if no table
+    is memoized and 'value' is shorter than 256 items or any result for
+    a string is not a string.
+
+    Note that each handler function is therefore assumed to be pure.
+
+    >>> get_table((lambda x: x ^ 32,), b'ab' * 128)[65:68]
+    b'abc'
+    >>> get_table((str.upper,), 'a' * 256)[97]
+    'A'
+    """
+    memo = tables[value.__class__]
+    key = handles[0] if len(handles) == 1 else None
+    try:
+        table = memo.get(key)
+    except TypeError:
+        key = table = None
+    if table is None:
+        if len(value) < 256:
+            return None
+        table = {}
+        if not isinstance(value, str):
+            try:
+                table = bytes(fuse(handles, range(256)))
+            except Exception:
+                pass
+        if key is not None:
+            memo[key] = table
+    if isinstance(table, bytes):
+        return table
+    if isinstance(value, str):
+        if value.isascii() and not all(map(table.__contains__, range(128))):
+            try:
+                chars = dict(zip(range(128), fuse(handles, map(chr, range(128)))))
+                if all(isinstance(char, str) for char in chars.values()):
+                    table.update(chars)
+            except Exception:
+                pass
+        if value.isascii() and all(map(table.__contains__, range(128))):
+            return table
+        items = set(map(ord, set(value))).difference(table)
+    else:
+        items = set(value).difference(table)
+    for item in items:
+        mapped = chr(item) if isinstance(value, str) else item
+        for handle in handles:
+            mapped = handle(mapped)
+        if isinstance(value, str) and not isinstance(mapped, str):
+            return None
+        table[item] = mapped
+    if isinstance(value, str):
+        return table
+    return bytes(table[byte] if byte in table else byte for byte in range(256))
+
+def get_dict(tree: Dict[Any, Any], values: Iterable[Any]) -> Dict[Any, Any]:
+    """
+    Returns a dictionary of the same type as 'tree' with its keys paired
+    in turn with 'values', built from the pairs by the constructor in 'dicts'
+    for the type, or else for a subclass via a shallow copy, so retaining
+    the type and e.g. the default factory of a defaultdict.
+
+    >>> get_dict(OrderedDict(a=1, b=2), [3, 4])
+    OrderedDict([('a', 3), ('b', 4)])
+    """
+    const = dicts.get(tree.__class__)
+    if const is not None:
+        return const(zip(tree, values))
+    built = copy(tree)
+    built.update(zip(tree, values))
+    return built
+
+def get_controls(pairs: Mapping[str, Any]) -> Tuple[Any, int, Any]:
+    """
+    Returns the values of any 'prune', 'max_depth' and 'is_leaf' settings
+    in 'pairs', else None, 0 and None, to be passed to a traversal function.
+
+    >>> get_controls({'max_depth': 2}), any(get_controls({}))
+    ((None, 2, None), False)
+    """
+    return pairs.get('prune'), pairs.get('max_depth', 0), pairs.get('is_leaf')
+
+def clear_increments(key: Any = None) -> None:
+    """
+    Clears the earlier tree and result retained by 'traverse_incremental'
+    for 'key', a function or other key, or if None for each key.
+
+    >>> incr_1 = lambda x: x + 1
+    >>> mapped = traverse_incremental(incr_1, {'a': 1})
+    >>> clear_increments(incr_1)
+    >>> incr_1 in increments
+    False
+    """
+    if key is None:
+        increments.clear()
+    else:
+        increments.pop(key, None)
+
+@lru_cache(maxsize=256)
+def compile_selector(*patterns: str) -> Tuple[Any, ...]:
+    """
+    Returns the states of an automaton matching each path of keys and
+    indices per any of 'patterns', each a string of keys separated by '.',
+    where '*' matches any one key or index and '**' any number, incl. none,
+    compiled once per set of 'patterns'. Each state, the first that before
+    any key, is a tuple of the mapping of each key named to the index of
+    the next state, the index for any other key or None, whether a path
+    ending in the state is matched, and the pairs of each key named, also
+    as an integer if digits, and the index of the next state.
+
+    >>> states = compile_selector('users.*.email')
+    >>> [state[:3] for state in states]
+    [({'users': 1}, None, False), ({}, 2, False), ({'email': 3}, None, False), ({}, None, True)]
+    """
+    segments = [pattern.split('.') if pattern else [] for pattern in patterns]
+    def close(positions: Any) -> frozenset:
+        closed, stack = set(positions), list(positions)
+        while stack:
+            p, i = stack.pop()
+            if i < len(segments[p]) and segments[p][i] == '**' and (p, i + 1) not in closed:
+                closed.add((p, i + 1))
+                stack.append((p, i + 1))
+        return frozenset(closed)
+    def step(positions: frozenset, key: Any) -> frozenset:
+        return close({(p, i + 1) for p, i in positions if i < len(segments[p]) and segments[p][i] in ('*', key)}
+            | {(p, i) for p, i in positions if i < len(segments[p]) and segments[p][i] == '**'})
+    indices: Dict[frozenset, int] = {}
+    queue: List[frozenset] = []
+    def get_index(positions: frozenset) -> Any:
+        if not positions:
+            return None
+        if positions not in indices:
+            indices[positions] = len(queue)
+            queue.append(positions)
+        return indices[positions]
+    get_index(close({(p, 0) for p in range(len(segments))}))
+    states: List[Any] = []
+    while len(states) < len(queue):
+        positions = queue[len(states)]
+        named = sorted({segments[p][i] for p, i in positions if i < len(segments[p])}.difference(('*', '**')))
+        literals = {key: get_index(step(positions, key)) for key in named}
+        keyed = tuple(literals.items()) + tuple((int(key), index) for key, index in literals.items() if key.isdigit())
+        matched = any(i == len(segments[p]) for p, i in positions)
+        states.append((literals, get_index(step(positions, None)), matched, keyed))
+    return tuple(states)
+
+@lru_cache(maxsize=1024)
+def get_code_args(code: CodeType) -> Tuple[str, ...]:
+    """
+    Returns a tuple of strings each naming a positional argument per 'code',
+    caching the result for the most recent 1024 code objects passed.
+
+    >>> get_code_args((lambda x, *xs, y: x).__code__)
+    ('x',)
+    """
+    return code.co_varnames[:code.co_argcount]
+
+def get_pairs(kwargs: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Returns a read-only mapping of 'kwargs', shared by each call passing
+    the same set via the cache for 'get_pairs_interned' where each value
+    is a scalar, keyed by the class of each as well, so that e.g. 1 and True
+    are kept apart, with no reference held to any other value.
+
+    >>> get_pairs({'as_tree': True}) is get_pairs({'as_tree': True})
+    True
+    >>> get_pairs({'memo': 1})['memo'] is True
+    False
+    """
+    if not kwargs:
+        return pairs_empty
+    values = tuple(kwargs.values())
+    classes = tuple(map(type, values))
+    if not pairs_scalars.issuperset(classes):
+        return MappingProxyType(dict(kwargs))
+    return get_pairs_interned(tuple(kwargs), classes, values)
+
+@lru_cache(maxsize=256)
+def get_pairs_interned(keys: Tuple[str, ...], classes: Tuple[Any, ...],
+    values: Tuple[Any, ...]) -> Mapping[str, Any]:
+    """
+    Returns a read-only mapping of 'keys' to 'values', caching the result
+    per the classes of the values as well, in 'classes', for the most
+    recent 256 sets passed.
+
+    >>> get_pairs_interned(('as_tree',), (bool,), (True,))['as_tree']
+    True
+    """
+    return MappingProxyType(dict(zip(keys, values)))
+
 def get_constructor(object: Any) -> Any:
     """
     Returns the class of which 'object' is an instance.
@@ -76,5 +1082,13 @@ def get_const(object: Any) -> Any:
     >>> get_const('abc')(['x', 'y', 'z'])
     'xyz'
     """
-    return get_constructor(object) if not isinstance(object, str)\
-        else lambda item: ''.join(item)
+    return get_constructor(object) if not isinstance(object, str) else join_str
+
+def join_str(items: Iterable[str]) -> str:
+    """
+    Returns the string of 'items' joined, the constructor for a string per 'get_const'.
+
+    >>> join_str(['x', 'y', 'z'])
+    'xyz'
+    """
+    return ''.join(items)
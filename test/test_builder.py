@@ -1,4 +1,6 @@
 import unittest
+from array import array
+from collections import deque, OrderedDict, defaultdict, namedtuple
 
 from phns.builder import *
 
@@ -12,6 +14,16 @@ from test.test_functor import value
 
 class TestBuilder(unittest.TestCase):
 
+    def setUp(self):
+
+        self.kinds_registered = dict(kinds_registered)
+
+    def tearDown(self):
+
+        kinds_registered.clear()
+        kinds_registered.update(self.kinds_registered)
+        kinds_resolved.clear()
+
     def test_get_functor(self):
 
         # Functor
@@ -88,6 +100,39 @@ class TestBuilder(unittest.TestCase):
         self.assertEqual(dict_built.value, value['dict_dict']['initial'])
         self.assertEqual(dict_built.pairs['as_tree'], True)
 
+        dict_built = get_functor({'a': {'b': 1}}, as_tree=True, max_depth=1)
+        self.assertEqual(dict_built.pairs['max_depth'], 1)
+        self.assertEqual(dict_built.map(str), {'a': "{'b': 1}"})
+
+        # FunctorArray
+
+        array_built = get_functor(value['array_array']['initial'])
+        array_instantiated = FunctorArray(value['array_array']['initial'])
+        self.assertEqual(array_built.__class__, array_instantiated.__class__)
+        self.assertEqual(array_built.value, value['array_array']['initial'])
+
+        if numpy is not None:
+            ndarray_built = get_functor(numpy.array([1, 2, 3]))
+            self.assertEqual(ndarray_built.__class__, FunctorArray)
+
+        # FunctorStream
+
+        list_built = get_functor(value['iter_list']['initial'], as_stream=True)
+        list_instantiated = FunctorStream(value['iter_list']['initial'])
+        self.assertEqual(list_built.__class__, list_instantiated.__class__)
+        self.assertEqual(list_built.value, value['iter_list']['initial'])
+        self.assertEqual(list_built.pairs['as_stream'], True)
+
+        list_built = get_functor(value['iter_list']['initial'], memo=True)
+        self.assertEqual(list_built.__class__, FunctorIter)
+        self.assertEqual(list_built.pairs['memo'], True)
+
+        dict_built = get_functor(value['dict_dict']['initial'], as_mixed=True)
+        dict_instantiated = FunctorDict(value['dict_dict']['initial'])
+        self.assertEqual(dict_built.__class__, dict_instantiated.__class__)
+        self.assertEqual(dict_built.value, value['dict_dict']['initial'])
+        self.assertEqual(dict_built.pairs['as_mixed'], True)
+
     def test_get_pfunctor(self):
 
         # PFunctor
@@ -125,6 +170,12 @@ class TestBuilder(unittest.TestCase):
         self.assertEqual(list_built.value, value['iter_list']['initial'])
         self.assertEqual(list_built.pairs['as_tree'], True)
 
+        list_built = get_pfunctor(value['iter_list']['initial'], lazy=True)
+        list_lifted = PFunctorIter.of(value['iter_list']['initial'])
+        self.assertEqual(list_built.__class__, list_lifted.__class__)
+        self.assertEqual(list_built.value, value['iter_list']['initial'])
+        self.assertEqual(list_built.pairs['lazy'], True)
+
         str_built = get_pfunctor(value['str']['initial'], as_iter=True)
         str_instantiated = PFunctorIter(value['str']['initial'])
         self.assertEqual(str_built.__class__, str_instantiated.__class__)
@@ -164,6 +215,156 @@ class TestBuilder(unittest.TestCase):
         self.assertEqual(dict_built.value, value['dict_dict']['initial'])
         self.assertEqual(dict_built.pairs['as_tree'], True)
 
+        # PFunctorArray
+
+        array_built = get_pfunctor(value['array_array']['initial'])
+        array_lifted = PFunctorArray.of(value['array_array']['initial'])
+        self.assertEqual(array_built.__class__, array_lifted.__class__)
+        self.assertEqual(array_built.value, value['array_array']['initial'])
+
+        if numpy is not None:
+            ndarray_built = get_pfunctor(numpy.array([1, 2, 3]))
+            self.assertEqual(ndarray_built.__class__, PFunctorArray)
+
+        # PFunctorStream
+
+        list_built = get_pfunctor(value['iter_list']['initial'], as_stream=True)
+        list_lifted = PFunctorStream.of(value['iter_list']['initial'])
+        self.assertEqual(list_built.__class__, list_lifted.__class__)
+        self.assertEqual(list_built.value, value['iter_list']['initial'])
+        self.assertEqual(list_built.pairs['as_stream'], True)
+
+        list_built = get_pfunctor(value['iter_list']['initial'], memo=True)
+        self.assertEqual(list_built.__class__, PFunctorIter)
+        self.assertEqual(list_built.pairs['memo'], True)
+
+        dict_built = get_pfunctor(value['dict_dict']['initial'], as_mixed=True)
+        dict_lifted = PFunctorDict.of(value['dict_dict']['initial'])
+        self.assertEqual(dict_built.__class__, dict_lifted.__class__)
+        self.assertEqual(dict_built.value, value['dict_dict']['initial'])
+        self.assertEqual(dict_built.pairs['as_mixed'], True)
+
+    def test_get_applicative(self):
+
+        applicative_built = get_applicative(abs)
+        self.assertEqual(applicative_built.__class__, Applicative)
+
+        applicative_built = get_applicative([abs], as_zip=True)
+        self.assertEqual((applicative_built.__class__, applicative_built.const), (ApplicativeIter, list))
+        self.assertEqual(applicative_built.pairs['as_zip'], True)
+
+        applicative_built = get_applicative(deque([1]))
+        self.assertEqual(applicative_built.const, deque)
+
+        applicative_built = get_applicative(x for x in [1])
+        self.assertEqual((applicative_built.__class__, applicative_built.const), (ApplicativeIter, list))
+
+        applicative_built = get_applicative([abs], as_base=True)
+        self.assertEqual(applicative_built.__class__, Applicative)
+
+    def test_get_monad(self):
+
+        monad_built = get_monad([1, 2], is_test=True)
+        self.assertEqual(monad_built.__class__, Monad)
+        self.assertEqual(monad_built.value, [1, 2])
+        self.assertEqual(monad_built.pairs['is_test'], True)
+
+    def test_register_iterable(self):
+
+        class Bag(list):
+            pass
+
+        bag_built = get_functor(Bag([1, 2]))
+        self.assertEqual(bag_built.__class__, FunctorIter)
+        self.assertEqual(bag_built.const, list)
+
+        register_iterable(Bag)
+        bag_built = get_functor(Bag([1, 2]))
+        self.assertEqual(bag_built.const, Bag)
+        self.assertEqual(bag_built.map(lambda x: x + 1).__class__, Bag)
+
+        class Span:
+            def __init__(self, n): self.n = n
+            def __iter__(self): return iter(range(self.n))
+
+        self.assertEqual(get_functor(Span(2)).__class__, Functor)
+        register_iterable(Span, tuple)
+        self.assertEqual(get_functor(Span(2)).map(lambda x: x + 1), (1, 2))
+        self.assertEqual(get_pfunctor(Span(2)).map(lambda x: x + 1).value, (1, 2))
+        self.assertEqual(compile_functor()(Span(2)).__class__, FunctorIter)
+        self.assertEqual(compile_functor(as_base=False)(Span(2)).map(lambda x: x + 1), (1, 2))
+        self.assertEqual(compile_pfunctor(as_is=False)(Span(2)).map(lambda x: x + 1).value, (1, 2))
+        self.assertEqual(compile_functor(as_base=True)(Span(2)).__class__, Functor)
+
+    def test_register_dict(self):
+
+        class Settings(dict):
+            pass
+
+        register_dict(Settings, Settings)
+        self.assertEqual(get_kind(Settings), ('dict', Settings))
+        self.assertIs(dicts[Settings], Settings)
+        settings_mapped = get_functor(Settings(a=1, b={'c': 2}), as_tree=True).map(lambda x: x + 1)
+        self.assertEqual(settings_mapped.__class__, Settings)
+        self.assertEqual(settings_mapped, {'a': 2, 'b': {'c': 3}})
+
+        unregister_kind(Settings)
+        self.assertNotIn(Settings, dicts)
+        self.assertEqual(get_functor(Settings(a=1)).map(lambda x: x + 1).__class__, Settings)
+
+    def test_unregister_kind(self):
+
+        class Bag(list):
+            pass
+
+        register_iterable(Bag)
+        self.assertEqual(get_functor(Bag([1])).const, Bag)
+        unregister_kind(Bag)
+        self.assertEqual(get_functor(Bag([1])).const, list)
+        self.assertNotIn(Bag, kinds_registered)
+
+        unregister_kind(deque)
+        self.assertEqual(get_functor(deque([1])).__class__, Functor)
+
+    def test_get_kind(self):
+
+        self.assertEqual(get_kind(list), ('iter', list))
+        self.assertEqual(get_kind(deque), ('iter', deque))
+        self.assertEqual(get_kind(OrderedDict), ('dict', None))
+        self.assertEqual(get_kind(array), ('array', None))
+        self.assertIsNone(get_kind(str))
+
+        Pair = namedtuple('Pair', 'a b')
+        self.assertEqual(get_kind(Pair), ('iter', tuple))
+        self.assertEqual(get_functor(Pair(1, 2)).map(lambda x: x + 1), (2, 3))
+
+    def test_get_kind_set(self):
+
+        self.assertIsNone(get_kind_set({}))
+        self.assertIsNone(get_kind_set({'as_base': False, 'as_is': False}))
+        self.assertEqual(get_kind_set({'as_base': False, 'as_is': True}), 'base')
+        self.assertEqual(get_kind_set({'as_iter': True, 'as_base': True}), 'iter')
+        self.assertEqual(get_kind_set({'as_stream': True, 'as_iter': True}), 'stream')
+
+        self.assertEqual(get_functor([1], as_base=False).__class__, FunctorIter)
+        self.assertEqual(compile_functor(as_base=False)([1]).__class__, FunctorIter)
+
+    def test_dispatch_preserves_type(self):
+
+        deque_mapped = get_functor(deque([1, 2])).map(lambda x: x + 1)
+        self.assertEqual(deque_mapped, deque([2, 3]))
+
+        ordered_mapped = get_pfunctor(OrderedDict(b=1, a=2)).map(lambda x: x + 1).value
+        self.assertEqual(ordered_mapped.__class__, OrderedDict)
+        self.assertEqual(list(ordered_mapped.items()), [('b', 2), ('a', 3)])
+
+        default_mapped = get_functor(defaultdict(int, a=1)).map(lambda x: x + 1, workers=2)
+        self.assertEqual(default_mapped.__class__, defaultdict)
+        self.assertEqual(default_mapped['b'], 0)
+
+        lazy_mapped = get_pfunctor(OrderedDict(a=1), lazy=True).map(lambda x: x + 1).value
+        self.assertEqual(lazy_mapped.__class__, OrderedDict)
+
 
 if __name__ == '__main__':
     unittest.main()
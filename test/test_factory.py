@@ -1,4 +1,5 @@
 import unittest
+from array import array
 
 from phns.factory import *
 
@@ -29,6 +30,21 @@ class TestFactory(unittest.TestCase):
         test_build = instance('test_builder', 'test_value')
         self.assertEqual(test_build, "Test build properties: test_value, {'is_test': True}")
 
+        with self.assertRaises(ValueError):
+            instance('test_missing', 'test_value')
+
+        # .many & .build_iter methods
+
+        test_builds = instance.many('test_builder', ['a', 'b'])
+        self.assertEqual(test_builds, [f"Test build properties: {v}, {{'is_test': True}}" for v in 'ab'])
+
+        test_builds_iter = instance.build_iter('test_builder', iter(['a', 'b']))
+        self.assertEqual(next(test_builds_iter), "Test build properties: a, {'is_test': True}")
+        self.assertEqual(list(test_builds_iter), ["Test build properties: b, {'is_test': True}"])
+
+        with self.assertRaises(ValueError):
+            instance.many('test_missing', ['a'])
+
         # phnew
 
         self.assertEqual(phnew.__class__, Phnew)
@@ -37,6 +53,12 @@ class TestFactory(unittest.TestCase):
         test_kw_f_as_is   = {'fn': get_functor, 'kw': {'as_base': True}}
         test_kw_f_as_iter = {'fn': get_functor, 'kw': {'as_iter': True}}
         test_kw_f_as_tree = {'fn': get_functor, 'kw': {'as_tree': True}}
+        test_kw_f_as_mixed = {'fn': get_functor, 'kw': {'as_mixed': True}}
+        test_kw_f_as_stream = {'fn': get_functor, 'kw': {'as_stream': True}}
+        test_kw_f_memo = {'fn': get_functor, 'kw': {'memo': True}}
+        test_kw_f_in_place = {'fn': get_functor, 'kw': {'in_place': True}}
+        test_kw_f_in_place_tree = {'fn': get_functor, 'kw': {'as_tree': True, 'in_place': True}}
+        test_kw_f_in_place_mixed = {'fn': get_functor, 'kw': {'as_mixed': True, 'in_place': True}}
 
         self.assertEqual(phnew.builders['f.'],  test_kw_f_as_is)
         self.assertEqual(phnew.builders['f:'],  test_kw_f)
@@ -44,11 +66,28 @@ class TestFactory(unittest.TestCase):
         self.assertEqual(phnew.builders['f:{'], test_kw_f_as_tree)
         self.assertEqual(phnew.builders['f'],   test_kw_f)
         self.assertEqual(phnew.builders['f{'],  test_kw_f_as_tree)
+        self.assertEqual(phnew.builders['f:*'], test_kw_f_as_mixed)
+        self.assertEqual(phnew.builders['f*'],  test_kw_f_as_mixed)
+        self.assertEqual(phnew.builders['f~'],  test_kw_f_as_stream)
+        self.assertEqual(phnew.builders['f#'],  test_kw_f_memo)
+        self.assertEqual(phnew.builders['f!'],  test_kw_f_in_place)
+        self.assertEqual(phnew.builders['f{!'], test_kw_f_in_place_tree)
+        self.assertEqual(phnew.builders['f*!'], test_kw_f_in_place_mixed)
+
+        list_initial = [1, [2]]
+        self.assertIs(phnew('f{!', list_initial).map(lambda x: x + 1), list_initial)
+        self.assertEqual(list_initial, [2, [3]])
 
         test_kw_pf         = {'fn': get_pfunctor, 'kw': {}}
         test_kw_pf_as_is   = {'fn': get_pfunctor, 'kw': {'as_base': True}}
         test_kw_pf_as_iter = {'fn': get_pfunctor, 'kw': {'as_iter': True}}
         test_kw_pf_as_tree = {'fn': get_pfunctor, 'kw': {'as_tree': True}}
+        test_kw_pf_as_mixed = {'fn': get_pfunctor, 'kw': {'as_mixed': True}}
+        test_kw_pf_as_stream = {'fn': get_pfunctor, 'kw': {'as_stream': True}}
+        test_kw_pf_memo = {'fn': get_pfunctor, 'kw': {'memo': True}}
+        test_kw_pf_in_place = {'fn': get_pfunctor, 'kw': {'in_place': True}}
+        test_kw_pf_in_place_tree = {'fn': get_pfunctor, 'kw': {'as_tree': True, 'in_place': True}}
+        test_kw_pf_in_place_mixed = {'fn': get_pfunctor, 'kw': {'as_mixed': True, 'in_place': True}}
 
         self.assertEqual(phnew.builders['pf.'],  test_kw_pf_as_is)
         self.assertEqual(phnew.builders['pf:'],  test_kw_pf)
@@ -56,6 +95,52 @@ class TestFactory(unittest.TestCase):
         self.assertEqual(phnew.builders['pf:{'], test_kw_pf_as_tree)
         self.assertEqual(phnew.builders['pf'],   test_kw_pf)
         self.assertEqual(phnew.builders['pf{'],  test_kw_pf_as_tree)
+        self.assertEqual(phnew.builders['pf:*'], test_kw_pf_as_mixed)
+        self.assertEqual(phnew.builders['pf*'],  test_kw_pf_as_mixed)
+        self.assertEqual(phnew.builders['pf~'],  test_kw_pf_as_stream)
+        self.assertEqual(phnew.builders['pf#'],  test_kw_pf_memo)
+        self.assertEqual(phnew.builders['pf!'],  test_kw_pf_in_place)
+        self.assertEqual(phnew.builders['pf{!'], test_kw_pf_in_place_tree)
+        self.assertEqual(phnew.builders['pf*!'], test_kw_pf_in_place_mixed)
+
+        test_kw_a       = {'fn': get_applicative, 'kw': {}}
+        test_kw_a_as_is = {'fn': get_applicative, 'kw': {'as_base': True}}
+        test_kw_a_as_zip = {'fn': get_applicative, 'kw': {'as_zip': True}}
+
+        self.assertEqual(phnew.builders['a.'], test_kw_a_as_is)
+        self.assertEqual(phnew.builders['a'],  test_kw_a)
+        self.assertEqual(phnew.builders['a='], test_kw_a_as_zip)
+        self.assertEqual(list(phnew('a=', [abs, str]).ap(phnew('a', [-1, -2])).value), [1, '-2'])
+
+        test_kw_m = {'fn': get_monad, 'kw': {}}
+
+        self.assertEqual(phnew.builders['m'], test_kw_m)
+        self.assertEqual(phnew('m', 1).chain(lambda x: phnew('m', x + 1)).value, 2)
+
+    def test_phnew_compiled(self):
+
+        values = [1, 'abc', [1, [2]], (1, 2), {1, 2}, bytearray(b'ab'), {'a': {'b': 1}}, array('i', [1])]
+        for id, builder in phnew.builders.items():
+            for value in values:
+                try:
+                    built_expected = builder['fn'](value, **builder['kw'])
+                except TypeError:
+                    with self.assertRaises(TypeError):
+                        phnew(id, value)
+                    continue
+                built = phnew(id, value)
+                self.assertEqual(built.__class__, built_expected.__class__, (id, value))
+                self.assertEqual(getattr(built, 'pairs', None), getattr(built_expected, 'pairs', None))
+                self.assertEqual(getattr(built, 'const', None), getattr(built_expected, 'const', None))
+
+        for id in ('f!', 'pf!', 'f{!', 'pf*!'):
+            for value in ('ab', b'ab', 1, None):
+                with self.assertRaises(TypeError):
+                    phnew(id, value)
+        self.assertEqual(phnew('f!', [1, 2]).map(lambda x: x + 1), [2, 3])
+
+        built_many = phnew.many('pf{', [[1, [2]], {'a': {'b': 2}}])
+        self.assertEqual([pf.map(lambda x: x + 1).value for pf in built_many], [[2, [3]], {'a': {'b': 3}}])
 
 
 if __name__ == '__main__':
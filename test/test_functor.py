@@ -1,6 +1,13 @@
 import unittest
+from itertools import count, islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from asyncio import start_server, open_connection, sleep
+from array import array
+from collections import OrderedDict, defaultdict
 
 from phns.functor import *
+from phns.utility import numpy
+from phns.primary import memoize, get_memoized
 
 
 # test values
@@ -13,6 +20,9 @@ apply = {
     'asc_32': lambda x: 32
 }
 
+def double(x):  # picklable for process pools
+    return x * 2
+
 value = {
 
     'int': {
@@ -73,11 +83,30 @@ value = {
         'asc32ed':      bytearray(b'          ')
     },
 
+    'array_array': {
+
+        'initial':      array('i', [1, 2, 3]),
+        'doubled':      array('i', [2, 4, 6]),
+        'asc32ed':      array('i', [32, 32, 32])
+    },
+
     'dict_dict': {
 
         'initial':      {'a': 1, 'b': {'c': 2, 'd': 3}},
         'list3ed':      {'a': [1, 1, 1], 'b': [{'c': 2, 'd': 3}, {'c': 2, 'd': 3}, {'c': 2, 'd': 3}]},
         'list3ed_tree': {'a': [1, 1, 1], 'b': {'c': [2, 2, 2], 'd': [3, 3, 3]}}
+    },
+
+    'mixed_list': {
+
+        'initial':      [1, {'a': (2, [3])}],
+        'doubled':      [2, {'a': (4, [6])}]
+    },
+
+    'mixed_dict': {
+
+        'initial':      {'a': [1, (2, 3)], 'b': {'c': {4}}},
+        'doubled':      {'a': [2, (4, 6)], 'b': {'c': {8}}}
     }
 }
 
@@ -115,6 +144,23 @@ class TestFunctorBase(unittest.TestCase):
         dict_instantiated_tree = FunctorDict(value['dict_dict']['initial'], as_tree=True)
         self.assertEqual(dict_instantiated_tree.pairs['as_tree'], True)
 
+    def test_FunctorStream(self):
+
+        gen_instantiated = FunctorStream(x for x in value['iter_list']['initial'])
+        self.assertEqual(list(gen_instantiated.value), value['iter_list']['initial'])
+
+    def test_Functor_compact(self):
+
+        for instance in (Functor(1), FunctorIter([1]), FunctorDict({}), FunctorStream([])):
+            self.assertFalse(hasattr(instance, '__dict__'))
+
+        list_instantiated_tree_1 = FunctorIter(value['iter_list']['initial'], as_tree=True)
+        list_instantiated_tree_2 = FunctorIter(value['iter_tuple']['initial'], as_tree=True)
+        self.assertIs(list_instantiated_tree_1.pairs, list_instantiated_tree_2.pairs)
+        self.assertIs(FunctorIter([]).pairs, FunctorDict({}).pairs)
+        with self.assertRaises(TypeError):
+            list_instantiated_tree_1.pairs['as_tree'] = False
+
     # .map method
 
     # - on Functor
@@ -155,6 +201,73 @@ class TestFunctorBase(unittest.TestCase):
         bytearray_asc32ed = FunctorIter(value['iter_bytearray']['initial']).map(apply['asc_32'])
         self.assertEqual(bytearray_asc32ed, value['iter_bytearray']['asc32ed'])
 
+    def test_FunctorIter_map_translated(self):
+
+        calls = []
+        def asc_32(x): calls.append(x); return 32
+
+        bytearray_asc32ed = FunctorIter(bytearray(b'test_value' * 100)).map(asc_32)
+        self.assertEqual(bytearray_asc32ed, bytearray(b' ' * 1000))
+        self.assertEqual(len(calls), 256)
+
+        bytes_asc32ed = FunctorIter(b'test_value').map(asc_32)
+        self.assertEqual(bytes_asc32ed, b' ' * 10)
+        self.assertEqual(len(calls), 256)
+
+        str_tabl1ed = FunctorIter('abc', str).map(apply['tab_l1'])
+        self.assertEqual(str_tabl1ed, value['iter_str']['tabl1ed'])
+
+        self.assertEqual(FunctorIter('abc', list).map(str.upper), ['A', 'B', 'C'])
+        self.assertEqual(FunctorIter(b'ab', list).map(apply['double']), [194, 196])
+        self.assertEqual(PFunctorIter('abc', list, lazy=True).map(str.upper).value, ['A', 'B', 'C'])
+
+    def test_FunctorIter_map_memo(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        list_doubled = FunctorIter([1, 2, 1, 2, 1]).map(double, memo=True)
+        self.assertEqual(list_doubled, [2, 4, 2, 4, 2])
+        self.assertEqual(calls, [1, 2])
+
+        calls.clear()
+        list_doubled_tree = FunctorIter([1, [1, [2, [2, 1]]]], as_tree=True, memo=1).map(double)
+        self.assertEqual(list_doubled_tree, [2, [2, [4, [4, 2]]]])
+        self.assertEqual(calls, [1, 2, 1])
+
+        calls.clear()
+        list_doubled_mixed = FunctorIter([[1], {'a': [1]}, ([1],)]).map(double, as_mixed=True, memo=True)
+        self.assertEqual(list_doubled_mixed, [[2], {'a': [2]}, ([2],)])
+        self.assertEqual(calls, [])
+
+        calls.clear()
+        list_doubled = FunctorIter([[1], [1]]).map(double, memo=True)
+        self.assertEqual(list_doubled, [[1, 1], [1, 1]])
+        self.assertEqual(calls, [[1], [1]])
+
+        memoized = memoize(double)
+        FunctorIter([1, 1, 3]).map(memoized, memo=True)
+        FunctorIter((3, 3)).map(memoized)
+        self.assertEqual(memoized.cache_info()[:2], (3, 2))
+
+    def test_FunctorIter_map_as_graph(self):
+
+        list_cyclic: list = [1, [2]]
+        list_cyclic[1].append(list_cyclic)
+        list_doubled = FunctorIter(list_cyclic, as_graph=True).map(apply['double'])
+        self.assertEqual(list_doubled[:1], [2])
+        self.assertEqual(list_doubled[1][0], 4)
+        self.assertIs(list_doubled[1][1], list_doubled)
+
+        list_shared = [1]
+        list_doubled = FunctorIter([list_shared, {'a': list_shared}], as_graph=True).map(apply['double'], as_mixed=True)
+        self.assertEqual(list_doubled, [[2], {'a': [2]}])
+        self.assertIs(list_doubled[0], list_doubled[1]['a'])
+
+        list_doubled = FunctorIter([list_shared, list_shared], as_graph=True).map(apply['double'], workers=2)
+        self.assertEqual(list_doubled, [[2], [2]])
+        self.assertIs(list_doubled[0], list_doubled[1])
+
     def test_FunctorIter_map_as_tree(self):
 
         list_list3ed_tree = FunctorIter(value['iter_list']['initial']).map(apply['list_3'], True)
@@ -168,6 +281,99 @@ class TestFunctorBase(unittest.TestCase):
 
         # set & frozenset unhashable & bytearray uninterpretable - no nesting
 
+    def test_FunctorIter_map_pooled(self):
+
+        list_doubled = FunctorIter(list(range(100))).map(apply['double'], workers=4)
+        self.assertEqual(list_doubled, list(range(0, 200, 2)))
+
+        tuple_list3ed = FunctorIter(value['iter_tuple']['initial'], workers=2).map(apply['list_3'])
+        self.assertEqual(tuple_list3ed, value['iter_tuple']['list3ed'])
+
+        set_doubled = FunctorIter(value['iter_set']['initial']).map(apply['double'], executor=ThreadPoolExecutor)
+        self.assertEqual(set_doubled, value['iter_set']['doubled'])
+
+        with ThreadPoolExecutor(2) as executor:
+            bytearray_asc32ed = FunctorIter(value['iter_bytearray']['initial']).map(apply['asc_32'], executor=executor)
+            self.assertEqual(bytearray_asc32ed, value['iter_bytearray']['asc32ed'])
+
+        list_doubled = FunctorIter(list(range(10))).map(double, workers=2, executor=ProcessPoolExecutor)
+        self.assertEqual(list_doubled, list(range(0, 20, 2)))
+        list_doubled = FunctorIter([1, 1, 2]).map(double, executor=ProcessPoolExecutor, memo=True)
+        self.assertEqual(list_doubled, [2, 2, 4])
+
+        list_list3ed_tree = FunctorIter(value['iter_list']['initial']).map(apply['list_3'], True, workers=2)
+        self.assertEqual(list_list3ed_tree, value['iter_list']['list3ed_tree'])
+
+        list_doubled_mixed = FunctorIter(value['mixed_list']['initial']).map(apply['double'], as_mixed=True, workers=2)
+        self.assertEqual(list_doubled_mixed, value['mixed_list']['doubled'])
+
+    def test_FunctorIter_map_as_mixed(self):
+
+        list_doubled_mixed = FunctorIter(value['mixed_list']['initial']).map(apply['double'], as_mixed=True)
+        self.assertEqual(list_doubled_mixed, value['mixed_list']['doubled'])
+
+        list_doubled_mixed = FunctorIter(value['mixed_list']['initial'], as_mixed=True).map(apply['double'])
+        self.assertEqual(list_doubled_mixed, value['mixed_list']['doubled'])
+
+    def test_FunctorIter_map_in_place(self):
+
+        list_initial = [1, [2, 3]]
+        list_inner = list_initial[1]
+        self.assertIs(FunctorIter(list_initial, in_place=True).map(apply['double'], True), list_initial)
+        self.assertEqual(list_initial, [2, [4, 6]])
+        self.assertIs(list_initial[1], list_inner)
+
+        list_mixed = [1, {'a': [2]}]
+        FunctorIter(list_mixed).map(apply['double'], as_mixed=True, in_place=True)
+        self.assertEqual(list_mixed, [2, {'a': [4]}])
+
+        bytearray_initial = bytearray(b'abc')
+        FunctorIter(bytearray_initial).map(lambda x: x ^ 32, in_place=True)
+        self.assertEqual(bytearray_initial, bytearray(b'ABC'))
+
+        list_shared = [1]
+        FunctorIter([list_shared, list_shared], as_graph=True, in_place=True).map(apply['double'])
+        self.assertEqual(list_shared, [2])
+
+        with self.assertRaises(TypeError):
+            FunctorIter((1, 2)).map(apply['double'], in_place=True)
+        with self.assertRaises(TypeError):
+            FunctorIter('ab', in_place=True).map(str.upper)
+
+
+    def test_FunctorStream_map(self):
+
+        gen_list3ed = FunctorStream(x for x in value['iter_list']['initial']).map(apply['list_3'])
+        self.assertEqual(list(gen_list3ed), value['iter_list']['list3ed'])
+
+        count_doubled = FunctorStream(count()).map(apply['double'])
+        self.assertEqual(list(islice(count_doubled, 3)), [0, 2, 4])
+
+        count_doubled_chunked = FunctorStream(count()).map(apply['double'], 2)
+        self.assertEqual(list(islice(count_doubled_chunked, 2)), [[0, 2], [4, 6]])
+
+    # - on FunctorArray
+
+    def test_FunctorArray_map(self):
+
+        array_doubled = FunctorArray(value['array_array']['initial']).map(apply['double'])
+        self.assertEqual(array_doubled, value['array_array']['doubled'])
+
+        array_asc32ed = FunctorArray(value['array_array']['initial']).map(apply['asc_32'])
+        self.assertEqual(array_asc32ed, value['array_array']['asc32ed'])
+
+    @unittest.skipIf(numpy is None, 'NumPy not available')
+    def test_FunctorArray_map_ndarray(self):
+
+        ndarray = numpy.array([1, 2, 3], dtype='int8')
+
+        ndarray_doubled = FunctorArray(ndarray).map(apply['double'])
+        self.assertEqual(ndarray_doubled.tolist(), [2, 4, 6])
+        self.assertEqual(ndarray_doubled.dtype, ndarray.dtype)
+
+        ndarray_list3ed = FunctorArray(ndarray).map(lambda x: len(apply['list_3'](x)))
+        self.assertEqual(ndarray_list3ed.tolist(), [3, 3, 3])
+
     # - on FunctorDict
 
     def test_FunctorDict_map(self):
@@ -175,6 +381,20 @@ class TestFunctorBase(unittest.TestCase):
         dict_list3ed = FunctorDict(value['dict_dict']['initial']).map(apply['list_3'])
         self.assertEqual(dict_list3ed, value['dict_dict']['list3ed'])
 
+    def test_FunctorDict_map_memo(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        dict_doubled = FunctorDict({'a': 1, 'b': 1, 'c': 2}, memo=True).map(double)
+        self.assertEqual(dict_doubled, {'a': 2, 'b': 2, 'c': 4})
+        self.assertEqual(calls, [1, 2])
+
+        calls.clear()
+        dict_doubled_tree = FunctorDict({'a': 1, 'b': {'c': 1}}).map(double, True, memo=True)
+        self.assertEqual(dict_doubled_tree, {'a': 2, 'b': {'c': 2}})
+        self.assertEqual(calls, [])
+
     def test_FunctorDict_map_as_tree(self):
 
         dict_list3ed_tree = FunctorDict(value['dict_dict']['initial']).map(apply['list_3'], True)
@@ -183,6 +403,87 @@ class TestFunctorBase(unittest.TestCase):
         dict_list3ed_tree = FunctorDict(value['dict_dict']['initial'], as_tree=True).map(apply['list_3'])
         self.assertEqual(dict_list3ed_tree, value['dict_dict']['list3ed_tree'])
 
+        tree = OrderedDict(b=1, a=OrderedDict(d=2, c={'e': 3}), f=defaultdict(list, g=4))
+        for functor in (FunctorDict(tree, as_tree=True), FunctorDict(tree, as_tree=True, incremental=True),
+            PFunctorDict.of(tree, as_tree=True)):
+            for _ in range(2):
+                ordered_doubled = functor.map(apply['double'])
+                ordered_doubled = getattr(ordered_doubled, 'value', ordered_doubled)
+                self.assertEqual(ordered_doubled.__class__, OrderedDict)
+                self.assertEqual(list(ordered_doubled.items())[0], ('b', 2))
+                self.assertEqual(ordered_doubled['a'].__class__, OrderedDict)
+                self.assertEqual(list(ordered_doubled['a']), ['d', 'c'])
+                self.assertEqual(ordered_doubled['a']['c'].__class__, dict)
+                self.assertEqual(ordered_doubled['f'].default_factory, list)
+                self.assertEqual(ordered_doubled['f']['g'], 8)
+
+    def test_FunctorDict_map_in_place(self):
+
+        dict_initial = {'a': 1, 'b': {'c': 2}}
+        self.assertIs(FunctorDict(dict_initial).map(apply['double'], True, in_place=True), dict_initial)
+        self.assertEqual(dict_initial, {'a': 2, 'b': {'c': 4}})
+
+        dict_mixed = {'a': (1, 2)}
+        with self.assertRaises(TypeError):
+            FunctorDict(dict_mixed, in_place=True).map(apply['double'], as_mixed=True)
+
+    def test_FunctorDict_map_select(self):
+
+        dict_initial = {'users': [{'email': 'A', 'id': 1}], 'meta': {'email': 'B'}}
+        dict_lowered = FunctorDict(dict_initial).map(str.lower, select='users.*.email')
+        self.assertEqual(dict_lowered, {'users': [{'email': 'a', 'id': 1}], 'meta': {'email': 'B'}})
+        self.assertIs(dict_lowered['meta'], dict_initial['meta'])
+
+        dict_lowered = FunctorDict(dict_initial, select=('users.*.email', 'meta.email')).map(str.lower)
+        self.assertEqual((dict_lowered['users'][0]['email'], dict_lowered['meta']['email']), ('a', 'b'))
+
+        list_doubled = FunctorIter([[1, 2], [3]]).map(apply['double'], select='*.0')
+        self.assertEqual(list_doubled, [[2, 2], [6]])
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+        dict_doubled = FunctorDict({'a': [1, 1, 2]}, memo=True, workers=2, max_depth=1).map(double, select='a.*')
+        self.assertEqual((dict_doubled, calls), ({'a': [2, 2, 4]}, [1, 2]))
+
+    def test_FunctorDict_map_controls(self):
+
+        dict_initial = {'a': 1, 'b': {'c': {'d': 2}}, 'skip': {'e': 3}}
+        dict_expected = {'a': 2, 'b': {'c': "{'d': 2}{'d': 2}"}, 'skip': {'e': 3}}
+        prune = lambda node: 'e' in node
+        for workers in (0, 2):
+            dict_mapped = FunctorDict(dict_initial, as_tree=True, prune=prune, max_depth=2)\
+                .map(lambda x: x * 2 if isinstance(x, int) else str(x) * 2, workers=workers)
+            self.assertEqual(dict_mapped, dict_expected)
+            self.assertIs(dict_mapped['skip'], dict_initial['skip'])
+
+        list_mapped = FunctorIter([1, [2, [3]]], as_tree=True, is_leaf=lambda node: len(node) == 1).map(str)
+        self.assertEqual(list_mapped, ['1', ['2', '[3]']])
+
+        list_initial = [1, [2, [3]]]
+        list_mapped = PFunctorIter.of(list_initial, as_tree=True, in_place=True, max_depth=1).map(str)
+        self.assertIs(list_mapped.value, list_initial)
+        self.assertEqual(list_initial, ['1', '[2, [3]]'])
+        self.assertEqual(list_mapped.pairs['max_depth'], 1)
+
+    def test_FunctorDict_map_pooled(self):
+
+        dict_list3ed = FunctorDict(value['dict_dict']['initial']).map(apply['list_3'], workers=2)
+        self.assertEqual(dict_list3ed, value['dict_dict']['list3ed'])
+
+        dict_list3ed_tree = FunctorDict(value['dict_dict']['initial'], as_tree=True, workers=2).map(apply['list_3'])
+        self.assertEqual(dict_list3ed_tree, value['dict_dict']['list3ed_tree'])
+
+        dict_doubled_mixed = FunctorDict(value['mixed_dict']['initial']).map(apply['double'], as_mixed=True, workers=2)
+        self.assertEqual(dict_doubled_mixed, value['mixed_dict']['doubled'])
+
+    def test_FunctorDict_map_as_mixed(self):
+
+        dict_doubled_mixed = FunctorDict(value['mixed_dict']['initial']).map(apply['double'], as_mixed=True)
+        self.assertEqual(dict_doubled_mixed, value['mixed_dict']['doubled'])
+
+        dict_doubled_mixed = FunctorDict(value['mixed_dict']['initial'], as_mixed=True).map(apply['double'])
+        self.assertEqual(dict_doubled_mixed, value['mixed_dict']['doubled'])
+
 
 class TestFunctorPointed(unittest.TestCase):
 
@@ -215,6 +516,19 @@ class TestFunctorPointed(unittest.TestCase):
         dict_instantiated_tree = PFunctorDict(value['dict_dict']['initial'], as_tree=True)
         self.assertEqual(dict_instantiated_tree.pairs['as_tree'], True)
 
+    def test_PFunctorStream(self):
+
+        gen_instantiated = PFunctorStream(x for x in value['iter_list']['initial'])
+        self.assertEqual(list(gen_instantiated.value), value['iter_list']['initial'])
+
+    def test_PFunctor_compact(self):
+
+        for instance in (PFunctor(1), PFunctorIter([1]), PFunctorDict({}), PFunctorStream([])):
+            self.assertFalse(hasattr(instance, '__dict__'))
+
+        dict_lifted_tree = PFunctorDict.of(value['dict_dict']['initial'], as_tree=True)
+        self.assertIs(dict_lifted_tree.pairs, PFunctorDict.of({}, as_tree=True).pairs)
+
     # .of class method
 
     def test_PFunctor_of(self):
@@ -250,6 +564,11 @@ class TestFunctorPointed(unittest.TestCase):
         dict_lifted_tree = PFunctorIter.of(value['dict_dict']['initial'], as_tree=True)
         self.assertEqual(dict_lifted_tree.pairs['as_tree'], True)
 
+    def test_PFunctorStream_of(self):
+
+        gen_lifted = PFunctorStream.of(x for x in value['iter_list']['initial'])
+        self.assertEqual(list(gen_lifted.value), value['iter_list']['initial'])
+
     # .map method
 
     # - on PFunctor
@@ -297,11 +616,155 @@ class TestFunctorPointed(unittest.TestCase):
 
         # set unhashable - no nesting
 
+    def test_PFunctorIter_map_pooled(self):
+
+        tuple_list3ed = PFunctorIter.of(value['iter_tuple']['initial']).map(apply['list_3'], workers=2)
+        self.assertEqual(tuple_list3ed.value, value['iter_tuple']['list3ed'])
+
+        list_list3ed_tree = PFunctorIter.of(value['iter_list']['initial']).map(apply['list_3'], True, workers=2)
+        self.assertEqual(list_list3ed_tree.value, value['iter_list']['list3ed_tree'])
+
+        list_doubled_lazy = PFunctorIter.of([1, 2], lazy=True).map(apply['double'], workers=2)
+        self.assertEqual(list_doubled_lazy.handles, ())
+        self.assertEqual(list_doubled_lazy.value, [2, 4])
+
+    def test_PFunctorIter_map_memo(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        list_doubled = PFunctorIter.of([1, 1, 2], memo=True).map(double)
+        self.assertEqual(list_doubled.value, [2, 2, 4])
+        self.assertEqual(calls, [1, 2])
+
+        calls.clear()
+        list_doubled = PFunctorIter.of([1, 1, 2]).map(double, memo=True).map(double, memo=True)
+        self.assertEqual(list_doubled.value, [4, 4, 8])
+        self.assertEqual(calls, [4])
+
+        calls.clear()
+        halve = lambda x: calls.append(x) or x // 2
+        for _ in range(2):
+            PFunctorIter.of([2, 2, 4] * 3, memo=True).map(halve)
+        self.assertEqual(calls, [2, 4])
+        self.assertEqual(get_memoized(halve).cache_info()[:2], (16, 2))
+        self.assertEqual(get_memoized(halve, 2).cache_info()[:2], (0, 0))
+
+        calls.clear()
+        list_doubled_lazy = PFunctorIter.of([1, 3, 3], memo=True, lazy=True).map(double)
+        self.assertEqual(list_doubled_lazy.value, [2, 6, 6])
+        list_doubled_lazy = PFunctorIter.of([1, 3, 3], memo=True, lazy=True).map(lambda x: x * 2)
+        self.assertEqual(list_doubled_lazy.value, [2, 6, 6])
+        self.assertEqual(calls, [3])
+
+    def test_PFunctorIter_map_as_mixed(self):
+
+        list_doubled_mixed = PFunctorIter.of(value['mixed_list']['initial']).map(apply['double'], as_mixed=True)
+        self.assertEqual(list_doubled_mixed.value, value['mixed_list']['doubled'])
+
+        list_doubled_mixed = PFunctorIter.of(value['mixed_list']['initial'], as_mixed=True).map(apply['double'])
+        self.assertEqual(list_doubled_mixed.value, value['mixed_list']['doubled'])
+
+    def test_PFunctorIter_map_in_place(self):
+
+        list_initial = [1, 2]
+        list_mapped = PFunctorIter.of(list_initial, in_place=True).map(apply['double']).map(apply['double'])
+        self.assertIs(list_mapped.value, list_initial)
+        self.assertEqual(list_initial, [4, 8])
+
+        dict_initial = {'a': [1]}
+        dict_mapped = PFunctorDict.of(dict_initial).map(apply['double'], as_mixed=True, in_place=True)
+        self.assertIs(dict_mapped.value, dict_initial)
+        self.assertEqual(dict_initial, {'a': [2]})
+
+    def test_PFunctorIter_map_select(self):
+
+        list_initial = [{'a': 1}, {'b': 2}]
+        list_mapped = PFunctorIter.of(list_initial, lazy=True).map(apply['double'], select='*.a')
+        self.assertEqual(list_mapped.value, [{'a': 2}, {'b': 2}])
+        self.assertIs(list_mapped.value[1], list_initial[1])
+
+        dict_mapped = PFunctorDict.of({'a': [1, 2]}, in_place=True).map(apply['double'], select='a.1')
+        self.assertEqual(dict_mapped.map(apply['double'], select='a.0').value, {'a': [2, 4]})
+
+    def test_PFunctorIter_map_lazy_long(self):
+
+        list_lazy = PFunctorIter.of([-1, 2], lazy=True)
+        list_chained = list_lazy
+        for _ in range(100000):
+            list_chained = list_chained.map(abs)
+        self.assertEqual(len(list_chained.handles), 100000)
+        self.assertEqual(list_chained.map(apply['double']).value, [2, 4])
+        self.assertIsNone(list_lazy.pending)
+
+        dict_chained = PFunctorDict.of({'a': -1}, lazy=True)
+        for _ in range(100000):
+            dict_chained = dict_chained.map(abs)
+        self.assertEqual(dict_chained.value, {'a': 1})
+
+    def test_PFunctorIter_map_lazy(self):
+
+        list_lifted_lazy = PFunctorIter.of(value['iter_list']['initial'], lazy=True)
+        list_list3ed_lazy = list_lifted_lazy.map(apply['list_3'])
+        self.assertEqual(list_list3ed_lazy.handles, (apply['list_3'],))
+        self.assertEqual(list_list3ed_lazy.pairs['lazy'], True)
+        self.assertEqual(list_list3ed_lazy.value, value['iter_list']['list3ed'])
+        self.assertEqual(list_list3ed_lazy.handles, ())
+
+        set_doubled_lazy = PFunctorIter.of({1, 2, 3}, lazy=True).map(apply['double']).map(apply['asc_32'])
+        self.assertEqual(set_doubled_lazy.value, {32})
+
+        calls = []
+        tuple_lazy = PFunctorIter.of((1, 2, 3), lazy=True)
+        for _ in range(5):
+            tuple_lazy = tuple_lazy.map(lambda x: calls.append(x) or x * 2)
+        self.assertEqual(calls, [])
+        self.assertEqual(tuple_lazy.value, (32, 64, 96))
+        self.assertEqual(calls, [1, 2, 4, 8, 16, 2, 4, 8, 16, 32, 3, 6, 12, 24, 48])
+
+        bytearray_incr1ed_lazy = PFunctorIter.of(bytearray(b'ab'), lazy=True)
+        bytearray_incr1ed_lazy = bytearray_incr1ed_lazy.map(lambda x: x + 1).map(lambda x: x * 2)
+        self.assertEqual(bytearray_incr1ed_lazy.value, bytearray([196, 198]))
+
+        str_tabl1ed_lazy = PFunctorIter.of(value['iter_str']['initial'], lazy=True).map(apply['tab_l1'])
+        self.assertEqual(str_tabl1ed_lazy.handles, ())
+        self.assertEqual(str_tabl1ed_lazy.value, value['iter_str']['tabl1ed'])
+
+    def test_PFunctorStream_map(self):
+
+        gen_list3ed = PFunctorStream.of(x for x in value['iter_list']['initial']).map(apply['list_3'])
+        self.assertEqual(list(gen_list3ed.value), value['iter_list']['list3ed'])
+
+        count_doubled = PFunctorStream.of(count()).map(apply['double']).map(apply['double'])
+        self.assertEqual(list(islice(count_doubled.value, 3)), [0, 4, 8])
+
+        count_doubled_chunked = PFunctorStream.of(count()).map(apply['double']).map(apply['double'], 2)
+        self.assertEqual(list(islice(count_doubled_chunked.value, 2)), [[0, 4], [8, 12]])
+
+    def test_PFunctorArray_map(self):
+
+        array_doubled = PFunctorArray.of(value['array_array']['initial']).map(apply['double'])
+        self.assertEqual(array_doubled.value, value['array_array']['doubled'])
+
+        array_asc32ed = array_doubled.map(apply['asc_32'])
+        self.assertEqual(array_asc32ed.value, value['array_array']['asc32ed'])
+
     def test_PFunctorDict_map(self):
 
         dict_list3ed = PFunctorDict.of(value['dict_dict']['initial']).map(apply['list_3'])
         self.assertEqual(dict_list3ed.value, value['dict_dict']['list3ed'])
 
+    def test_PFunctorDict_map_lazy(self):
+
+        dict_lifted_lazy = PFunctorDict.of(value['dict_dict']['initial'], lazy=True)
+        dict_list3ed_lazy = dict_lifted_lazy.map(apply['list_3'])
+        self.assertEqual(dict_list3ed_lazy.handles, (apply['list_3'],))
+        self.assertEqual(dict_list3ed_lazy.value, value['dict_dict']['list3ed'])
+        self.assertEqual(dict_list3ed_lazy.handles, ())
+
+        dict_doubled_lazy = PFunctorDict.of({'a': 1, 'b': 2}, lazy=True).map(apply['double']).map(apply['double'])
+        self.assertEqual(dict_doubled_lazy.value, {'a': 4, 'b': 8})
+
     def test_PFunctorDict_map_as_tree(self):
 
         dict_list3ed_tree = PFunctorDict.of(value['dict_dict']['initial']).map(apply['list_3'], True)
@@ -310,6 +773,249 @@ class TestFunctorPointed(unittest.TestCase):
         dict_list3ed_tree = PFunctorDict.of(value['dict_dict']['initial'], as_tree=True).map(apply['list_3'])
         self.assertEqual(dict_list3ed_tree.value, value['dict_dict']['list3ed_tree'])
 
+    def test_PFunctorDict_map_incremental(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        tree = {'a': {'b': 1, 'c': 2}, 'd': {'e': 3}}
+        dict_doubled = PFunctorDict.of(tree, incremental=True).map(double, True)
+        self.assertEqual(dict_doubled.value, {'a': {'b': 2, 'c': 4}, 'd': {'e': 6}})
+
+        calls.clear()
+        tree_changed = {**tree, 'd': {'e': 4}}
+        dict_changed = PFunctorDict.of(tree_changed, as_tree=True, incremental=True).map(double)
+        self.assertEqual(dict_changed.value, {'a': {'b': 2, 'c': 4}, 'd': {'e': 8}})
+        self.assertIs(dict_changed.value['a'], dict_doubled.value['a'])
+        self.assertEqual(calls, [4])
+
+        calls.clear()
+        list_doubled = PFunctorIter.of([1, [2]], incremental=True).map(double, True)
+        list_changed = PFunctorIter.of([3, list_doubled.value[1]], incremental=True).map(double, True)
+        self.assertEqual(list_changed.value, [6, [8]])
+        self.assertEqual(calls, [1, 2, 3, 4])
+
+        functor = FunctorIter({1, 2}, as_tree=True, incremental=True)
+        self.assertEqual(functor.map(double), {2, 4})
+        self.assertEqual(functor.map(double), {2, 4})
+
+    def test_PFunctorDict_map_since(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        trees = [{'a': {'b': 1}, 'c': 2}, {'x': {'y': 5}}]
+        mapped = [PFunctorDict.of(tree, as_tree=True).map(double).value for tree in trees]
+        calls.clear()
+        for tree, value in zip(trees, mapped):
+            remapped = PFunctorDict.of({**tree, 'z': 0}, as_tree=True).map(double, since=(tree, value))
+            self.assertEqual(remapped.value, {**value, 'z': 0})
+        self.assertEqual(calls, [0, 0])
+
+        calls.clear()
+        version = lambda node: node.get('v')
+        tree = {'a': {'v': 1, 'b': 1}}
+        remapped = FunctorDict({'a': {'v': 1, 'b': 1}}, as_tree=True, version=version, since=(tree, {'a': 'x'})).map(double)
+        self.assertEqual((remapped, calls), ({'a': 'x'}, []))
+
+    def test_PFunctorDict_map_as_graph(self):
+
+        dict_cyclic: dict = {'a': 1}
+        dict_cyclic['b'] = dict_cyclic
+        dict_doubled = PFunctorDict.of(dict_cyclic, as_graph=True).map(apply['double']).value
+        self.assertEqual(dict_doubled['a'], 2)
+        self.assertIs(dict_doubled['b'], dict_doubled)
+
+    def test_PFunctorDict_map_pooled(self):
+
+        dict_list3ed = PFunctorDict.of(value['dict_dict']['initial']).map(apply['list_3'], workers=2)
+        self.assertEqual(dict_list3ed.value, value['dict_dict']['list3ed'])
+
+        dict_list3ed_tree = PFunctorDict.of(value['dict_dict']['initial']).map(apply['list_3'], True, workers=2)
+        self.assertEqual(dict_list3ed_tree.value, value['dict_dict']['list3ed_tree'])
+
+    def test_PFunctorDict_map_as_mixed(self):
+
+        dict_doubled_mixed = PFunctorDict.of(value['mixed_dict']['initial']).map(apply['double'], as_mixed=True)
+        self.assertEqual(dict_doubled_mixed.value, value['mixed_dict']['doubled'])
+
+        dict_doubled_mixed = PFunctorDict.of(value['mixed_dict']['initial'], as_mixed=True).map(apply['double'])
+        self.assertEqual(dict_doubled_mixed.value, value['mixed_dict']['doubled'])
+
+    # applicative functor classes
+
+    def test_Applicative(self):
+
+        applicative = Applicative.of(apply['double'], is_test=True)
+        applied = applicative.ap(Applicative.of(2))
+        self.assertEqual((applied.__class__, applied.value), (Applicative, 4))
+        self.assertEqual(applied.pairs['is_test'], True)
+
+        lifted = Applicative.lift2(lambda x, y: x * y, Applicative(2), Applicative(3))
+        self.assertEqual(lifted.value, 6)
+        lifted = Applicative.liftA(lambda x, y, z: x + y + z, *map(Applicative, 'abc'))
+        self.assertEqual(lifted.value, 'abc')
+        self.assertEqual(Applicative(1).map(apply['double']).value, 2)
+
+    def test_ApplicativeIter_ap(self):
+
+        validators = ApplicativeIter([lambda x: x > 0, lambda x: x % 2 == 0])
+        records = ApplicativeIter([1, -2])
+        self.assertEqual(list(validators.ap(records).value), [True, False, False, True])
+        self.assertEqual(list(validators.ap(records, as_zip=True).value), [True, True])
+        self.assertEqual(list(validators.ap(records, size=3).value), [[True, False, False], [True]])
+
+        validators_zip = ApplicativeIter(list(validators.value), as_zip=True)
+        self.assertEqual(list(validators_zip.ap(records).value), [True, True])
+
+        identity = ApplicativeIter([lambda x: x])
+        self.assertEqual(list(identity.ap(records).value), [1, -2])
+
+        applied = validators.ap(records)
+        self.assertEqual(applied.map(int).value, [1, 0, 0, 1])
+
+    def test_ApplicativeIter_lift(self):
+
+        read = []
+        records = ApplicativeIter((read.append(i) or i for i in count()), list)
+        checks = ApplicativeIter([1, 2])
+        lifted = ApplicativeIter.lift2(lambda r, c: r * c, records, checks)
+        self.assertEqual(read, [])
+        self.assertEqual(list(islice(lifted.value, 4)), [0, 0, 1, 2])
+        self.assertEqual(read, [0, 1])
+
+        xs, ys, zs = ApplicativeIter('ab'), ApplicativeIter('x'), ApplicativeIter('12')
+        lifted = ApplicativeIter.liftA(lambda x, y, z: x + y + z, xs, ys, zs)
+        self.assertEqual(list(lifted.value), ['ax1', 'ax2', 'bx1', 'bx2'])
+
+        left, right = ApplicativeIter(range(10 ** 9)), ApplicativeIter(range(10 ** 9))
+        zipped = ApplicativeIter.lift2(lambda x, y: x + y, left, right, as_zip=True)
+        self.assertEqual(list(islice(zipped.value, 3)), [0, 2, 4])
+
+    # monad classes
+
+    def test_Monad(self):
+
+        monad = Monad.of(1, is_test=True)
+        self.assertEqual((monad.value, monad.pairs['is_test']), (1, True))
+
+        monad_mapped = monad.map(apply['double']).chain(lambda x: Monad.of(x + 1))
+        self.assertEqual(monad_mapped.value, 3)
+        self.assertEqual(monad_mapped.pairs['is_test'], True)
+        self.assertIsNone(monad_mapped.prior)
+        self.assertEqual(monad.value, 1)
+
+        with self.assertRaises(TypeError):
+            monad.chain(apply['double']).value
+
+    def test_Monad_chain_laws(self):
+
+        incr = lambda x: Monad.of(x + 1)
+        triple = lambda x: Monad.of(x * 3)
+
+        self.assertEqual(Monad.of(2).chain(incr).value, incr(2).value)
+        self.assertEqual(Monad.of(2).chain(Monad.of).value, 2)
+        self.assertEqual(Monad.of(2).chain(incr).chain(triple).value,
+            Monad.of(2).chain(lambda x: incr(x).chain(triple)).value)
+
+    def test_Monad_chain_deep(self):
+
+        monad_left = Monad.of(0)
+        for _ in range(200000):
+            monad_left = monad_left.chain(lambda x: Monad.of(x + 1))
+        self.assertEqual(monad_left.value, 200000)
+
+        def nest(n):
+            return lambda x: Monad.of(x) if n == 0 else Monad.of(x + 1).chain(nest(n - 1))
+        self.assertEqual(Monad.of(0).chain(nest(200000)).value, 200000)
+
+        shared = Monad.of(0).map(apply['double'])
+        self.assertEqual((shared.map(str).value, shared.map(float).value), ('0', 0.0))
+
+
+class TestFunctorAsync(unittest.IsolatedAsyncioTestCase):
+
+    # local stand-in server doubling each integer received
+
+    async def asyncSetUp(self):
+
+        self.active = self.most = 0
+
+        async def respond(reader, writer):
+            self.active += 1
+            self.most = max(self.most, self.active)
+            line = await reader.readline()
+            await sleep(0.01)
+            writer.write(f'{int(line) * 2}\n'.encode())
+            await writer.drain()
+            writer.close()
+            self.active -= 1
+
+        self.server = await start_server(respond, '127.0.0.1', 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def request_double(self, x):
+
+        reader, writer = await open_connection('127.0.0.1', self.port)
+        writer.write(f'{x}\n'.encode())
+        await writer.drain()
+        line = await reader.readline()
+        writer.close()
+        await writer.wait_closed()
+        return int(line)
+
+    # .amap method
+
+    async def test_FunctorIter_amap(self):
+
+        list_doubled = await FunctorIter(list(range(10))).amap(self.request_double, limit=3)
+        self.assertEqual(list_doubled, list(range(0, 20, 2)))
+        self.assertEqual(self.most, 3)
+
+        tuple_doubled = await FunctorIter((1, 2, 3)).amap(self.request_double)
+        self.assertEqual(tuple_doubled, (2, 4, 6))
+
+        list_list3ed_tree = await FunctorIter(value['iter_list']['initial'], as_tree=True).amap(apply['list_3'])
+        self.assertEqual(list_list3ed_tree, value['iter_list']['list3ed_tree'])
+
+        list_doubled_mixed = await FunctorIter(value['mixed_list']['initial']).amap(self.request_double, as_mixed=True, limit=2)
+        self.assertEqual(list_doubled_mixed, value['mixed_list']['doubled'])
+
+    async def test_FunctorDict_amap(self):
+
+        dict_doubled = await FunctorDict({'a': 1, 'b': 2}, limit=1).amap(self.request_double)
+        self.assertEqual(dict_doubled, {'a': 2, 'b': 4})
+        self.assertEqual(self.most, 1)
+
+        dict_doubled_tree = await FunctorDict({'a': 1, 'b': {'c': 2}}).amap(self.request_double, True)
+        self.assertEqual(dict_doubled_tree, {'a': 2, 'b': {'c': 4}})
+
+        dict_doubled_mixed = await FunctorDict(value['mixed_dict']['initial']).amap(self.request_double, as_mixed=True)
+        self.assertEqual(dict_doubled_mixed, value['mixed_dict']['doubled'])
+
+    async def test_PFunctorIter_amap(self):
+
+        list_doubled = await PFunctorIter.of([1, 2, 3]).amap(self.request_double, limit=2)
+        self.assertEqual(list_doubled.__class__, PFunctorIter)
+        self.assertEqual(list_doubled.value, [2, 4, 6])
+
+        list_doubled_tree = await PFunctorIter.of([1, [2, 3]]).amap(self.request_double, True)
+        self.assertEqual(list_doubled_tree.value, [2, [4, 6]])
+
+    async def test_PFunctorDict_amap(self):
+
+        dict_doubled = await PFunctorDict.of({'a': 1, 'b': 2}).amap(self.request_double, limit=2)
+        self.assertEqual(dict_doubled.__class__, PFunctorDict)
+        self.assertEqual(dict_doubled.value, {'a': 2, 'b': 4})
+
+        dict_doubled_tree = await PFunctorDict.of({'a': 1, 'b': {'c': 2}}).amap(self.request_double, True)
+        self.assertEqual(dict_doubled_tree.value, {'a': 2, 'b': {'c': 4}})
+
 
 if __name__ == '__main__':
     unittest.main()
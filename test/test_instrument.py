@@ -0,0 +1,116 @@
+import unittest
+from json import loads
+from os import environ, path
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+
+import phns.functor
+import phns.utility
+from phns.instrument import *
+from phns.functor import FunctorIter, PFunctorIter, PFunctorDict
+from phns.primary import Pipeline, pipe
+
+
+# test values
+
+apply = {
+
+    'incr_1': lambda x: x + 1,
+    'double': lambda x: x * 2
+}
+
+
+# test functions
+
+def get_originals() -> list:
+    classes = [cls for cls in vars(phns.functor).values() if isinstance(cls, type)]
+    return [vars(cls).get('map') for cls in classes] + [Pipeline.__call__]\
+        + [getattr(phns.functor, name) for name in traversals_instrumented]
+
+
+# test classes
+
+class TestInstrument(unittest.TestCase):
+
+    def test_Stats(self):
+
+        stats = Stats('handler', 'FunctorIter.map', 'incr_1', 10)
+        for seconds in range(1, 21):
+            stats.add(seconds / 100)
+        record = stats.get_record()
+        self.assertEqual((record['calls'], record['elements']), (20, 20))
+        self.assertAlmostEqual(record['seconds'], 2.1)
+        self.assertEqual(len(stats.samples), 10)
+        self.assertLessEqual(record['p50'], record['p90'])
+        self.assertLessEqual(record['p90'], record['p99'])
+
+    def test_Profiler_disabled(self):
+
+        originals = get_originals()
+        self.assertIsNone(get_active())
+        self.assertIs(phns.functor.traverse_dict, phns.utility.traverse_dict)
+
+        with profile() as profiler:
+            self.assertIs(get_active(), profiler)
+            self.assertIsNot(FunctorIter.map, originals[0])
+            with self.assertRaises(RuntimeError):
+                profile().enable()
+
+        self.assertIsNone(get_active())
+        self.assertEqual(get_originals(), originals)
+        self.assertIs(phns.functor.traverse_dict, phns.utility.traverse_dict)
+
+    def test_Profiler_map(self):
+
+        records = []
+        with profile(records.append):
+            mapped = PFunctorIter([1, 2, 3]).map(apply['incr_1']).map(apply['double'])
+            self.assertEqual(mapped.value, [4, 6, 8])
+            mapped = PFunctorDict({'a': {'b': 1}}, as_tree=True).map(apply['incr_1'])
+            self.assertEqual(mapped.value, {'a': {'b': 2}})
+
+        by_key = {(r['kind'], r['site'], r['name']): r for r in records}
+        handler = by_key[('handler', 'PFunctorIter.map', '<lambda>')]
+        self.assertEqual((handler['calls'], handler['elements']), (6, 6))
+        mapped = by_key[('map', 'PFunctorIter.map', '<lambda>')]
+        self.assertEqual((mapped['calls'], mapped['elements']), (2, 6))
+        traversal = by_key[('traversal', 'traverse_dict', '<lambda>')]
+        self.assertEqual((traversal['calls'], traversal['elements']), (1, 1))
+
+    def test_Profiler_memo(self):
+
+        with profile() as profiler:
+            FunctorIter([1, 1, 1, 2], memo=True).map(apply['incr_1'])
+        handler = profiler.get_stats('handler', 'FunctorIter.map', '<lambda>')
+        self.assertEqual(handler.calls, 2)
+
+    def test_Profiler_pipeline(self):
+
+        records = []
+        with profile(records.append, allocations=True):
+            self.assertEqual(pipe(apply['incr_1'], str, len)(9), 2)
+        self.assertEqual([r['name'] for r in sorted(records, key=lambda r: r['site'])],
+            ['<lambda>', 'str', 'len'])
+        self.assertTrue(all(isinstance(r['allocated'], int) for r in records))
+
+    def test_JsonLines(self):
+
+        with TemporaryDirectory() as directory:
+            file_path = path.join(directory, 'profile.jsonl')
+            with profile(JsonLines(file_path)):
+                FunctorIter([1, 2]).map(apply['incr_1'])
+            with open(file_path) as file:
+                records = [loads(line) for line in file]
+            self.assertEqual({r['kind'] for r in records}, {'map', 'handler'})
+
+            file_path = path.join(directory, 'process.jsonl')
+            script = 'from phns import phnew; phnew("f", [1, 2]).map(abs)'
+            run([executable, '-c', script], check=True, env={**environ, 'PHNS_PROFILE': file_path})
+            with open(file_path) as file:
+                records = [loads(line) for line in file]
+            self.assertIn(('handler', 'abs', 2), [(r['kind'], r['name'], r['calls']) for r in records])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from functools import reduce
+from weakref import ref
 
 from phns.primary import *
 
@@ -22,6 +23,34 @@ apply = {
 
 class TestPrimary(unittest.TestCase):
 
+    def test_Curried(self):
+
+        curried_sum3 = Curried(apply['sum_3'], 3)
+        self.assertEqual((curried_sum3.arity, curried_sum3.args, curried_sum3.kwargs), (3, (), {}))
+
+        curried_sum3_1 = curried_sum3(1)
+        self.assertEqual(curried_sum3_1.__class__, Curried)
+        self.assertEqual(curried_sum3_1.args, (1,))
+        self.assertEqual(curried_sum3.args, ())
+
+        curried_sum3_1_y = curried_sum3_1(y=2)
+        self.assertEqual(curried_sum3_1_y.kwargs, {'y': 2})
+        self.assertEqual(curried_sum3_1_y(z=3), 6)
+        self.assertEqual(curried_sum3_1_y(z=4), 7)
+        self.assertEqual(curried_sum3_1(2, 3), 6)
+
+    def test_Pipeline(self):
+
+        pipeline = Pipeline(apply['incr_1'], apply['double'])
+        self.assertEqual(pipeline.stages, (apply['incr_1'], apply['double']))
+        self.assertEqual(pipeline(1), 4)
+
+        pipeline = Pipeline(apply['sum_2'], Pipeline(apply['incr_1'], apply['double']), apply['square'])
+        self.assertEqual(pipeline.stages, (apply['sum_2'], apply['incr_1'], apply['double'], apply['square']))
+        self.assertEqual(pipeline(1, y=2), 64)
+
+        self.assertRaises(ValueError, Pipeline)
+
     def test_curry(self):
 
         curried_sum2 = curry(apply['sum_2'])
@@ -35,6 +64,9 @@ class TestPrimary(unittest.TestCase):
         self.assertEqual(curried_sum3(1, 2)(3), 6)
         self.assertEqual(curried_sum3(1)(2)(3), 6)
 
+        self.assertEqual(curried_sum3(1, z=3)(y=2), 6)
+        self.assertEqual(curried_sum3(x=1)(y=2)(z=3), 6)
+
     def test_curry_n(self):
 
         curried_sum4 = curry_n(apply['sum_n'], 4)
@@ -64,6 +96,11 @@ class TestPrimary(unittest.TestCase):
         processed = process(1, 2, 3)
         self.assertEqual(processed, 73)
 
+        process = compose(apply['incr_1'], compose(apply['double'], apply['square']), apply['sum_3'])
+        self.assertEqual(process.stages, (apply['sum_3'], apply['square'], apply['double'], apply['incr_1']))
+        processed = process(1, 2, 3)
+        self.assertEqual(processed, 73)
+
     def test_pipe(self):
 
         process = pipe(apply['incr_1'])
@@ -78,6 +115,60 @@ class TestPrimary(unittest.TestCase):
         processed = process(1, 2, 3)
         self.assertEqual(processed, 196)
 
+        process = pipe(apply['sum_3'], pipe(apply['incr_1'], apply['double']), apply['square'])
+        self.assertEqual(process.stages, (apply['sum_3'], apply['incr_1'], apply['double'], apply['square']))
+        processed = process(1, 2, 3)
+        self.assertEqual(processed, 196)
+
+    def test_Memoized(self):
+
+        calls = []
+        memoized = Memoized(lambda x: calls.append(x) or x * 2, 2)
+        self.assertEqual([memoized(x) for x in [1, 1, 2, 1, 3, 2]], [2, 2, 4, 2, 6, 4])
+        self.assertEqual(calls, [1, 2, 3, 2])
+        self.assertEqual(memoized.cache_info()[:], (2, 4, 2, 2))
+
+        self.assertEqual(memoized([1]), [1, 1])
+        self.assertEqual(memoized(True), 2)
+        self.assertEqual(calls[-2:], [[1], True])
+
+        with self.assertRaises(TypeError):
+            Memoized(lambda x: x + 'a')(1)
+
+    def test_memoize(self):
+
+        memoized = memoize(apply['double'])
+        self.assertEqual(memoized.__class__, Memoized)
+        self.assertEqual(memoized.cache_info().maxsize, 1024)
+        self.assertIs(memoize(memoized), memoized)
+        self.assertEqual(memoized(2), 4)
+
+    def test_get_memoized(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        memoized = get_memoized(double)
+        self.assertIs(get_memoized(double).cached, memoized.cached)
+        self.assertIsNot(get_memoized(double, 2).cached, memoized.cached)
+        self.assertEqual([memoized(x) for x in [1, 1, 2]], [2, 2, 4])
+        self.assertEqual([get_memoized(double)(x) for x in [1, 2]], [2, 4])
+        self.assertEqual(calls, [1, 2])
+        self.assertEqual(memoized.cache_info()[:2], (3, 2))
+        self.assertIs(get_memoized(memoized), memoized)
+
+        self.assertIn(double, memos)
+        double_ref = ref(double)
+        del double, memoized
+        self.assertIsNone(double_ref())
+
+        memoized = get_memoized(lambda x: x * 2)
+        self.assertEqual(memoized(2), 4)
+
+        self.assertIs(get_memoized(abs).cached, get_memoized(abs).cached)
+        self.assertIsNot(get_memoized(str.upper).cached, get_memoized(str.upper).cached)
+        self.assertEqual(get_memoized(str.upper)('a'), 'A')
+
 
 if __name__ == '__main__':
     unittest.main()
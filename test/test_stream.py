@@ -0,0 +1,89 @@
+import unittest
+from io import BytesIO, StringIO
+from json import dumps, loads
+from os import path
+from tempfile import TemporaryDirectory
+
+from phns.stream import *
+from phns.utility import traverse_mixed
+
+
+# test values
+
+apply = {
+
+    'double': lambda x: x * 2,
+    'upper': lambda x: x.upper() if isinstance(x, str) else x
+}
+
+value = {
+
+    'document': {'a': [1, 2.5, {'b': 'cé\n"'}], 'd': {'e': None, 'f': True, 'g': []}, 'h': {}, 'i': -1e100},
+    'invalid': ['', '{', '[1,]', '{"a" 1}', '{"a": 1,}', '[1 2]', '1 2', 'tru', '"ab', '{1: 2}', ']',
+        '["\\x"]', '[01]', '["a\nb"]', '["\\u12"]', '[@]']
+}
+
+
+# test classes
+
+class TestStream(unittest.TestCase):
+
+    def test_map_json(self):
+
+        text = dumps(value['document'], indent=2)
+        expected = dumps(traverse_mixed(apply['upper'], value['document']))
+        for size in (1, 5, 65536):
+            mapped = map_json(apply['upper'], StringIO(text), StringIO(), size).getvalue()
+            self.assertEqual(mapped, expected)
+            mapped = map_json(apply['upper'], BytesIO(text.encode()), StringIO(), size).getvalue()
+            self.assertEqual(mapped, expected)
+
+        mapped = map_json(apply['double'], StringIO('[1, [2]]'), StringIO(), separators=(',', ':'))
+        self.assertEqual(mapped.getvalue(), '[2,[4]]')
+        self.assertEqual(map_json(apply['double'], StringIO(' "a" '), StringIO()).getvalue(), '"aa"')
+
+        with TemporaryDirectory() as directory:
+            source, target = path.join(directory, 'source.json'), path.join(directory, 'target.json')
+            with open(source, 'w') as file:
+                file.write(text)
+            self.assertEqual(map_json(apply['upper'], source, target), target)
+            with open(target) as file:
+                self.assertEqual(loads(file.read()), loads(expected))
+
+    def test_map_json_invalid(self):
+
+        for text in value['invalid']:
+            for size in (2, 65536):
+                with self.assertRaises(ValueError, msg=(text, size)):
+                    map_json(apply['double'], StringIO(text), StringIO(), size)
+
+    def test_get_tokens(self):
+
+        tokens = list(get_tokens(StringIO('{"a\\"": [true, -1.5e3, 10]}'), 3))
+        self.assertEqual(tokens, [('{', '{'), ('string', 'a"'), (':', ':'), ('[', '['),
+            ('scalar', True), (',', ','), ('scalar', -1500.0), (',', ','), ('scalar', 10), (']', ']'), ('}', '}')])
+
+        read = []
+        class Source(StringIO):
+            def read(self, size: int = -1) -> str:
+                read.append(size)
+                return super().read(size)
+        tokens = get_tokens(Source('[' + '1, ' * 1000 + '1]'), 16)
+        self.assertEqual(next(tokens), ('[', '['))
+        self.assertEqual(read, [16])
+
+        long = 'x' * 100000
+        self.assertEqual(list(get_tokens(StringIO(dumps([long])), 16))[1], ('string', long))
+
+    def test_get_string(self):
+
+        self.assertEqual(get_string('"a\\u00e9"', 1), 'aé')
+        self.assertEqual(get_string('"ab', 1, 0, False), '')
+        with self.assertRaises(ValueError):
+            get_string('"ab', 1)
+        with self.assertRaises(ValueError):
+            get_string('"a\\x"', 1, 0, False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from itertools import count
+
+from phns.transducer import *
+from phns.functor import PFunctor, PFunctorIter, PFunctorDict, PFunctorStream
+from phns.primary import compose, pipe
+
+
+# test values
+
+apply = {
+
+    'incr_1': lambda x: x + 1,
+    'double': lambda x: x * 2,
+    'is_odd': lambda x: x % 2 == 1,
+    'add': lambda acc, x: acc + x
+}
+
+
+# test classes
+
+class TestTransducer(unittest.TestCase):
+
+    def test_mapping(self):
+
+        self.assertEqual(into([], mapping(apply['incr_1']), [1, 2, 3]), [2, 3, 4])
+        self.assertEqual(transduce(mapping(apply['double']), apply['add'], 0, [1, 2, 3]), 12)
+
+    def test_filtering(self):
+
+        self.assertEqual(into([], filtering(apply['is_odd']), range(6)), [1, 3, 5])
+        self.assertEqual(into(set(), filtering(apply['is_odd']), [1, 1, 2]), {1})
+
+    def test_taking(self):
+
+        read = []
+        source = (read.append(i) or i for i in count())
+        self.assertEqual(into([], taking(3), source), [0, 1, 2])
+        self.assertEqual(read, [0, 1, 2])
+
+        self.assertEqual(into([], taking(0), [1, 2]), [])
+        self.assertEqual(into([], taking(5), [1, 2]), [1, 2])
+
+        xf = compose(taking(2), taking(5))
+        self.assertEqual(into([], xf, count()), [0, 1])
+
+    def test_partitioning(self):
+
+        self.assertEqual(into([], partitioning(2), range(5)), [[0, 1], [2, 3], [4]])
+        self.assertEqual(into([], partitioning(2), range(4)), [[0, 1], [2, 3]])
+        self.assertEqual(into([], compose(taking(3), partitioning(2)), count()), [[0, 1], [2]])
+
+        xf = partitioning(2)
+        self.assertEqual(into([], xf, range(3)), into([], xf, range(3)))
+
+        with self.assertRaises(ValueError):
+            partitioning(0)
+
+    def test_compose_pipe(self):
+
+        composed = compose(mapping(apply['incr_1']), filtering(apply['is_odd']), mapping(apply['double']))
+        self.assertEqual(into([], composed, range(6)), [2, 6, 10])
+
+        piped = pipe(mapping(apply['double']), filtering(apply['is_odd']), mapping(apply['incr_1']))
+        self.assertEqual(into([], piped, range(6)), into([], composed, range(6)))
+
+    def test_transduce(self):
+
+        reducer = Reducer(lambda acc, x: acc + [x], lambda acc: tuple(acc))
+        self.assertEqual(transduce(mapping(apply['incr_1']), reducer, [], [1, 2]), (2, 3))
+
+        early = Reducer(lambda acc, x: Reduced(acc + x) if acc + x > 3 else acc + x)
+        self.assertEqual(transduce(mapping(apply['incr_1']), early, 0, count()), 6)
+
+    def test_into(self):
+
+        xf = mapping(apply['incr_1'])
+        self.assertEqual(into([0], xf, [1, 2]), [0, 2, 3])
+        self.assertEqual(into((0,), xf, [1, 2]), (0, 2, 3))
+        self.assertEqual(into('', mapping(str.upper), 'ab'), 'AB')
+
+        to = [0]
+        into(to, xf, [1])
+        self.assertEqual(to, [0])
+
+        pairs = into({}, mapping(lambda pair: (pair[0], pair[1] + 1)), PFunctorDict({'a': 1, 'b': 2}))
+        self.assertEqual(pairs, {'a': 2, 'b': 3})
+
+    def test_sequence(self):
+
+        items = sequence(compose(filtering(apply['is_odd']), partitioning(2)), count())
+        self.assertEqual((next(items), next(items)), ([1, 3], [5, 7]))
+        self.assertEqual(list(sequence(partitioning(2), [1, 2, 3])), [[1, 2], [3]])
+        self.assertEqual(list(sequence(taking(2), count())), [0, 1])
+
+    def test_get_items(self):
+
+        pfi = PFunctorIter([1, 2], lazy=True).map(apply['incr_1'])
+        self.assertEqual(into([], mapping(apply['double']), pfi), [4, 6])
+
+        pfs = PFunctorStream.of(iter([1, 2, 3])).map(apply['incr_1'])
+        self.assertEqual(into([], taking(2), pfs), [2, 3])
+
+        streamed = PFunctorStream.of(sequence(mapping(apply['incr_1']), count())).map(apply['double'])
+        self.assertEqual(into([], taking(2), streamed), [2, 4])
+
+        self.assertEqual(into([], mapping(apply['incr_1']), PFunctor(1)), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
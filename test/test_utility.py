@@ -1,4 +1,9 @@
 import unittest
+from unittest.mock import patch
+from asyncio import run, sleep
+from array import array
+from copy import deepcopy
+from weakref import ref
 
 from phns.utility import *
 
@@ -25,9 +30,31 @@ value = {
     'dict_nested': {
         'initial': {'a': 1, 'b': {'c': 2, 'd': 2, 'e': {'f': 3, 'g': 3, 'h': 3}}},
         'doubled': {'a': 2, 'b': {'c': 4, 'd': 4, 'e': {'f': 6, 'g': 6, 'h': 6}}}
+    },
+
+    'mixed_nested': {
+        'initial': {'a': [1, (2, {3})], 'b': {'c': frozenset([4])}, 'd': bytearray(b'ab')},
+        'doubled': {'a': [2, (4, {6})], 'b': {'c': frozenset([8])}, 'd': bytearray(b'\xc2\xc4')}
     }
 }
 
+depth = 10000
+
+
+# test helpers
+
+def get_deep_list(depth: int) -> list:
+    tree: list = [1]
+    for _ in range(depth):
+        tree = [1, tree]
+    return tree
+
+def get_deep_dict(depth: int) -> dict:
+    tree: dict = {'a': 1}
+    for _ in range(depth):
+        tree = {'a': 1, 'b': tree}
+    return tree
+
 
 # test classes
 
@@ -43,11 +70,500 @@ class TestUtility(unittest.TestCase):
         tuple_doubled = traverse_iter(apply['double'], value['tuple_nested']['initial'], tuple)
         self.assertEqual(tuple_doubled, value['tuple_nested']['doubled'])
 
+    def test_traverse_iter_deep(self):
+
+        list_doubled = traverse_iter(apply['double'], get_deep_list(depth))
+        for _ in range(depth):
+            self.assertEqual(list_doubled[0], 2)
+            list_doubled = list_doubled[1]
+        self.assertEqual(list_doubled, [2])
+
     def test_traverse_dict(self):
 
         dict_doubled = traverse_dict(apply['double'], value['dict_nested']['initial'])
         self.assertEqual(dict_doubled, value['dict_nested']['doubled'])
 
+        from collections import OrderedDict
+        ordered_doubled = traverse_dict(apply['double'], OrderedDict(b=1, a=OrderedDict(c=2)))
+        self.assertEqual(ordered_doubled, OrderedDict(b=2, a=OrderedDict(c=4)))
+        self.assertEqual(ordered_doubled['a'].__class__, OrderedDict)
+
+    def test_traverse_controls(self):
+
+        list_initial = [1, [2, [3]], [4, 5]]
+        list_pruned = traverse_iter(apply['double'], list_initial, list, lambda node: 5 in node)
+        self.assertEqual(list_pruned, [2, [4, [6]], [4, 5]])
+        self.assertIs(list_pruned[2], list_initial[2])
+        self.assertEqual(traverse_iter(apply['double'], list_initial, list, None, 2), [2, [4, [3, 3]], [8, 10]])
+        self.assertEqual(traverse_iter(str, list_initial, list, None, 0, lambda node: len(node) == 1),
+            ['1', ['2', '[3]'], ['4', '5']])
+
+        dict_initial = {'a': 1, 'b': {'c': {'d': 2}}, 'e': {}}
+        dict_pruned = traverse_dict(apply['double'], dict_initial, lambda node: 'd' in node)
+        self.assertEqual(dict_pruned, {'a': 2, 'b': {'c': {'d': 2}}, 'e': {}})
+        self.assertIs(dict_pruned['b']['c'], dict_initial['b']['c'])
+        self.assertEqual(traverse_dict(str, dict_initial, None, 1), {'a': '1', 'b': "{'c': {'d': 2}}", 'e': '{}'})
+        self.assertEqual(traverse_dict(str, dict_initial, None, 0, lambda node: 'd' in node),
+            {'a': '1', 'b': {'c': "{'d': 2}"}, 'e': {}})
+
+    def test_traverse_dict_deep(self):
+
+        dict_doubled = traverse_dict(apply['double'], get_deep_dict(depth))
+        for _ in range(depth):
+            self.assertEqual(dict_doubled['a'], 2)
+            dict_doubled = dict_doubled['b']
+        self.assertEqual(dict_doubled, {'a': 2})
+
+    def test_traverse_mixed(self):
+
+        mixed_doubled = traverse_mixed(apply['double'], value['mixed_nested']['initial'])
+        self.assertEqual(mixed_doubled, value['mixed_nested']['doubled'])
+        self.assertEqual(mixed_doubled['a'][1].__class__, tuple)
+
+        int_doubled = traverse_mixed(apply['double'], 1)
+        self.assertEqual(int_doubled, 2)
+
+    def test_traverse_incremental(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        tree = value['dict_nested']['initial']
+        dict_doubled = traverse_incremental(double, tree)
+        self.assertEqual(dict_doubled, value['dict_nested']['doubled'])
+        self.assertEqual(len(calls), 6)
+
+        self.assertIs(traverse_incremental(double, tree), dict_doubled)
+        self.assertEqual(len(calls), 6)
+
+        calls.clear()
+        tree_changed = {**tree, 'b': {**tree['b'], 'd': 5}}
+        dict_changed = traverse_incremental(double, tree_changed)
+        self.assertEqual(dict_changed, {'a': 2, 'b': {'c': 4, 'd': 10, 'e': {'f': 6, 'g': 6, 'h': 6}}})
+        self.assertEqual(calls, [5])
+        self.assertIs(dict_changed['b']['e'], dict_doubled['b']['e'])
+        self.assertIsNot(dict_changed['b'], dict_doubled['b'])
+
+        calls.clear()
+        tree_copied = {**tree_changed, 'b': {**tree_changed['b']}}
+        self.assertIs(traverse_incremental(double, tree_copied), dict_changed)
+        self.assertEqual(calls, [])
+
+        tree_replaced = {**tree_copied, 'a': {'x': 1}, 'b': 2}
+        dict_replaced = traverse_incremental(double, tree_replaced)
+        self.assertEqual(dict_replaced, {'a': {'x': 2}, 'b': 4})
+        self.assertEqual(calls, [1, 2])
+
+        tree = value['list_nested']['initial']
+        list_doubled = traverse_incremental(double, tree, list)
+        self.assertEqual(list_doubled, value['list_nested']['doubled'])
+
+        calls.clear()
+        list_changed = traverse_incremental(double, [*tree, [7]], list)
+        self.assertEqual(list_changed, [*value['list_nested']['doubled'], [14]])
+        self.assertIs(list_changed[1], list_doubled[1])
+        self.assertEqual(calls, [7])
+
+        tree = get_deep_dict(depth)
+        traverse_incremental(double, tree)
+        self.assertIs(traverse_incremental(double, {**tree, 'a': 2})['b'], traverse_incremental(double, tree)['b'])
+
+        calls.clear()
+        clear_increments(double)
+        self.assertNotIn(double, increments)
+        trees = [{'a': {'b': 1}}, {'c': {'d': 2}}]
+        values = [traverse_incremental(double, tree, dict, None, (tree, traverse_dict(double, tree))) for tree in trees]
+        self.assertEqual(values, [{'a': {'b': 2}}, {'c': {'d': 4}}])
+        self.assertNotIn(double, increments)
+
+        calls.clear()
+        version = lambda node: node.get('v')
+        tree_last = {'a': {'v': 1, 'b': 1}, 'c': {'v': 1, 'd': 1}}
+        value_last = traverse_dict(double, tree_last)
+        calls.clear()
+        dict_versioned = traverse_incremental(double, {'a': {'v': 1, 'b': 1}, 'c': {'v': 2, 'd': 1}}, dict, None,
+            (tree_last, value_last), version)
+        self.assertIs(dict_versioned['a'], value_last['a'])
+        self.assertEqual(calls, [2])
+
+        calls.clear()
+        for const in (set, frozenset):
+            tree = const({1, 2})
+            traverse_incremental(double, tree, const)
+            self.assertEqual(traverse_incremental(double, const({1, 3}), const), const({2, 6}))
+        self.assertEqual(sorted(calls), [1, 1, 1, 1, 2, 2, 3, 3])
+        tree = frozenset({1, frozenset({2})})
+        traverse_incremental(double, tree, frozenset)
+        frozenset_changed = traverse_incremental(double, frozenset({3, frozenset({2})}), frozenset)
+        self.assertEqual(frozenset_changed, frozenset({6, frozenset({4})}))
+
+    def test_clear_increments(self):
+
+        double = lambda x: x * 2
+        traverse_incremental(double, {'a': 1})
+        traverse_incremental(abs, {'a': 1})
+        clear_increments(double)
+        self.assertNotIn(double, increments)
+        self.assertIn(abs, increments)
+        clear_increments()
+        self.assertEqual(len(increments), 0)
+
+    def test_traverse_shared(self):
+
+        calls = []
+        def double(x): calls.append(x); return x * 2
+
+        mixed_doubled = traverse_shared(double, value['mixed_nested']['initial'])
+        self.assertEqual(mixed_doubled, value['mixed_nested']['doubled'])
+
+        calls.clear()
+        dag: list = [1]
+        for _ in range(50):
+            dag = [dag, (dag,), {'a': dag}]
+        dag_doubled = traverse_shared(double, dag)
+        self.assertEqual(calls, [1])
+        self.assertIs(dag_doubled[0], dag_doubled[1][0])
+        self.assertIs(dag_doubled[0], dag_doubled[2]['a'])
+
+        list_cyclic: list = [1]
+        list_cyclic.append((list_cyclic, {'a': list_cyclic}))
+        list_doubled = traverse_shared(double, list_cyclic)
+        self.assertEqual(list_doubled[0], 2)
+        self.assertIs(list_doubled[1][0], list_doubled)
+        self.assertIs(list_doubled[1][1]['a'], list_doubled)
+
+        dict_cyclic: dict = {'a': 1}
+        dict_cyclic['b'] = {'c': dict_cyclic}
+        dict_doubled = traverse_shared(double, dict_cyclic, get_traversals(dict))
+        self.assertEqual(dict_doubled['a'], 2)
+        self.assertIs(dict_doubled['b']['c'], dict_doubled)
+
+        tuple_cyclic = ([1],)
+        tuple_cyclic[0].append(tuple_cyclic)
+        with self.assertRaises(ValueError):
+            traverse_shared(double, tuple_cyclic)
+
+        tuple_doubled = traverse_shared(double, (1, (2, [3])), get_traversals(tuple))
+        self.assertEqual(tuple_doubled, (2, (4, [3, 3])))
+
+        list_doubled = traverse_shared(double, get_deep_list(depth))
+        for _ in range(depth):
+            self.assertEqual(list_doubled[0], 2)
+            list_doubled = list_doubled[1]
+        self.assertEqual(list_doubled, [2])
+
+    def test_traverse_in_place(self):
+
+        list_nested = deepcopy(value['list_nested']['initial'])
+        list_inner = list_nested[1]
+        self.assertIs(traverse_in_place(apply['double'], list_nested, list), list_nested)
+        self.assertEqual(list_nested, value['list_nested']['doubled'])
+        self.assertIs(list_nested[1], list_inner)
+
+        dict_nested = deepcopy(value['dict_nested']['initial'])
+        self.assertIs(traverse_in_place(apply['double'], dict_nested, dict), dict_nested)
+        self.assertEqual(dict_nested, value['dict_nested']['doubled'])
+
+        mixed = {'a': [1, {'b': 2}], 'c': bytearray(b'ab')}
+        traverse_in_place(apply['double'], mixed)
+        self.assertEqual(mixed, {'a': [2, {'b': 4}], 'c': bytearray(b'\xc2\xc4')})
+
+        list_shared = [1]
+        traverse_in_place(apply['double'], [list_shared, list_shared])
+        self.assertEqual(list_shared, [4])
+        traverse_in_place(apply['double'], [list_shared, {'a': list_shared}], None, True)
+        self.assertEqual(list_shared, [8])
+
+        list_cyclic: list = [1]
+        list_cyclic.append(list_cyclic)
+        traverse_in_place(apply['double'], list_cyclic, list, True)
+        self.assertEqual(list_cyclic[0], 2)
+        self.assertIs(list_cyclic[1], list_cyclic)
+
+        mixed_initial = deepcopy(value['mixed_nested']['initial'])
+        with self.assertRaises(TypeError):
+            traverse_in_place(apply['double'], mixed_initial)
+        self.assertEqual(mixed_initial, value['mixed_nested']['initial'])
+        list_initial = [1, {'a': [2]}, [3, (4,)]]
+        with self.assertRaises(TypeError):
+            traverse_in_place(apply['double'], list_initial, None, False, None, 0, lambda node: 'a' in node)
+        self.assertEqual(list_initial, [1, {'a': [2]}, [3, (4,)]])
+        with self.assertRaises(TypeError):
+            traverse_in_place(apply['double'], (1, [2]), tuple)
+        self.assertEqual(traverse_in_place(apply['double'], [1, (2, 3)], list), [2, (2, 3, 2, 3)])
+
+        list_deep = get_deep_list(depth)
+        traverse_in_place(apply['double'], list_deep, list)
+        for _ in range(depth):
+            self.assertEqual(list_deep[0], 2)
+            list_deep = list_deep[1]
+        self.assertEqual(list_deep, [2])
+
+    def test_traverse_selected(self):
+
+        tree = {'users': [{'email': 'A', 'tags': ['B']}, {'email': 'C'}], 'meta': {'email': 'D'}, 1: {'2': (3, 4)}}
+        mapped = traverse_selected(str.lower, tree, 'users.*.email')
+        self.assertEqual(mapped['users'], [{'email': 'a', 'tags': ['B']}, {'email': 'c'}])
+        self.assertIs(mapped['users'][0]['tags'], tree['users'][0]['tags'])
+        self.assertIs(mapped['meta'], tree['meta'])
+        self.assertEqual(tree['users'][0]['email'], 'A')
+
+        mapped = traverse_selected(str.lower, tree, '**.email')
+        self.assertEqual((mapped['users'][1]['email'], mapped['meta']['email']), ('c', 'd'))
+        mapped = traverse_selected(lambda x: [x], tree, ['1.2.0', 'users.1'])
+        self.assertEqual((mapped[1]['2'], mapped['users'][1]), (([3], 4), [{'email': 'C'}]))
+        self.assertIs(traverse_selected(lambda x: x, tree, '**.email'), tree)
+        self.assertIs(traverse_selected(apply['double'], tree, 'users.9.email'), tree)
+        self.assertEqual(traverse_selected(len, tree, '**'), 3)
+
+        traverse_selected(str.lower, tree, 'users.*.email', True)
+        self.assertEqual(tree['users'], [{'email': 'a', 'tags': ['B']}, {'email': 'c'}])
+        with self.assertRaises(TypeError):
+            traverse_selected(apply['double'], tree, ('meta.email', '1.2.0'), True)
+        self.assertEqual(tree['meta'], {'email': 'D'})
+        tree_nested = {'a': ({'b': 1},)}
+        traverse_selected(apply['double'], tree_nested, 'a.0.b', True)
+        self.assertEqual(tree_nested, {'a': ({'b': 2},)})
+
+        list_deep = get_deep_list(depth)
+        list_doubled = traverse_selected(apply['double'], list_deep, '**.0')
+        for _ in range(depth):
+            self.assertEqual(list_doubled[0], 2)
+            list_doubled = list_doubled[1]
+        self.assertEqual(list_doubled, [2])
+
+    def test_traverse_pooled(self):
+
+        list_doubled = traverse_pooled(traverse_iter, apply['double'], value['list_nested']['initial'], workers=2)
+        self.assertEqual(list_doubled, value['list_nested']['doubled'])
+
+        tuple_doubled = traverse_pooled(traverse_iter, apply['double'], value['tuple_nested']['initial'], tuple, workers=2)
+        self.assertEqual(tuple_doubled, value['tuple_nested']['doubled'])
+
+        dict_doubled = traverse_pooled(traverse_dict, apply['double'], value['dict_nested']['initial'], workers=2)
+        self.assertEqual(dict_doubled, value['dict_nested']['doubled'])
+
+        mixed_doubled = traverse_pooled(traverse_mixed, apply['double'], value['mixed_nested']['initial'], workers=2)
+        self.assertEqual(mixed_doubled, value['mixed_nested']['doubled'])
+
+    def test_map_pooled(self):
+
+        mapped = map_pooled(apply['double'], range(1000), 3)
+        self.assertEqual(mapped, list(range(0, 2000, 2)))
+
+        mapped = map_pooled(apply['double'], [], 3)
+        self.assertEqual(mapped, [])
+
+        mapped = map_pooled(apply['double'], [1, 2])
+        self.assertEqual(list(mapped), [2, 4])
+
+    def test_traverse_gathered(self):
+
+        async def double(x):
+            await sleep(0)
+            return x * 2
+
+        dict_doubled = run(traverse_gathered(traverse_dict, double, value['dict_nested']['initial'], limit=2))
+        self.assertEqual(dict_doubled, value['dict_nested']['doubled'])
+
+        mixed_doubled = run(traverse_gathered(traverse_mixed, apply['double'], value['mixed_nested']['initial']))
+        self.assertEqual(mixed_doubled, value['mixed_nested']['doubled'])
+
+    def test_map_gathered(self):
+
+        active, most = [0], [0]
+
+        async def double(x):
+            active[0] += 1
+            most[0] = max(most[0], active[0])
+            await sleep(0)
+            active[0] -= 1
+            return x * 2
+
+        mapped = run(map_gathered(double, range(10), 3))
+        self.assertEqual(mapped, list(range(0, 20, 2)))
+        self.assertEqual(most[0], 3)
+
+        mapped = run(map_gathered(apply['double'], []))
+        self.assertEqual(mapped, [])
+
+    def test_map_array(self):
+
+        array_doubled = map_array(apply['double'], array('i', [1, 2, 3]))
+        self.assertEqual(array_doubled, array('i', [2, 4, 6]))
+
+        array_halved = map_array(lambda x: x / 2, array('d', [1, 2]))
+        self.assertEqual(array_halved, array('d', [0.5, 1.0]))
+
+        array_abs = map_array(abs, array('b', [-1, 2]))
+        self.assertEqual(array_abs, array('b', [1, 2]))
+
+        with patch('phns.utility.numpy', None):
+            array_doubled = map_array(apply['double'], array('i', [1, 2, 3]))
+            self.assertEqual(array_doubled, array('i', [2, 4, 6]))
+
+    def test_map_array_cast(self):
+
+        for module in (numpy, None):
+            with patch('phns.utility.numpy', module):
+                with self.assertRaises(TypeError):
+                    map_array(lambda x: x / 2, array('i', [1, 2, 3]))
+                with self.assertRaises(OverflowError):
+                    map_array(lambda x: x * x, array('h', [300]))
+                with self.assertRaises(OverflowError):
+                    map_array(lambda x: x - 2, array('B', [1, 2]))
+                self.assertEqual(map_array(lambda x: x - 1, array('B', [1, 2])), array('B', [0, 1]))
+                with self.assertRaises(OverflowError):
+                    map_array(lambda x: x - 1, array('Q', [0, 1]))
+                with self.assertRaises(OverflowError):
+                    map_array(lambda x: x + 1, array('q', [2 ** 63 - 1]))
+                with self.assertRaises(OverflowError):
+                    map_array(lambda x: x * 4, array('q', [2 ** 62]))
+                self.assertEqual(map_array(lambda x: x - 1, array('Q', [2 ** 64 - 1])), array('Q', [2 ** 64 - 2]))
+                self.assertEqual(map_array(lambda x: -x, array('q', [2 ** 63 - 1])), array('q', [1 - 2 ** 63]))
+
+    @unittest.skipIf(numpy is None, 'NumPy not available')
+    def test_map_ndarray(self):
+
+        ndarray = numpy.array([[1, 2], [3, 4]], dtype='int16')
+
+        ndarray_doubled = map_ndarray(apply['double'], ndarray)
+        self.assertEqual(ndarray_doubled.tolist(), [[2, 4], [6, 8]])
+        self.assertEqual(ndarray_doubled.dtype, ndarray.dtype)
+
+        ndarray_sqrt = map_ndarray(numpy.sqrt, numpy.array([1.0, 4.0]))
+        self.assertEqual(ndarray_sqrt.tolist(), [1.0, 2.0])
+
+        ndarray_clamped = map_ndarray(lambda x: 0 if x < 3 else x, ndarray)
+        self.assertEqual(ndarray_clamped.tolist(), [[0, 0], [3, 4]])
+        self.assertEqual(ndarray_clamped.dtype, ndarray.dtype)
+
+        ndarray_asc32ed = map_ndarray(lambda x: 32, ndarray)
+        self.assertEqual(ndarray_asc32ed.tolist(), [[32, 32], [32, 32]])
+
+        ndarray_wide = map_ndarray(apply['double'], ndarray.astype('int64'))
+        self.assertEqual(ndarray_wide.tolist(), [[2, 4], [6, 8]])
+        self.assertEqual(ndarray_wide.dtype, numpy.int64)
+
+        calls = []
+        def fail(x):
+            calls.append(x)
+            raise RuntimeError(x)
+        with self.assertRaises(RuntimeError):
+            map_ndarray(fail, ndarray)
+        self.assertEqual(len(calls), 1)
+
+    def test_map_translated(self):
+
+        bytearray_incr1ed = map_translated((lambda x: x + 1,), bytearray(b'abc'))
+        self.assertEqual(bytearray_incr1ed, bytearray(b'bcd'))
+
+        bytes_doubled = map_translated((apply['double'],), bytes([0, 1, 127]))
+        self.assertEqual(bytes_doubled, bytes([0, 2, 254]))
+
+        str_upper_doubled = map_translated((str.upper, apply['double']), 'aba')
+        self.assertEqual(str_upper_doubled, 'AABBAA')
+
+        with self.assertRaises(ValueError):
+            map_translated((lambda x: x + 256,), b'a')
+        with self.assertRaises(TypeError):
+            map_translated((ord,), 'a')
+
+    def test_map_in_place(self):
+
+        list_initial = list(range(10000))
+        self.assertIs(map_in_place(apply['double'], list_initial, 64), list_initial)
+        self.assertEqual(list_initial, list(range(0, 20000, 2)))
+
+        bytearray_initial = bytearray(b'ab' * 200)
+        self.assertIs(map_in_place(lambda x: x ^ 32, bytearray_initial, 64), bytearray_initial)
+        self.assertEqual(bytearray_initial, bytearray(b'AB' * 200))
+        bytearray_initial = bytearray(b'ab')
+        map_in_place(lambda x: x + 1, bytearray_initial)
+        self.assertEqual(bytearray_initial, bytearray(b'bc'))
+
+        dict_initial = {'a': 1, 'b': 2}
+        self.assertIs(map_in_place(apply['double'], dict_initial), dict_initial)
+        self.assertEqual(dict_initial, {'a': 2, 'b': 4})
+
+        for immutable in ((1, 2), 'ab', b'ab', frozenset([1]), array('i', [1])):
+            with self.assertRaises(TypeError):
+                map_in_place(apply['double'], immutable)
+
+    def test_get_table(self):
+
+        calls = []
+        def flip(x): calls.append(x); return x ^ 32
+
+        self.assertIsNone(get_table((flip,), b'AB'))
+        table = get_table((flip,), b'AB' * 128)
+        self.assertEqual(b'AB'.translate(table), b'ab')
+        self.assertEqual(len(calls), 256)
+        self.assertIs(get_table((flip,), b'CD'), table)
+        self.assertEqual(len(calls), 256)
+
+        calls = []
+        def incr(x): calls.append(x); return x + 1
+
+        table = get_table((incr,), b'ab' * 128)
+        self.assertEqual(b'aab'.translate(table), b'bbc')
+        self.assertEqual(sorted(calls[-2:]), [97, 98])
+
+        calls = []
+        def upper(x): calls.append(x); return x.upper()
+
+        table = get_table((upper,), 'ab' * 128)
+        self.assertEqual('ab'.translate(table), 'AB')
+        self.assertEqual(len(calls), 128)
+        table = get_table((upper,), 'aλ' * 128)
+        self.assertEqual('aλ'.translate(table), 'AΛ')
+        self.assertEqual(len(calls), 129)
+
+        self.assertIsNone(get_table((ord,), 'a' * 256))
+
+    def test_map_product(self):
+
+        product = map_product(lambda x, y: (x, y), [iter([1, 2]), iter('ab')])
+        self.assertEqual(list(product), [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')])
+
+        product = map_product(lambda x, y, z: x + y + z, ['a', 'bc', iter('d')])
+        self.assertEqual(list(product), ['abd', 'acd'])
+
+        self.assertEqual(list(map_product(abs, [[-1, -2]])), [1, 2])
+        self.assertEqual(list(map_product(min, [[1], []])), [])
+
+    def test_map_each(self):
+
+        read = []
+        mapped = map_each([abs, str], (read.append(i) or i for i in [-1, -2]))
+        self.assertEqual(next(mapped), 1)
+        self.assertEqual(read, [-1])
+        self.assertEqual(list(mapped), ['-1', 2, '-2'])
+
+    def test_fuse(self):
+
+        fused = fuse([apply['double'], apply['double']], [1, 2, 3])
+        self.assertEqual(list(fused), [4, 8, 12])
+
+        fused = fuse([], [1, 2, 3])
+        self.assertEqual(list(fused), [1, 2, 3])
+
+        fused = fuse([abs, lambda x: -x] * 100000, [1, 0])
+        self.assertEqual(list(fused), [-1, 0])
+
+    def test_chunk(self):
+
+        chunked = chunk(iter([1, 2, 3, 4, 5]), 2)
+        self.assertEqual(list(chunked), [[1, 2], [3, 4], [5]])
+
+        chunked = chunk([], 2)
+        self.assertEqual(list(chunked), [])
+
+    def test_get_leaves(self):
+
+        leaves = get_leaves(traverse_dict, value['dict_nested']['initial'])
+        self.assertEqual(leaves, [1, 2, 2, 3, 3, 3])
+
     def test_get_args(self):
 
         args = get_args(apply['double'])
@@ -55,6 +571,72 @@ class TestUtility(unittest.TestCase):
 
     # tertiary functions
 
+    def test_get_dict(self):
+
+        from collections import OrderedDict, defaultdict
+
+        built = get_dict({'a': 1, 'b': 2}, [3, 4])
+        self.assertEqual(built, {'a': 3, 'b': 4})
+
+        built = get_dict(OrderedDict(b=1, a=2), iter([3, 4]))
+        self.assertEqual(built.__class__, OrderedDict)
+        self.assertEqual(list(built.items()), [('b', 3), ('a', 4)])
+
+        tree = defaultdict(list, a=1)
+        built = get_dict(tree, [2])
+        self.assertEqual(built.default_factory, list)
+        self.assertEqual((built['a'], tree['a']), (2, 1))
+
+    def test_get_controls(self):
+
+        is_leaf = lambda node: True
+        self.assertEqual(get_controls({'max_depth': 2, 'is_leaf': is_leaf}), (None, 2, is_leaf))
+        self.assertEqual(get_controls({'as_tree': True}), (None, 0, None))
+
+    def test_compile_selector(self):
+
+        states = compile_selector('users.*.email')
+        self.assertEqual([state[:3] for state in states],
+            [({'users': 1}, None, False), ({}, 2, False), ({'email': 3}, None, False), ({}, None, True)])
+        self.assertIs(compile_selector('users.*.email'), states)
+        self.assertEqual(compile_selector('a.0')[1][3], (('0', 2), (0, 2)))
+
+        states = compile_selector('**.a', 'b')
+        self.assertEqual(states[0][:3], ({'a': 1, 'b': 2}, 3, False))
+        self.assertTrue(states[1][2])
+        self.assertTrue(compile_selector('**')[0][2])
+
+    def test_get_code_args(self):
+
+        args = get_code_args(apply['double'].__code__)
+        self.assertEqual(args, ('x',))
+
+        get_code_args(apply['double'].__code__)
+        self.assertGreater(get_code_args.cache_info().hits, 0)
+
+    def test_get_pairs(self):
+
+        pairs = get_pairs({'as_tree': True})
+        self.assertEqual(dict(pairs), {'as_tree': True})
+        self.assertIs(pairs, get_pairs({'as_tree': True}))
+        self.assertIs(get_pairs({}), get_pairs({}))
+
+        pairs = get_pairs({'items': [1]})
+        self.assertEqual(dict(pairs), {'items': [1]})
+        self.assertIsNot(pairs, get_pairs({'items': [1]}))
+
+        self.assertIs(get_pairs({'memo': True})['memo'], True)
+        self.assertIs(get_pairs({'memo': 1})['memo'], 1)
+        self.assertIs(get_pairs({'max_depth': 1})['max_depth'], 1)
+        self.assertIs(get_pairs({'max_depth': True})['max_depth'], True)
+
+        handle = lambda x: x
+        handle_ref = ref(handle)
+        pairs = get_pairs({'handle': handle})
+        self.assertIsNot(pairs, get_pairs({'handle': handle}))
+        del handle, pairs
+        self.assertIsNone(handle_ref())
+
     def test_get_constructor(self):
 
         int_constructor = get_constructor(1)